@@ -1,13 +1,96 @@
 # SPDX-License-Identifier: MIT
 # SPDX-FileCopyrightText: 2021-2026 null8626
 
-from .enums import HeatIndex, Kind, Locale, Phase, UltraViolet, WindDirection
+from typing import TYPE_CHECKING
+from importlib import import_module
+
 from .constants import METRIC, IMPERIAL
-from .errors import Error, RequestError
-from .forecast import Forecast
+from .errors import CircuitOpenError, DeadlineError, Error, RequestError
 from .version import VERSION
-from .client import Client
 
+if TYPE_CHECKING:
+  from .aggregate import ForecastSet
+  from .enums import HeatIndex, Kind, Locale, Phase, UltraViolet, WindDirection
+  from .breaker import CircuitBreaker
+  from .cache import Cache, DiskCache, MemoryCache
+  from .hedging import HedgePolicy
+  from .limiter import RateLimiter
+  from .scheduler import Scheduler
+  from .location import LocationNormalizer
+  from .mirrors import Mirror, MirrorPool
+  from .spatial import SpatialIndex
+  from .forecast import CurrentForecast, Forecast
+  from .transport import (
+    HTTPTransport,
+    RecordingTransport,
+    ReplayTransport,
+    Transfer,
+    TransferStats,
+    Transport,
+  )
+  from .client import Client
+  from .sync import SyncClient
+  from .sharded import ShardedClient
+
+# Everything else is imported on first access, so that importing this package doesn't pull in aiohttp.
+_LAZY_ATTRIBUTES = {
+  'Cache': 'cache',
+  'CircuitBreaker': 'breaker',
+  'Client': 'client',
+  'CurrentForecast': 'forecast',
+  'DiskCache': 'cache',
+  'Forecast': 'forecast',
+  'ForecastSet': 'aggregate',
+  'HeatIndex': 'enums',
+  'HedgePolicy': 'hedging',
+  'HTTPTransport': 'transport',
+  'Kind': 'enums',
+  'Locale': 'enums',
+  'LocationNormalizer': 'location',
+  'MemoryCache': 'cache',
+  'Mirror': 'mirrors',
+  'MirrorPool': 'mirrors',
+  'Phase': 'enums',
+  'RateLimiter': 'limiter',
+  'RecordingTransport': 'transport',
+  'ReplayTransport': 'transport',
+  'Scheduler': 'scheduler',
+  'ShardedClient': 'sharded',
+  'SpatialIndex': 'spatial',
+  'SyncClient': 'sync',
+  'Transfer': 'transport',
+  'TransferStats': 'transport',
+  'Transport': 'transport',
+  'UltraViolet': 'enums',
+  'WindDirection': 'enums',
+}
+_LAZY_SUBMODULES = frozenset(
+  (
+    'aggregate',
+    'base',
+    'breaker',
+    'cache',
+    'cli',
+    'client',
+    'compact',
+    'diff',
+    'enums',
+    'export',
+    'fakeserver',
+    'forecast',
+    'hedging',
+    'limiter',
+    'location',
+    'mirrors',
+    'resample',
+    'scheduler',
+    'serialization',
+    'sharded',
+    'spatial',
+    'sync',
+    'transport',
+  )
+)
 
 __title__ = 'python-weather'
 __author__ = 'null8626'
@@ -20,15 +103,55 @@ __version__ = VERSION
 __all__ = (
   'METRIC',
   'IMPERIAL',
+  'Cache',
+  'CircuitBreaker',
+  'CircuitOpenError',
   'Client',
+  'CurrentForecast',
+  'DeadlineError',
+  'DiskCache',
   'Error',
   'Forecast',
+  'ForecastSet',
+  'HedgePolicy',
+  'HTTPTransport',
   'RequestError',
+  'ShardedClient',
+  'SpatialIndex',
+  'SyncClient',
+  'Transfer',
+  'TransferStats',
+  'Transport',
   'HeatIndex',
   'Kind',
   'Locale',
+  'LocationNormalizer',
+  'MemoryCache',
+  'Mirror',
+  'MirrorPool',
   'Phase',
+  'RateLimiter',
+  'RecordingTransport',
+  'ReplayTransport',
+  'Scheduler',
   'UltraViolet',
   'VERSION',
   'WindDirection',
 )
+
+
+def __getattr__(name: str) -> object:
+  if name in _LAZY_ATTRIBUTES:
+    value = getattr(import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+  elif name in _LAZY_SUBMODULES:
+    value = import_module(f'.{name}', __name__)
+  else:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+  globals()[name] = value
+
+  return value
+
+
+def __dir__() -> list[str]:
+  return sorted({*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES})
@@ -0,0 +1,6 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from .cli import main
+
+raise SystemExit(main())
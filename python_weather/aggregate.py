@@ -0,0 +1,316 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from collections import Counter
+from typing import TYPE_CHECKING
+from statistics import fmean, median
+from enum import Enum
+
+if TYPE_CHECKING:
+  from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+  from typing import Any
+
+  from .forecast import Forecast
+
+  _Key = str | tuple[str, ...] | Callable[[Forecast], Hashable] | None
+
+
+LEVELS = ('current', 'daily', 'hourly')
+"""The supported aggregation levels."""
+
+_FUNCTIONS: 'dict[str, Callable[[list], Any]]' = {
+  'min': min,
+  'max': max,
+  'sum': sum,
+  'mean': fmean,
+  'median': median,
+  'count': len,
+}
+
+
+def _percentile(values: list[float], q: float) -> float:
+  # Linear interpolation between the closest ranks.
+  position = (len(values) - 1) * q / 100
+  lower = int(position)
+  upper = min(lower + 1, len(values) - 1)
+
+  return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class ForecastSet:
+  """
+  A container of many forecasts with columnar aggregations grouped by location attributes or custom keys.
+
+  Every attribute is extracted into a column once and cached, and every grouping is computed once and cached, so that computing several aggregations over the same set only iterates over flat lists.
+
+  Example:
+
+  .. code-block:: python
+
+    forecasts = python_weather.ForecastSet(
+      await asyncio.gather(*map(client.get, locations))
+    )
+
+    forecasts.max_temperature(by='country')  # {'Japan': 31, 'France': 24, ...}
+    forecasts.percentile('chances_of_rain', 90, by=('country', 'region'))
+
+  :param forecasts: The fully parsed forecasts.
+  :type forecasts: :py:class:`~collections.abc.Iterable` [:class:`.Forecast`]
+  """
+
+  __slots__: tuple[str, ...] = ('__columns', '__forecasts', '__groups', '__rows')
+
+  __columns: 'dict[tuple[str, str], list[Any]]'
+  __forecasts: 'tuple[Forecast, ...]'
+  __groups: 'dict[tuple[_Key, str], dict[Hashable, list[int]]]'
+  __rows: 'dict[str, tuple[list[int], list[Any]]]'
+
+  def __init__(self, forecasts: 'Iterable[Forecast]'):
+    self.__forecasts = tuple(forecasts)
+    self.__columns = {}
+    self.__groups = {}
+    self.__rows = {}
+
+  def __repr__(self) -> str:
+    """The set's debug string representation."""
+    return (
+      f'<{__class__.__module__}.{__class__.__name__} forecasts={len(self.__forecasts)}>'
+    )
+
+  def __len__(self) -> int:
+    """The amount of forecasts."""
+    return len(self.__forecasts)
+
+  def __iter__(self) -> 'Iterator[Forecast]':
+    """Iterates through the forecasts."""
+    return iter(self.__forecasts)
+
+  @property
+  def forecasts(self) -> 'tuple[Forecast, ...]':
+    """The forecasts in this set."""
+    return self.__forecasts
+
+  def __level_rows(self, level: str) -> tuple[list[int], list['Any']]:
+    if (rows := self.__rows.get(level)) is not None:
+      return rows
+
+    if level == 'current':
+      owners = list(range(len(self.__forecasts)))
+      objects = list(self.__forecasts)
+    elif level == 'daily':
+      owners, objects = [], []
+
+      for i, forecast in enumerate(self.__forecasts):
+        owners.extend([i] * len(forecast.daily_forecasts))
+        objects.extend(forecast.daily_forecasts)
+    elif level == 'hourly':
+      owners, objects = [], []
+
+      for i, forecast in enumerate(self.__forecasts):
+        for daily in forecast.daily_forecasts:
+          owners.extend([i] * len(daily.hourly_forecasts))
+          objects.extend(daily.hourly_forecasts)
+    else:
+      raise ValueError(f'Expected level to be one of {LEVELS!r}.')
+
+    rows = self.__rows[level] = (owners, objects)
+
+    return rows
+
+  def column(self, field: str, level: str = 'hourly') -> list['Any']:
+    """
+    Extracts an attribute from every forecast at a level into a flat list. The list is cached, and must not be modified.
+
+    :param field: The attribute's name, e.g. ``'temperature'``.
+    :type field: :py:class:`str`
+    :param level: Either ``'current'`` (one row per :class:`.Forecast`), ``'daily'`` (one row per :class:`.DailyForecast`) or ``'hourly'`` (one row per :class:`.HourlyForecast`). Defaults to ``'hourly'``.
+    :type level: :py:class:`str`
+
+    :exception AttributeError: Any of the forecasts lacks this attribute.
+    :exception ValueError: ``level`` is invalid.
+
+    :returns: The attribute's values, in order.
+    :rtype: :py:class:`list`
+    """
+    if (column := self.__columns.get((field, level))) is not None:
+      return column
+
+    _, objects = self.__level_rows(level)
+    column = self.__columns[field, level] = [getattr(obj, field) for obj in objects]
+
+    return column
+
+  def __group_rows(self, by: '_Key', level: str) -> 'dict[Hashable, list[int]]':
+    if (groups := self.__groups.get((by, level))) is not None:
+      return groups
+
+    if by is None:
+      keys = [None] * len(self.__forecasts)
+    elif isinstance(by, str):
+      keys = [getattr(forecast, by) for forecast in self.__forecasts]
+    elif isinstance(by, tuple):
+      keys = [
+        tuple(getattr(forecast, name) for name in by) for forecast in self.__forecasts
+      ]
+    else:
+      keys = [by(forecast) for forecast in self.__forecasts]
+
+    owners, _ = self.__level_rows(level)
+    groups = {}
+
+    for row, owner in enumerate(owners):
+      groups.setdefault(keys[owner], []).append(row)
+
+    self.__groups[by, level] = groups
+
+    return groups
+
+  def aggregate(
+    self,
+    field: str,
+    function: 'str | Callable[[list[Any]], Any]',
+    *,
+    by: '_Key' = 'country',
+    level: str = 'hourly',
+  ) -> 'dict[Hashable, Any]':
+    """
+    Aggregates an attribute per group.
+
+    Example:
+
+    .. code-block:: python
+
+      forecasts.aggregate('wind_speed', 'mean', by='region')
+
+    :param field: The attribute's name.
+    :type field: :py:class:`str`
+    :param function: Either ``'min'``, ``'max'``, ``'sum'``, ``'mean'``, ``'median'``, ``'count'``, or a callable receiving each group's values as a list.
+    :type function: :py:class:`str` | :py:class:`~collections.abc.Callable`
+    :param by: The grouping key. This can be a :class:`.Forecast` attribute name such as ``'country'`` or ``'region'``, a tuple of attribute names, a callable receiving each :class:`.Forecast`, or :py:obj:`None` to aggregate everything into one group. Defaults to ``'country'``.
+    :type by: :py:class:`str` | :py:class:`tuple` [:py:class:`str`, ...] | :py:class:`~collections.abc.Callable` | :py:obj:`None`
+    :param level: Either ``'current'``, ``'daily'`` or ``'hourly'``. Defaults to ``'hourly'``.
+    :type level: :py:class:`str`
+
+    :exception AttributeError: Any of the forecasts lacks this attribute.
+    :exception ValueError: ``function`` or ``level`` is invalid.
+
+    :returns: The aggregated value of each group that has at least one row.
+    :rtype: :py:class:`dict`
+    """
+    if isinstance(function, str):
+      try:
+        function = _FUNCTIONS[function]
+      except KeyError:
+        raise ValueError(
+          f'Expected function to be one of {tuple(_FUNCTIONS)!r} or a callable.'
+        ) from None
+
+    column = self.column(field, level)
+
+    return {
+      key: function([column[row] for row in rows])
+      for key, rows in self.__group_rows(by, level).items()
+    }
+
+  def max_temperature(self, *, by: '_Key' = 'country') -> 'dict[Hashable, int]':
+    """
+    Computes the highest forecasted temperature per group.
+
+    :param by: The grouping key. See :meth:`aggregate` for more information. Defaults to ``'country'``.
+    :type by: :py:class:`str` | :py:class:`tuple` [:py:class:`str`, ...] | :py:class:`~collections.abc.Callable` | :py:obj:`None`
+
+    :returns: The highest :attr:`.DailyForecast.highest_temperature` of each group.
+    :rtype: :py:class:`dict`
+    """
+    return self.aggregate('highest_temperature', max, by=by, level='daily')
+
+  def total_precipitation(self, *, by: '_Key' = 'country') -> 'dict[Hashable, float]':
+    """
+    Computes the total forecasted precipitation per group.
+
+    :param by: The grouping key. See :meth:`aggregate` for more information. Defaults to ``'country'``.
+    :type by: :py:class:`str` | :py:class:`tuple` [:py:class:`str`, ...] | :py:class:`~collections.abc.Callable` | :py:obj:`None`
+
+    :returns: The sum of every :attr:`.HourlyForecast.precipitation` of each group.
+    :rtype: :py:class:`dict`
+    """
+    return self.aggregate('precipitation', sum, by=by, level='hourly')
+
+  def percentile(
+    self,
+    field: str,
+    q: 'float | Sequence[float]',
+    *,
+    by: '_Key' = 'country',
+    level: str = 'hourly',
+  ) -> 'dict[Hashable, float | list[float]]':
+    """
+    Computes percentiles of a numeric attribute per group, interpolating linearly between the closest ranks.
+
+    Example:
+
+    .. code-block:: python
+
+      forecasts.percentile('chances_of_rain', (50, 90, 99))
+
+    :param field: The attribute's name, e.g. ``'chances_of_rain'``.
+    :type field: :py:class:`str`
+    :param q: The percentile or percentiles to compute, between ``0`` and ``100``. Each group is only sorted once.
+    :type q: :py:class:`float` | :py:class:`~collections.abc.Sequence` [:py:class:`float`]
+    :param by: The grouping key. See :meth:`aggregate` for more information. Defaults to ``'country'``.
+    :type by: :py:class:`str` | :py:class:`tuple` [:py:class:`str`, ...] | :py:class:`~collections.abc.Callable` | :py:obj:`None`
+    :param level: Either ``'current'``, ``'daily'`` or ``'hourly'``. Defaults to ``'hourly'``.
+    :type level: :py:class:`str`
+
+    :exception AttributeError: Any of the forecasts lacks this attribute.
+    :exception ValueError: Any percentile or ``level`` is invalid.
+
+    :returns: The percentile of each group, or a list of percentiles if ``q`` is a sequence.
+    :rtype: :py:class:`dict`
+    """
+    percentiles = (q,) if isinstance(q, (int, float)) else tuple(q)
+
+    if not all(0 <= percentile <= 100 for percentile in percentiles):
+      raise ValueError('Percentiles must be between 0 and 100.')
+
+    def compute(values: list) -> 'float | list[float]':
+      values.sort()
+      results = [_percentile(values, percentile) for percentile in percentiles]
+
+      return results[0] if isinstance(q, (int, float)) else results
+
+    return self.aggregate(field, compute, by=by, level=level)
+
+  def count(
+    self, field: str, *, by: '_Key' = 'country', level: str = 'hourly'
+  ) -> 'dict[Hashable, Counter]':
+    """
+    Counts the occurrences of each value of an attribute per group, such as each :class:`.Kind` or :class:`.UltraViolet` band.
+
+    Example:
+
+    .. code-block:: python
+
+      forecasts.count('kind', level='current')  # {'Japan': Counter({'SUNNY': 12, ...}), ...}
+
+    :param field: The attribute's name.
+    :type field: :py:class:`str`
+    :param by: The grouping key. See :meth:`aggregate` for more information. Defaults to ``'country'``.
+    :type by: :py:class:`str` | :py:class:`tuple` [:py:class:`str`, ...] | :py:class:`~collections.abc.Callable` | :py:obj:`None`
+    :param level: Either ``'current'``, ``'daily'`` or ``'hourly'``. Defaults to ``'hourly'``.
+    :type level: :py:class:`str`
+
+    :exception AttributeError: Any of the forecasts lacks this attribute.
+    :exception ValueError: ``level`` is invalid.
+
+    :returns: The counts of each group. Enums are counted by their name, so that indexed enums such as :class:`.UltraViolet` are counted per band.
+    :rtype: :py:class:`dict` [Any, :py:class:`~collections.Counter`]
+    """
+    return self.aggregate(
+      field,
+      lambda values: Counter(
+        value.name if isinstance(value, Enum) else value for value in values
+      ),
+      by=by,
+      level=level,
+    )
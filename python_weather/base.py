@@ -1,13 +1,52 @@
 # SPDX-License-Identifier: MIT
 # SPDX-FileCopyrightText: 2021-2026 null8626
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
+from functools import lru_cache
 
+from .serialization import from_dict, to_dict, to_json_bytes
 from .enums import WindDirection, Kind, Locale, UltraViolet
 
 if TYPE_CHECKING:
+  from collections.abc import Iterable
+  from typing import TypeAlias, TypeVar
+
   from .constants import _Unit
 
+  _Projection: TypeAlias = dict[str, '_Projection | None']
+  B = TypeVar('B', bound='BaseForecast')
+
+
+@lru_cache(maxsize=64)
+def _compile_fields(cls: type, fields: tuple[str, ...]) -> '_Projection':
+  projection = {}
+
+  for field in fields:
+    if not isinstance(field, str):
+      raise TypeError('The specified fields must be strings.')
+
+    node: _Projection = projection
+    node_cls = cls
+    parts = field.replace('[*]', '').split('.')
+
+    for i, part in enumerate(parts):
+      if part not in node_cls._fields:
+        raise ValueError(f'Unknown forecast field: {field!r}.')
+
+      nested = node_cls._nested.get(part)
+
+      if i == len(parts) - 1:
+        node[part] = None
+      elif nested is None:
+        raise ValueError(f'Unknown forecast field: {field!r}.')
+      elif (child := node.setdefault(part, {})) is None:
+        break
+      else:
+        node = child
+        node_cls = nested
+
+  return projection
+
 
 class BaseForecast:
   """A base weather forecast."""
@@ -27,6 +66,9 @@ class BaseForecast:
     'description',
   )
 
+  _fields: ClassVar['_Projection'] = dict.fromkeys(__slots__)
+  _nested: ClassVar[dict[str, type]] = {}
+
   cloud_cover: int
   """The cloud cover value in percent."""
 
@@ -63,24 +105,117 @@ class BaseForecast:
   description: str
   """The description regarding the forecast depending on the localization used."""
 
-  def __init__(self, json: dict, unit: '_Unit', locale: Locale):
-    description = (
-      json['weatherDesc'][0]['value']
-      if locale is Locale.ENGLISH
-      else json[f'lang_{locale.value}'][0]['value']
-    )
-
-    self.cloud_cover = int(json['cloudcover'])
-    self.ultraviolet = UltraViolet._new(int(json['uvIndex']))
-    self.humidity = int(json['humidity'])
-    self.wind_direction = WindDirection._new(
-      json['winddir16Point'], int(json['winddirDegree'])
-    )
-    self.kind = Kind(int(json['weatherCode']))
-    self.feels_like = int(json[f'FeelsLike{unit.temperature}'])
-    self.temperature = int(json[f'temp_{unit.temperature}'])
-    self.precipitation = float(json[f'precip{unit.precipitation}'])
-    self.pressure = float(json[f'pressure{unit.pressure}'])
-    self.visibility = int(json[f'visibility{unit.visibility}'])
-    self.wind_speed = int(json[f'windspeed{unit.velocity}'])
-    self.description = description.strip()
+  @classmethod
+  def _project(cls, fields: 'Iterable[str] | _Projection | None') -> '_Projection':
+    if fields is None:
+      return cls._fields
+    elif isinstance(fields, dict):
+      return fields
+
+    return _compile_fields(cls, (fields,) if isinstance(fields, str) else tuple(fields))
+
+  def __init__(
+    self,
+    json: dict,
+    unit: '_Unit',
+    locale: Locale,
+    fields: '_Projection | None' = None,
+  ):
+    if fields is None:
+      fields = __class__._fields
+
+    if 'cloud_cover' in fields:
+      self.cloud_cover = int(json['cloudcover'])
+
+    if 'ultraviolet' in fields:
+      self.ultraviolet = UltraViolet._new(int(json['uvIndex']))
+
+    if 'humidity' in fields:
+      self.humidity = int(json['humidity'])
+
+    if 'wind_direction' in fields:
+      self.wind_direction = WindDirection._new(
+        json['winddir16Point'], int(json['winddirDegree'])
+      )
+
+    if 'kind' in fields:
+      self.kind = Kind(int(json['weatherCode']))
+
+    if 'feels_like' in fields:
+      self.feels_like = int(json[f'FeelsLike{unit.temperature}'])
+
+    if 'temperature' in fields:
+      self.temperature = int(json[f'temp_{unit.temperature}'])
+
+    if 'precipitation' in fields:
+      self.precipitation = float(json[f'precip{unit.precipitation}'])
+
+    if 'pressure' in fields:
+      self.pressure = float(json[f'pressure{unit.pressure}'])
+
+    if 'visibility' in fields:
+      self.visibility = int(json[f'visibility{unit.visibility}'])
+
+    if 'wind_speed' in fields:
+      self.wind_speed = int(json[f'windspeed{unit.velocity}'])
+
+    if 'description' in fields:
+      description = (
+        json['weatherDesc'][0]['value']
+        if locale is Locale.ENGLISH
+        else json[f'lang_{locale.value}'][0]['value']
+      )
+
+      self.description = description.strip()
+
+  def to_dict(self) -> dict:
+    """
+    Converts this forecast into a dictionary of JSON-ready primitives, including any nested forecasts.
+
+    Example:
+
+    .. code-block:: python
+
+      data = weather.to_dict()
+
+    :returns: The converted forecast. See :func:`.serialization.to_dict` for the conversion rules.
+    :rtype: :py:class:`dict`
+    """
+    return to_dict(self)
+
+  def to_json_bytes(self) -> bytes:
+    """
+    Serializes this forecast into UTF-8 encoded JSON, using :mod:`orjson` if it's installed.
+
+    Example:
+
+    .. code-block:: python
+
+      body = weather.to_json_bytes()
+
+    :returns: The serialized forecast.
+    :rtype: :py:class:`bytes`
+    """
+    return to_json_bytes(self)
+
+  @classmethod
+  def from_dict(cls: type['B'], data: dict) -> 'B':
+    """
+    Rebuilds a forecast from :meth:`to_dict`'s output, e.g. one read back from a cache or a message queue.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = python_weather.Forecast.from_dict(data)
+
+    :param data: The converted forecast.
+    :type data: :py:class:`dict`
+
+    :exception KeyError: ``data`` contains an invalid enum name.
+    :exception ValueError: ``data`` contains an invalid date or time.
+
+    :returns: The rebuilt forecast.
+    :rtype: :class:`.BaseForecast`
+    """
+    return from_dict(cls, data)
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+import time
+
+from .errors import RequestError
+
+CLOSED = 'closed'
+"""Requests are sent normally."""
+
+OPEN = 'open'
+"""Requests fail fast until the cooldown elapses."""
+
+HALF_OPEN = 'half-open'
+"""A single trial request is allowed through to probe whether the host recovered."""
+
+
+class _Circuit:
+  __slots__: tuple[str, ...] = ('failures', 'opened_at', 'probing_since')
+
+  failures: int
+  opened_at: float | None
+  probing_since: float | None
+
+  def __init__(self):
+    self.failures = 0
+    self.opened_at = None
+    self.probing_since = None
+
+
+class CircuitBreaker:
+  """
+  Tracks the health of each upstream host, such as ``wttr.in``, a ``{locale}.wttr.in`` subdomain or a mirror, so that a :class:`.Client` stops hammering one that is down.
+
+  A host's circuit opens after ``threshold`` consecutive failures. While open, requests to it fail fast with a :class:`.CircuitOpenError` instead of being retried, and the client serves stale cached responses if it can. Once ``cooldown`` seconds have passed, the circuit becomes half-open and a single trial request is let through: it closes the circuit if it succeeds, and reopens it otherwise.
+
+  Only connection failures, timeouts, ``429`` and ``5xx`` responses count as failures. Other statuses such as ``404`` mean that the host is up.
+
+  Example:
+
+  .. code-block:: python
+
+    client = python_weather.Client(
+      cache=python_weather.MemoryCache(),
+      circuit_breaker=python_weather.CircuitBreaker(threshold=3, cooldown=10.0),
+    )
+
+  :param threshold: The amount of consecutive failures which opens a circuit. Defaults to ``5``.
+  :type threshold: :py:class:`int`
+  :param cooldown: The amount of seconds a circuit stays open before probing the host again. Defaults to ``30``.
+  :type cooldown: :py:class:`float`
+
+  :exception ValueError: ``threshold`` or ``cooldown`` is not positive.
+  """
+
+  __slots__: tuple[str, ...] = ('__circuits', '__cooldown', '__threshold')
+
+  __circuits: dict[str, _Circuit]
+  __cooldown: float
+  __threshold: int
+
+  def __init__(self, *, threshold: int = 5, cooldown: float = 30.0):
+    if threshold < 1 or cooldown <= 0:
+      raise ValueError('The threshold and cooldown must be positive.')
+
+    self.__circuits = {}
+    self.__cooldown = cooldown
+    self.__threshold = threshold
+
+  def __repr__(self) -> str:
+    """The circuit breaker's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} threshold={self.__threshold} cooldown={self.__cooldown}>'
+
+  @property
+  def threshold(self) -> int:
+    """The amount of consecutive failures which opens a circuit."""
+    return self.__threshold
+
+  @property
+  def cooldown(self) -> float:
+    """The amount of seconds a circuit stays open before probing the host again."""
+    return self.__cooldown
+
+  def state(self, host: str) -> str:
+    """
+    Retrieves a host's circuit state.
+
+    :param host: The host, e.g. ``'wttr.in'``.
+    :type host: :py:class:`str`
+
+    :returns: Either :data:`CLOSED`, :data:`OPEN` or :data:`HALF_OPEN`.
+    :rtype: :py:class:`str`
+    """
+    circuit = self.__circuits.get(host)
+
+    if circuit is None or circuit.opened_at is None:
+      return CLOSED
+    elif time.monotonic() - circuit.opened_at < self.__cooldown:
+      return OPEN
+
+    return HALF_OPEN
+
+  def allow(self, host: str) -> bool:
+    """
+    Checks if a request may be sent to a host. In the half-open state, this lets a single trial request through.
+
+    :param host: The host, e.g. ``'wttr.in'``.
+    :type host: :py:class:`str`
+
+    :returns: Whether the request may be sent.
+    :rtype: :py:class:`bool`
+    """
+    state = self.state(host)
+
+    if state == CLOSED:
+      return True
+    elif state == OPEN:
+      return False
+
+    circuit = self.__circuits[host]
+    now = time.monotonic()
+
+    # A trial which never reported back (e.g. it was cancelled) is given up on after another cooldown.
+    if (
+      circuit.probing_since is not None
+      and now - circuit.probing_since < self.__cooldown
+    ):
+      return False
+
+    circuit.probing_since = now
+
+    return True
+
+  def record_success(self, host: str) -> None:
+    """
+    Closes a host's circuit after a successful request.
+
+    :param host: The host, e.g. ``'wttr.in'``.
+    :type host: :py:class:`str`
+    """
+    self.__circuits.pop(host, None)
+
+  def record_failure(self, host: str, err: RequestError | None = None) -> None:
+    """
+    Records a failed request to a host, opening its circuit if it failed too many times in a row or while half-open.
+
+    :param host: The host, e.g. ``'wttr.in'``.
+    :type host: :py:class:`str`
+    :param err: The error raised. Errors which don't indicate an unavailable host, such as a ``404``, close the circuit instead. Defaults to :py:obj:`None` (always counted).
+    :type err: :class:`.RequestError` | :py:obj:`None`
+    """
+    if (
+      err is not None
+      and err.status is not None
+      and err.status != 429
+      and err.status < 500
+    ):
+      self.record_success(host)
+      return
+
+    circuit = self.__circuits.setdefault(host, _Circuit())
+    circuit.failures += 1
+    circuit.probing_since = None
+
+    if circuit.opened_at is not None or circuit.failures >= self.__threshold:
+      circuit.opened_at = time.monotonic()
+
+  def reset(self) -> None:
+    """Closes every circuit."""
+    self.__circuits.clear()
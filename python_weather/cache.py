@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from collections import OrderedDict
+from hashlib import sha1
+import threading
+import time
+import os
+
+
+class Cache:
+  """
+  The base class for response caches, which store raw API responses on behalf of a :class:`.Client` so that repeated lookups skip the network.
+
+  Responses are keyed by their format, locale and :meth:`.LocationNormalizer.key`, which means that equivalent queries and queries resolving to the same coordinates share an entry. Subclasses must override :meth:`load`, :meth:`store` and :meth:`clear`.
+
+  :param ttl: The amount of seconds a response stays fresh for. Defaults to ``600``.
+  :type ttl: :py:class:`float`
+
+  :exception ValueError: ``ttl`` is negative.
+  """
+
+  __slots__: tuple[str, ...] = ('__ttl',)
+
+  __ttl: float
+
+  def __init__(self, *, ttl: float = 600.0):
+    if ttl < 0:
+      raise ValueError('The TTL must not be negative.')
+
+    self.__ttl = ttl
+
+  def __repr__(self) -> str:
+    """The cache's debug string representation."""
+    return f'<{self.__class__.__module__}.{self.__class__.__name__} ttl={self.__ttl}>'
+
+  @property
+  def ttl(self) -> float:
+    """The amount of seconds a response stays fresh for."""
+    return self.__ttl
+
+  def load(self, key: str) -> tuple[float, bytes] | None:
+    """
+    Loads a stored response regardless of its age.
+
+    :param key: The response's key.
+    :type key: :py:class:`str`
+
+    :returns: The :py:func:`time.time` timestamp at which the response was stored and the raw response body, or :py:obj:`None` if it's not stored.
+    :rtype: :py:class:`tuple` [:py:class:`float`, :py:class:`bytes`] | :py:obj:`None`
+    """
+    raise NotImplementedError
+
+  def store(self, key: str, stored_at: float, body: bytes) -> None:
+    """
+    Stores a response, replacing any previous one with the same key.
+
+    :param key: The response's key.
+    :type key: :py:class:`str`
+    :param stored_at: The :py:func:`time.time` timestamp at which the response was received.
+    :type stored_at: :py:class:`float`
+    :param body: The raw response body.
+    :type body: :py:class:`bytes`
+    """
+    raise NotImplementedError
+
+  def clear(self) -> None:
+    """Removes every stored response."""
+    raise NotImplementedError
+
+  def get(self, key: str, *, stale: bool = False) -> bytes | None:
+    """
+    Retrieves a fresh response.
+
+    :param key: The response's key.
+    :type key: :py:class:`str`
+    :param stale: Whether to also retrieve expired responses which are still stored, e.g. while the upstream is unavailable. Defaults to ``False``.
+    :type stale: :py:class:`bool`
+
+    :returns: The raw response body, or :py:obj:`None` if it's not stored or has expired.
+    :rtype: :py:class:`bytes` | :py:obj:`None`
+    """
+    entry = self.load(key)
+
+    if entry is not None and (stale or time.time() - entry[0] <= self.__ttl):
+      return entry[1]
+
+  def set(self, key: str, body: bytes) -> None:
+    """
+    Stores a freshly received response.
+
+    :param key: The response's key.
+    :type key: :py:class:`str`
+    :param body: The raw response body.
+    :type body: :py:class:`bytes`
+    """
+    self.store(key, time.time(), body)
+
+
+class MemoryCache(Cache):
+  """
+  An in-memory response cache that evicts the least recently used responses once full.
+
+  :param ttl: The amount of seconds a response stays fresh for. Defaults to ``600``.
+  :type ttl: :py:class:`float`
+  :param max_entries: The maximum amount of stored responses. Defaults to ``1024``.
+  :type max_entries: :py:class:`int`
+
+  :exception ValueError: ``ttl`` is negative or ``max_entries`` is not positive.
+  """
+
+  __slots__: tuple[str, ...] = ('__entries', '__max_entries')
+
+  __entries: 'OrderedDict[str, tuple[float, bytes]]'
+  __max_entries: int
+
+  def __init__(self, *, ttl: float = 600.0, max_entries: int = 1024):
+    if max_entries < 1:
+      raise ValueError('The maximum amount of entries must be positive.')
+
+    super().__init__(ttl=ttl)
+
+    self.__entries = OrderedDict()
+    self.__max_entries = max_entries
+
+  def __len__(self) -> int:
+    """The amount of stored responses."""
+    return len(self.__entries)
+
+  def load(self, key: str) -> tuple[float, bytes] | None:
+    entry = self.__entries.get(key)
+
+    if entry is not None:
+      self.__entries.move_to_end(key)
+
+    return entry
+
+  def store(self, key: str, stored_at: float, body: bytes) -> None:
+    self.__entries[key] = (stored_at, body)
+    self.__entries.move_to_end(key)
+
+    if len(self.__entries) > self.__max_entries:
+      self.__entries.popitem(last=False)
+
+  def clear(self) -> None:
+    self.__entries.clear()
+
+
+class DiskCache(Cache):
+  """
+  An on-disk response cache that persists across processes, storing one file per response.
+
+  :param directory: The cache directory. It is created if it doesn't exist yet.
+  :type directory: :py:class:`str` | :py:class:`os.PathLike`
+  :param ttl: The amount of seconds a response stays fresh for. Defaults to ``600``.
+  :type ttl: :py:class:`float`
+
+  :exception OSError: The cache directory could not be created.
+  :exception ValueError: ``ttl`` is negative.
+  """
+
+  __slots__: tuple[str, ...] = ('__directory',)
+
+  __directory: str
+
+  def __init__(self, directory: 'str | os.PathLike[str]', *, ttl: float = 600.0):
+    super().__init__(ttl=ttl)
+
+    self.__directory = os.fspath(directory)
+
+    os.makedirs(self.__directory, exist_ok=True)
+
+  @property
+  def directory(self) -> str:
+    """The cache directory."""
+    return self.__directory
+
+  def __path(self, key: str) -> str:
+    return os.path.join(self.__directory, sha1(key.encode()).hexdigest())
+
+  def load(self, key: str) -> tuple[float, bytes] | None:
+    path = self.__path(key)
+
+    try:
+      with open(path, 'rb') as f:
+        return os.fstat(f.fileno()).st_mtime, f.read()
+    except FileNotFoundError:
+      return None
+
+  def store(self, key: str, stored_at: float, body: bytes) -> None:
+    path = self.__path(key)
+    temporary_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    # Writing to a temporary file first keeps concurrent readers from seeing partial responses.
+    with open(temporary_path, 'wb') as f:
+      f.write(body)
+
+    os.utime(temporary_path, (stored_at, stored_at))
+    os.replace(temporary_path, path)
+
+  def clear(self) -> None:
+    for entry in os.scandir(self.__directory):
+      if entry.is_file():
+        os.remove(entry.path)
@@ -0,0 +1,232 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+"""
+A command-line tool for fetching forecasts in bulk.
+
+It reads one location per line from a file or the standard input, fetches them concurrently and streams the results as soon as they arrive, in completion order. Memory usage stays flat regardless of the input size.
+
+.. code-block:: console
+
+  python-weather locations.txt --concurrency 32 --cache-dir .weather > forecasts.ndjson
+  python -m python_weather --format csv --granularity daily < locations.txt > daily.csv
+
+Every NDJSON line is a :func:`~.serialization.to_dict` forecast with an additional ``query`` key, or ``{"query", "error"}`` if the location could not be fetched. CSV rows use the same columns as :mod:`python_weather.export`, prefixed with a ``query`` column, and failures are reported to the standard error instead. The exit status is ``1`` if any location could not be fetched.
+"""
+
+from argparse import ArgumentParser
+from typing import TYPE_CHECKING
+import asyncio
+import sys
+import csv
+
+from .serialization import _dumps, to_dict
+from .export import _DAILY_COLUMNS, _HOURLY_COLUMNS
+from .constants import IMPERIAL, METRIC
+from .errors import RequestError
+from .cache import DiskCache
+from .client import Client
+from .enums import Locale
+
+if TYPE_CHECKING:
+  from collections.abc import Iterable, Sequence
+  from argparse import Namespace
+  from typing import Any, TextIO
+
+  from .forecast import CurrentForecast
+
+
+class _Writer:
+  __slots__: tuple[str, ...] = ('__columns', '__csv', '__output')
+
+  __columns: 'tuple | None'
+  __csv: 'Any'
+  __output: 'TextIO'
+
+  def __init__(self, output: 'TextIO', format: str, granularity: str):
+    self.__output = output
+    self.__csv = None
+    self.__columns = None
+
+    if format == 'csv':
+      self.__columns = _HOURLY_COLUMNS if granularity == 'hourly' else _DAILY_COLUMNS
+      self.__csv = csv.writer(output)
+      self.__csv.writerow(('query', *(name for name, _, _ in self.__columns)))
+
+  def write(self, query: str, forecast: 'CurrentForecast') -> None:
+    if self.__csv is None:
+      record = to_dict(forecast)
+      record['query'] = query
+
+      self.__output.write(f'{_dumps(record).decode()}\n')
+    elif self.__columns is _HOURLY_COLUMNS:
+      self.__csv.writerows(
+        (query, *(getter(forecast, daily, hourly) for _, _, getter in self.__columns))
+        for daily in forecast.daily_forecasts
+        for hourly in daily.hourly_forecasts
+      )
+    else:
+      self.__csv.writerows(
+        (query, *(getter(forecast, daily, None) for _, _, getter in self.__columns))
+        for daily in forecast.daily_forecasts
+      )
+
+  def write_error(self, query: str, err: Exception) -> None:
+    if self.__csv is None:
+      self.__output.write(f'{_dumps({"query": query, "error": str(err)}).decode()}\n')
+    else:
+      print(f'{query}: {err}', file=sys.stderr)
+
+
+async def _run(args: 'Namespace', locations: 'Iterable[str]', writer: _Writer) -> int:
+  failures = 0
+  pending = set()
+
+  async with Client(
+    unit=IMPERIAL if args.unit == 'imperial' else METRIC,
+    locale=Locale(args.locale),
+    max_retries=args.retries,
+    base_url=args.base_url,
+    cache=None
+    if args.cache_dir is None
+    else DiskCache(args.cache_dir, ttl=args.cache_ttl),
+    rate_limit=args.rate_limit,
+  ) as client:
+    fetch = client.get_current if args.current else client.get
+
+    async def fetch_one(query: str) -> 'tuple[str, CurrentForecast | Exception]':
+      try:
+        return query, await fetch(query)
+      except (RequestError, ValueError) as err:
+        return query, err
+
+    def flush(done: set) -> int:
+      failed = 0
+
+      for task in done:
+        query, result = task.result()
+
+        if isinstance(result, Exception):
+          writer.write_error(query, result)
+          failed += 1
+        else:
+          writer.write(query, result)
+
+      return failed
+
+    for line in locations:
+      query = line.strip()
+
+      if not query:
+        continue
+
+      # Only a bounded window of requests is in flight, so that the input is read lazily.
+      if len(pending) >= args.concurrency:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        failures += flush(done)
+
+      pending.add(asyncio.create_task(fetch_one(query)))
+
+    while pending:
+      done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+      failures += flush(done)
+
+  return int(failures > 0)
+
+
+def main(argv: 'Sequence[str] | None' = None) -> int:
+  """
+  The command-line entry point.
+
+  :param argv: The command-line arguments. Defaults to :py:obj:`None` (uses :py:data:`sys.argv`).
+  :type argv: :py:class:`~collections.abc.Sequence` [:py:class:`str`] | :py:obj:`None`
+
+  :returns: The exit status.
+  :rtype: :py:class:`int`
+  """
+  parser = ArgumentParser(
+    prog='python-weather',
+    description='Fetches weather forecasts for many locations concurrently.',
+  )
+  parser.add_argument(
+    'input',
+    nargs='?',
+    default='-',
+    help='file with one location per line, defaults to the standard input',
+  )
+  parser.add_argument(
+    '-o', '--output', default='-', help='output file, defaults to the standard output'
+  )
+  parser.add_argument('-f', '--format', choices=('ndjson', 'csv'), default='ndjson')
+  parser.add_argument(
+    '--granularity',
+    choices=('hourly', 'daily'),
+    default='hourly',
+    help='CSV row granularity',
+  )
+  parser.add_argument(
+    '--current',
+    action='store_true',
+    help='only fetch the current weather conditions (NDJSON only)',
+  )
+  parser.add_argument(
+    '-c',
+    '--concurrency',
+    type=int,
+    default=16,
+    help='maximum amount of locations fetched at once',
+  )
+  parser.add_argument('-u', '--unit', choices=('metric', 'imperial'), default='metric')
+  parser.add_argument(
+    '-l',
+    '--locale',
+    choices=tuple(locale.value for locale in Locale),
+    default=Locale.ENGLISH.value,
+  )
+  parser.add_argument('--cache-dir', default=None, help='on-disk response cache')
+  parser.add_argument(
+    '--cache-ttl',
+    type=float,
+    default=600.0,
+    help='amount of seconds cached responses stay fresh for',
+  )
+  parser.add_argument(
+    '--rate-limit',
+    type=float,
+    default=None,
+    help='maximum amount of requests per second',
+  )
+  parser.add_argument(
+    '--base-url',
+    action='append',
+    default=None,
+    help='wttr.in-compatible mirror, can be repeated',
+  )
+  parser.add_argument('--retries', type=int, default=3)
+
+  args = parser.parse_args(argv)
+
+  if args.concurrency < 1:
+    parser.error('--concurrency must be positive')
+  elif args.current and args.format == 'csv':
+    parser.error('--current is not supported with --format csv')
+
+  input_file = (
+    sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')  # noqa: SIM115
+  )
+  output_file = (
+    sys.stdout
+    if args.output == '-'
+    else open(args.output, 'w', encoding='utf-8', newline='')  # noqa: SIM115
+  )
+
+  try:
+    return asyncio.run(
+      _run(args, input_file, _Writer(output_file, args.format, args.granularity))
+    )
+  finally:
+    if input_file is not sys.stdin:
+      input_file.close()
+
+    if output_file is not sys.stdout:
+      output_file.close()
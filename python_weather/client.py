@@ -1,16 +1,36 @@
 # SPDX-License-Identifier: MIT
 # SPDX-FileCopyrightText: 2021-2026 null8626
 
-from aiohttp import ClientSession, ClientTimeout, ClientResponseError, TCPConnector
-from urllib.parse import quote_plus
-from asyncio import sleep
-
-from .errors import Error, RequestError
-from .constants import _Unit, METRIC
-from .forecast import Forecast
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from urllib.parse import quote_plus, urlsplit
+from typing import TYPE_CHECKING
+from asyncio import sleep, wait_for
+import asyncio
+import time
+
+from .transport import HTTPTransport, Transport
+from .location import LocationNormalizer
+from .scheduler import Scheduler, _remaining
+from .limiter import RateLimiter
+from .breaker import OPEN, CircuitBreaker
+from .hedging import HedgePolicy
+from .spatial import SpatialIndex
+from .mirrors import Mirror, MirrorPool
+from .compact import _decode, pack
+from .serialization import _loads
+from .errors import CircuitOpenError, DeadlineError, Error, RequestError
+from .cache import Cache
+from .constants import _Unit, COORDINATES_REGEX, METRIC
+from .forecast import CurrentForecast, Forecast
 from .version import VERSION
 from .enums import Locale
 
+if TYPE_CHECKING:
+  from collections.abc import Iterable, Sequence
+  from typing import TypeVar
+
+  F = TypeVar('F', bound=CurrentForecast)
+
 
 class Client:
   """
@@ -31,6 +51,8 @@ class Client:
     async with python_weather.Client(unit=python_weather.IMPERIAL) as client:
       # ...
 
+  A client is bound to the event loop it was first used in, and its methods must only be awaited from that loop's thread. Use :class:`.SyncClient` to share one across threads, or :meth:`.Forecast.parse_many` to parse raw responses in parallel. The :class:`.RateLimiter`, :class:`.Scheduler`, :class:`.CircuitBreaker`, :class:`.HedgePolicy` and :class:`.Cache` shared between clients must likewise belong to the same event loop, with the exception of :class:`.DiskCache`, which can be shared by any thread or process. The returned forecasts themselves are never mutated after being returned, so they can be read from any thread.
+
   :param unit: Whether to use the metric or imperial/customary system (:data:`~.constants.IMPERIAL`). Defaults to :data:`~.constants.METRIC`.
   :type unit: ``_Unit``
   :param locale: Whether to use a different locale/language as the description for the returned forecast. Defaults to :attr:`.Locale.ENGLISH`.
@@ -40,8 +62,29 @@ class Client:
   :param max_retries: Maximum amount of retries upon request failure before raising a :class:`.RequestError`.
                       Use ``-1`` to disable (NOT recommended). Defaults to 3 retries.
   :type max_retries: :class:`int` | :py:obj:`None`
+  :param normalizer: The :class:`.LocationNormalizer` used to fold equivalent location queries together. Defaults to :py:obj:`None` (creates a new one instead).
+  :type normalizer: :class:`.LocationNormalizer` | :py:obj:`None`
+  :param transport: The :class:`.Transport` used to perform requests, e.g. a :class:`.ReplayTransport` for offline load testing. Defaults to :py:obj:`None` (uses a new :class:`.HTTPTransport`). It is closed along with the client.
+  :type transport: :class:`.Transport` | :py:obj:`None`
+  :param base_url: The base URL of a wttr.in-compatible server to be used instead, such as a self-hosted mirror or :mod:`python_weather.fakeserver`. This can also be several base URLs or a :class:`.MirrorPool`, in which case requests are spread across them and failed requests are retried on another mirror. Defaults to :py:obj:`None` (uses ``https://wttr.in``).
+  :type base_url: :py:class:`str` | :py:class:`~collections.abc.Sequence` [:py:class:`str`] | :class:`.MirrorPool` | :py:obj:`None`
+  :param cache: The :class:`.Cache` used to store raw responses, such as a :class:`.MemoryCache` or :class:`.DiskCache`. Fresh responses are parsed from it without any request. Defaults to :py:obj:`None` (disables caching).
+  :type cache: :class:`.Cache` | :py:obj:`None`
+  :param rate_limit: The maximum amount of requests sent per second, or a :class:`.RateLimiter` which can be shared across clients. Cache hits are not limited. Defaults to :py:obj:`None` (unlimited).
+  :type rate_limit: :py:class:`float` | :class:`.RateLimiter` | :py:obj:`None`
+  :param nearby_radius: Serves ``'lat,lon'`` queries from a fresh cached forecast within this many kilometers instead of requesting a new one, which absorbs GPS jitter. Requires ``cache``. Defaults to :py:obj:`None` (only exact keys are served from the cache).
+  :type nearby_radius: :py:class:`float` | :py:obj:`None`
+  :param max_concurrency: The maximum amount of requests in flight at once, or a :class:`.Scheduler` which can be shared across clients. Requests waiting for a slot are served by their ``priority``. Cache hits are not limited. Defaults to :py:obj:`None` (unlimited).
+  :type max_concurrency: :py:class:`int` | :class:`.Scheduler` | :py:obj:`None`
+  :param circuit_breaker: The :class:`.CircuitBreaker` used to stop retrying against an unavailable host, which can be shared across clients. While a host's circuit is open, stale responses from ``cache`` are served if possible. Defaults to :py:obj:`None` (every request is retried up to ``max_retries`` times).
+  :type circuit_breaker: :class:`.CircuitBreaker` | :py:obj:`None`
+  :param hedging: Sends a second, identical request if the first one hasn't responded after a latency percentile, and takes whichever answers first. This can be the percentile or a :class:`.HedgePolicy`. The second request goes to another mirror if there are several. Defaults to :py:obj:`None` (disables hedging).
+  :type hedging: :py:class:`float` | :class:`.HedgePolicy` | :py:obj:`None`
+  :param compact_cache: Whether to store responses in ``cache`` in the compact format of :mod:`python_weather.compact`, which is smaller and quicker to decode than JSON. Either format is read regardless. Defaults to ``False``.
+  :type compact_cache: :py:class:`bool`
 
   :exception Error: ``unit`` is not :data:`~.constants.METRIC` or :data:`~.constants.IMPERIAL` or ``locale`` is not a part of the :class:`.Locale` enum.
+  :exception ValueError: ``nearby_radius`` is negative or specified without a ``cache``, ``max_concurrency`` is not positive, or ``hedging`` is out of range.
   """
 
   __slots__: tuple[str, ...] = (
@@ -50,6 +93,17 @@ class Client:
     '_max_retries',
     '_unit',
     '_locale',
+    '_normalizer',
+    '_transport',
+    '_mirrors',
+    '_cache',
+    '_limiter',
+    '_nearby_radius',
+    '_nearby',
+    '_scheduler',
+    '_breaker',
+    '_hedging',
+    '_compact_cache',
   )
 
   __own_session: bool
@@ -57,6 +111,17 @@ class Client:
   _max_retries: int
   _unit: _Unit
   _locale: Locale
+  _normalizer: LocationNormalizer
+  _transport: Transport
+  _mirrors: MirrorPool | None
+  _cache: Cache | None
+  _limiter: RateLimiter | None
+  _nearby_radius: float | None
+  _nearby: dict[str, SpatialIndex]
+  _scheduler: Scheduler | None
+  _breaker: CircuitBreaker | None
+  _hedging: HedgePolicy | None
+  _compact_cache: bool
 
   def __init__(
     self,
@@ -65,13 +130,56 @@ class Client:
     locale: Locale = Locale.ENGLISH,
     session: ClientSession | None = None,
     max_retries: int = 3,
+    normalizer: LocationNormalizer | None = None,
+    transport: Transport | None = None,
+    base_url: 'str | Sequence[str] | MirrorPool | None' = None,
+    cache: Cache | None = None,
+    rate_limit: float | RateLimiter | None = None,
+    nearby_radius: float | None = None,
+    max_concurrency: int | Scheduler | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    hedging: float | HedgePolicy | None = None,
+    compact_cache: bool = False,
   ):
+    if nearby_radius is not None:
+      if cache is None:
+        raise ValueError('Serving nearby forecasts requires a cache.')
+      elif nearby_radius < 0:
+        raise ValueError('The nearby radius must not be negative.')
+
     self.__own_session = session is None
     self.__session = session or ClientSession(
       timeout=ClientTimeout(total=5000.0),
       connector=TCPConnector(ssl=False),
     )
     self._max_retries = max_retries
+    self._normalizer = LocationNormalizer() if normalizer is None else normalizer
+    self._transport = HTTPTransport() if transport is None else transport
+    self._mirrors = (
+      base_url
+      if base_url is None or isinstance(base_url, MirrorPool)
+      else MirrorPool(base_url)
+    )
+    self._cache = cache
+    self._limiter = (
+      rate_limit
+      if rate_limit is None or isinstance(rate_limit, RateLimiter)
+      else RateLimiter(rate_limit)
+    )
+    self._nearby_radius = nearby_radius
+    self._nearby = {}
+    self._scheduler = (
+      max_concurrency
+      if max_concurrency is None or isinstance(max_concurrency, Scheduler)
+      else Scheduler(max_concurrency)
+    )
+    self._breaker = circuit_breaker
+    self._hedging = (
+      hedging
+      if hedging is None or isinstance(hedging, HedgePolicy)
+      else HedgePolicy(hedging)
+    )
+    self._compact_cache = compact_cache
     self.unit = unit
     self.locale = locale
 
@@ -98,6 +206,41 @@ class Client:
 
     self._unit = to
 
+  @property
+  def normalizer(self) -> LocationNormalizer:
+    """The location normalizer used."""
+    return self._normalizer
+
+  @property
+  def cache(self) -> Cache | None:
+    """The response cache used, if any."""
+    return self._cache
+
+  @property
+  def scheduler(self) -> Scheduler | None:
+    """The concurrency scheduler used, if any."""
+    return self._scheduler
+
+  @property
+  def circuit_breaker(self) -> CircuitBreaker | None:
+    """The circuit breaker used, if any."""
+    return self._breaker
+
+  @property
+  def hedging(self) -> HedgePolicy | None:
+    """The hedging policy used, if any."""
+    return self._hedging
+
+  @property
+  def transport(self) -> Transport:
+    """The transport used to perform requests."""
+    return self._transport
+
+  @property
+  def mirrors(self) -> MirrorPool | None:
+    """The upstream mirrors used, or :py:obj:`None` if ``https://wttr.in`` is used."""
+    return self._mirrors
+
   @property
   def locale(self) -> Locale:
     """The localization used."""
@@ -124,6 +267,10 @@ class Client:
     *,
     unit: _Unit | None = None,
     locale: Locale | None = None,
+    fields: 'Iterable[str] | None' = None,
+    priority: int = 0,
+    deadline: float | None = None,
+    hedge: bool = True,
   ) -> Forecast:
     """
     Fetches a weather forecast for a specific location.
@@ -134,62 +281,402 @@ class Client:
 
       weather = await client.get('New York')
 
-    :param location: The requested location.
+    :param location: The requested location. Equivalent queries are normalized through :attr:`normalizer` beforehand.
     :type location: :py:class:`str`
     :param unit: Overrides the unit used.
     :type unit: ``_Unit`` | :py:obj:`None`
     :param locale: Overrides the locale used.
     :type locale: :class:`.Locale` | :py:obj:`None`
-
-    :exception TypeError: The specified location is not a string.
-    :exception ValueError: The specified location is empty.
+    :param fields: Only parse these attributes of the returned forecast, e.g. ``('temperature', 'kind', 'daily_forecasts[*].highest_temperature')``. Nested attributes are separated by dots. Unrequested attributes are left unset, with the exception of ``daily_forecasts`` and ``hourly_forecasts`` which become empty lists instead. Defaults to :py:obj:`None` (parses everything).
+    :type fields: :py:class:`~collections.abc.Iterable` [:py:class:`str`] | :py:obj:`None`
+    :param priority: Requests with a higher priority are sent first when the client's ``max_concurrency`` is reached, e.g. a negative priority for background refreshes. Defaults to ``0``.
+    :type priority: :py:class:`int`
+    :param deadline: The maximum amount of seconds this call may take. The request fails fast instead of queueing, waiting for the rate limit or retrying if that can't be met. Defaults to :py:obj:`None` (no deadline).
+    :type deadline: :py:class:`float` | :py:obj:`None`
+    :param hedge: Whether to hedge this request if the client has ``hedging`` enabled, e.g. ``False`` for background traffic. Defaults to ``True``.
+    :type hedge: :py:class:`bool`
+
+    :exception TypeError: The specified location or any of the specified fields is not a string.
+    :exception ValueError: The specified location is empty or any of the specified fields is unknown.
     :exception Error: The client is already closed.
     :exception RequestError: The client received a non-favorable response from the API.
+    :exception DeadlineError: The forecast could not be fetched within ``deadline`` seconds.
+    :exception CircuitOpenError: The upstream host is unavailable and no stale forecast is cached.
 
     :returns: The requested weather forecast.
     :rtype: Forecast
     """
+    return await self.__fetch(
+      Forecast, 'j1', location, unit, locale, fields, priority, deadline, hedge
+    )
+
+  async def get_current(
+    self,
+    location: str,
+    *,
+    unit: _Unit | None = None,
+    locale: Locale | None = None,
+    fields: 'Iterable[str] | None' = None,
+    priority: int = 0,
+    deadline: float | None = None,
+    hedge: bool = True,
+  ) -> CurrentForecast:
+    """
+    Fetches only the current weather conditions for a specific location.
+
+    This requests a lighter response without any hourly forecasts, which is considerably smaller and quicker to parse than :meth:`get`.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = await client.get_current('New York')
+
+    :param location: The requested location. Equivalent queries are normalized through :attr:`normalizer` beforehand.
+    :type location: :py:class:`str`
+    :param unit: Overrides the unit used.
+    :type unit: ``_Unit`` | :py:obj:`None`
+    :param locale: Overrides the locale used.
+    :type locale: :class:`.Locale` | :py:obj:`None`
+    :param fields: Only parse these attributes of the returned forecast. See :meth:`get` for more information. Defaults to :py:obj:`None` (parses everything).
+    :type fields: :py:class:`~collections.abc.Iterable` [:py:class:`str`] | :py:obj:`None`
+    :param priority: The request's priority. See :meth:`get` for more information. Defaults to ``0``.
+    :type priority: :py:class:`int`
+    :param deadline: The maximum amount of seconds this call may take. See :meth:`get` for more information. Defaults to :py:obj:`None` (no deadline).
+    :type deadline: :py:class:`float` | :py:obj:`None`
+    :param hedge: Whether to hedge this request if the client has ``hedging`` enabled. Defaults to ``True``.
+    :type hedge: :py:class:`bool`
+
+    :exception TypeError: The specified location or any of the specified fields is not a string.
+    :exception ValueError: The specified location is empty or any of the specified fields is unknown.
+    :exception Error: The client is already closed.
+    :exception RequestError: The client received a non-favorable response from the API.
+    :exception DeadlineError: The current weather conditions could not be fetched within ``deadline`` seconds.
+    :exception CircuitOpenError: The upstream host is unavailable and no stale current weather conditions are cached.
+
+    :returns: The requested current weather conditions.
+    :rtype: CurrentForecast
+    """
+    return await self.__fetch(
+      CurrentForecast,
+      'j2',
+      location,
+      unit,
+      locale,
+      fields,
+      priority,
+      deadline,
+      hedge,
+    )
+
+  async def __fetch(
+    self,
+    cls: type['F'],
+    format: str,
+    location: str,
+    unit: _Unit | None,
+    locale: Locale | None,
+    fields: 'Iterable[str] | None',
+    priority: int,
+    deadline: float | None,
+    hedge: bool,
+  ) -> 'F':
+    if deadline is not None:
+      deadline += time.monotonic()
+
     if self.__session.closed:
       raise Error('Client session is already closed.')
     elif not isinstance(location, str):
       raise TypeError('The specified location must be a string.')
-    elif not location:
+
+    query = self._normalizer.normalize(location)
+
+    if not query:
       raise ValueError('The specified location must not be empty.')
 
+    if fields is not None:
+      fields = cls._project(fields)
+
     if not isinstance(unit, _Unit):
       unit = self._unit
 
     if not isinstance(locale, Locale):
       locale = self._locale
 
-    subdomain = f'{locale.value}.' if locale != Locale.ENGLISH else ''
-    attempts = 0
+    key_prefix = f'{format}:{locale.value}:'
+    body = (
+      None
+      if self._cache is None
+      else self._cache.get(key_prefix + self._normalizer.key(query))
+    )
+    requested = (
+      None if self._nearby_radius is None else COORDINATES_REGEX.match(location.strip())
+    )
+
+    if body is None and requested is not None:
+      body = self.__get_nearby(key_prefix, float(requested[1]), float(requested[2]))
+
+    data = None if body is None else __class__.__decode_cached(body)
+    cached = data is not None
+
+    if not cached:
+      try:
+        body = await self.__schedule(format, query, locale, priority, deadline, hedge)
+        data = _loads(body)
+      except CircuitOpenError:
+        # Stale data beats no data while the upstream is unavailable.
+        stale = (
+          None
+          if self._cache is None
+          else self._cache.get(key_prefix + self._normalizer.key(query), stale=True)
+        )
+
+        if stale is None or (data := __class__.__decode_cached(stale)) is None:
+          raise
+
+        cached = True
+
+    # Packed before parsing, since parsing consumes parts of the response.
+    if self._cache is not None and self._compact_cache and not cached:
+      body = pack(data, lang=None if locale == Locale.ENGLISH else locale.value)
+
+    forecast = cls(data, unit, locale, fields)
+
+    if (coordinates := getattr(forecast, 'coordinates', None)) is not None:
+      self._normalizer.learn(query, coordinates)
+
+    # Stored under the learned coordinates so that other queries for the same place hit it too.
+    if self._cache is not None and not cached:
+      key = key_prefix + self._normalizer.key(query)
+      self._cache.set(key, body)
+
+      if self._nearby_radius is not None:
+        index = self._nearby.setdefault(key_prefix, SpatialIndex())
+
+        if coordinates is not None:
+          index.add(*coordinates, key)
+
+        if requested is not None:
+          index.add(float(requested[1]), float(requested[2]), key)
+
+    return forecast
+
+  @staticmethod
+  def __decode_cached(body: bytes) -> dict | None:
+    try:
+      return _decode(body)
+    except ValueError:
+      # Corrupted entries, or ones packed by an incompatible Python version, are fetched again.
+      return None
+
+  def __get_nearby(
+    self, key_prefix: str, latitude: float, longitude: float
+  ) -> bytes | None:
+    index = self._nearby.get(key_prefix)
+
+    if index is None:
+      return None
+
+    while (
+      match := index.nearest(latitude, longitude, self._nearby_radius)
+    ) is not None:
+      _, point_latitude, point_longitude, key = match
+
+      if (body := self._cache.get(key)) is not None:
+        return body
 
-    status = None
-    reason = None
+      # The cached response has expired or been evicted.
+      index.remove(point_latitude, point_longitude)
+
+  async def __schedule(
+    self,
+    format: str,
+    query: str,
+    locale: Locale,
+    priority: int,
+    deadline: float | None,
+    hedge: bool,
+  ) -> bytes:
+    if self._scheduler is None:
+      return await self.__request(format, query, locale, deadline, hedge)
+
+    await self._scheduler.acquire(priority=priority, deadline=deadline)
+
+    try:
+      return await self.__request(format, query, locale, deadline, hedge)
+    finally:
+      self._scheduler.release()
+
+  async def __request(
+    self,
+    format: str,
+    query: str,
+    locale: Locale,
+    deadline: float | None,
+    hedge: bool,
+  ) -> bytes:
+    path = f'{quote_plus(query)}?format={format}'
+    mirror = None
+
+    if self._mirrors is None:
+      host = f'{locale.value}.wttr.in' if locale != Locale.ENGLISH else 'wttr.in'
+      url = f'https://{host}/{path}'
+    elif locale != Locale.ENGLISH:
+      path += f'&lang={locale.value}'
+
+    failed = set()
+    attempts = 0
 
     while True:
+      if self._mirrors is not None:
+        mirror = self._mirrors.select(failed)
+        url = f'{mirror.url}/{path}'
+        host = urlsplit(mirror.url).netloc
+
+      if self._breaker is not None and not self._breaker.allow(host):
+        # Try another mirror before giving up.
+        if self._mirrors is not None and len(failed) + 1 < len(self._mirrors):
+          failed.add(mirror)
+          continue
+
+        raise CircuitOpenError(host)
+
+      if self._limiter is not None:
+        await self._limiter.acquire(deadline=deadline)
+
       try:
-        async with self.__session.get(
-          f'https://{subdomain}wttr.in/{quote_plus(location)}?format=j1',
-          headers={
-            'Content-Type': 'application/json',
-            'User-Agent': f'python_weather (https://github.com/null8626/python-weather {VERSION}) Python/',
-          },
-        ) as resp:
-          status = resp.status
-          reason = resp.reason
-
-          resp.raise_for_status()
-
-          return Forecast(await resp.json(content_type='text/plain'), unit, locale)
-      except ClientResponseError:
+        if self._hedging is None or not hedge:
+          return await self.__attempt(url, host, mirror, failed, deadline)
+
+        return await self.__hedge(path, url, host, mirror, failed, deadline)
+      except RequestError as err:
+        # Backing off is pointless once the circuit is open.
+        if (
+          self._mirrors is None
+          and self._breaker is not None
+          and self._breaker.state(host) == OPEN
+        ):
+          raise CircuitOpenError(host) from err
+
         if attempts == self._max_retries:
-          raise RequestError(status, reason) from None
+          raise
+
+        # Fail over immediately if another mirror is still healthy.
+        if self._mirrors is None or not self._mirrors.has_healthy(failed):
+          delay = 0.5 * (2**attempts)
+
+          # Retrying is pointless if the deadline would pass while backing off.
+          if deadline is not None and time.monotonic() + delay >= deadline:
+            raise DeadlineError(
+              'The request deadline would pass before the next retry.'
+            ) from err
+
+          await sleep(delay)
 
-        await sleep(0.5 * (2**attempts))
         attempts += 1
 
+  async def __attempt(
+    self,
+    url: str,
+    host: str,
+    mirror: Mirror | None,
+    failed: set[Mirror],
+    deadline: float | None,
+  ) -> bytes:
+    timeout = _remaining(deadline)
+    started_at = time.perf_counter()
+    request = self._transport.request(
+      self.__session,
+      url,
+      {
+        'Content-Type': 'application/json',
+        'User-Agent': f'python_weather (https://github.com/null8626/python-weather {VERSION}) Python/',
+      },
+    )
+
+    try:
+      if timeout is None:
+        body = await request
+      else:
+        try:
+          body = await wait_for(request, timeout)
+        except asyncio.TimeoutError:
+          raise DeadlineError('The request deadline passed while in flight.') from None
+    except RequestError as err:
+      if mirror is not None:
+        self._mirrors.record_failure(mirror)
+        failed.add(mirror)
+
+      if self._breaker is not None:
+        self._breaker.record_failure(host, err)
+
+      raise
+
+    latency = time.perf_counter() - started_at
+
+    if mirror is not None:
+      self._mirrors.record_success(mirror, latency)
+
+    if self._breaker is not None:
+      self._breaker.record_success(host)
+
+    if self._hedging is not None:
+      self._hedging.record(latency)
+
+    return body
+
+  async def __hedge(
+    self,
+    path: str,
+    url: str,
+    host: str,
+    mirror: Mirror | None,
+    failed: set[Mirror],
+    deadline: float | None,
+  ) -> bytes:
+    first = asyncio.ensure_future(self.__attempt(url, host, mirror, failed, deadline))
+    tasks = [first]
+
+    try:
+      done, _ = await asyncio.wait(tasks, timeout=self._hedging.delay)
+
+      if done:
+        return first.result()
+
+      # The hedge goes to another mirror if possible, so that it doesn't queue behind the slow one.
+      if self._mirrors is not None:
+        mirror = self._mirrors.select({*failed, mirror})
+        url = f'{mirror.url}/{path}'
+        host = urlsplit(mirror.url).netloc
+
+      if self._breaker is not None and not self._breaker.allow(host):
+        return await first
+
+      async def hedge() -> bytes:
+        if self._limiter is not None:
+          await self._limiter.acquire(deadline=deadline)
+
+        return await self.__attempt(url, host, mirror, failed, deadline)
+
+      tasks.append(asyncio.ensure_future(hedge()))
+      pending = set(tasks)
+
+      while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in done:
+          if task.exception() is None:
+            return task.result()
+
+      return first.result()
+    finally:
+      for task in tasks:
+        # The loser is cancelled, which releases its connection.
+        if not task.done():
+          task.cancel()
+        elif not task.cancelled():
+          task.exception()
+
   async def close(self) -> None:
     """
     Closes the client.
@@ -200,6 +687,8 @@ class Client:
 
       await client.close()
     """
+    await self._transport.close()
+
     if self.__own_session and not self.__session.closed:
       await self.__session.close()
 
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+"""
+A compact binary format for cached wttr.in responses.
+
+Packing a response drops every ``lang_xx`` block except the requested locale's and the unused icon URLs, converts string-typed numbers into native integers and floats, and serializes the result with :py:mod:`marshal`, which shares repeated keys and decodes considerably faster than JSON. A :class:`.Forecast` can be constructed directly from an unpacked response.
+
+.. code-block:: python
+
+  client = python_weather.Client(
+    cache=python_weather.DiskCache('.weather'), compact_cache=True
+  )
+
+Packed responses start with a header containing the :py:mod:`marshal` format version, so that entries written by an incompatible Python version are treated as corrupted instead of being misread. Like :py:mod:`pickle`, :py:mod:`marshal` must not be used with untrusted data, so caches should not be shared with untrusted parties.
+"""
+
+from typing import TYPE_CHECKING
+import marshal
+import re
+
+from .serialization import _loads
+
+if TYPE_CHECKING:
+  from typing import Any
+
+MAGIC = b'PWC'
+"""The prefix of every packed response."""
+
+_HEADER = MAGIC + bytes((marshal.version,))
+_INTEGER_REGEX = re.compile(r'-?\d+')
+_FLOAT_REGEX = re.compile(r'-?\d+\.\d+')
+
+# Keys whose numeric-looking values are parsed as text, e.g. '300' for 3 AM.
+_TEXT_KEYS = frozenset(('query', 'time', 'value'))
+_DROPPED_KEYS = frozenset(('weatherIconUrl',))
+
+
+def _compact(obj: 'Any', lang: str | None) -> 'Any':
+  if isinstance(obj, list):
+    return [_compact(item, lang) for item in obj]
+  elif not isinstance(obj, dict):
+    return obj
+
+  compacted = {}
+
+  for key, value in obj.items():
+    if key in _DROPPED_KEYS or (key.startswith('lang_') and key != f'lang_{lang}'):
+      continue
+    elif isinstance(value, str) and key not in _TEXT_KEYS:
+      if _INTEGER_REGEX.fullmatch(value):
+        value = int(value)
+      elif _FLOAT_REGEX.fullmatch(value):
+        value = float(value)
+    else:
+      value = _compact(value, lang)
+
+    compacted[key] = value
+
+  return compacted
+
+
+def pack(payload: dict, *, lang: str | None = None) -> bytes:
+  """
+  Packs a raw j1 or j2 response.
+
+  :param payload: The decoded response. It is left unmodified.
+  :type payload: :py:class:`dict`
+  :param lang: The locale code whose ``lang_xx`` block is kept, e.g. ``'fr'``. Defaults to :py:obj:`None` (drops every ``lang_xx`` block).
+  :type lang: :py:class:`str` | :py:obj:`None`
+
+  :returns: The packed response.
+  :rtype: :py:class:`bytes`
+  """
+  return _HEADER + marshal.dumps(_compact(payload, lang))
+
+
+def unpack(data: bytes) -> dict:
+  """
+  Unpacks a response packed by :func:`pack`.
+
+  :param data: The packed response.
+  :type data: :py:class:`bytes`
+
+  :exception ValueError: The data is not a packed response, or was packed by an incompatible Python version.
+
+  :returns: The decoded response, with native numbers.
+  :rtype: :py:class:`dict`
+  """
+  if not data.startswith(_HEADER):
+    raise ValueError('The data is not a compatible packed response.')
+
+  try:
+    payload = marshal.loads(memoryview(data)[len(_HEADER) :])
+  except (EOFError, TypeError, ValueError):
+    raise ValueError('The packed response is corrupted.') from None
+
+  if not isinstance(payload, dict):
+    raise ValueError('The packed response is corrupted.')
+
+  return payload
+
+
+def _decode(body: bytes) -> dict:
+  # Cached bodies can be either packed or raw JSON responses.
+  return unpack(body) if body.startswith(MAGIC) else _loads(body)
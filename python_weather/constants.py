@@ -25,6 +25,7 @@ METRIC = _Unit('C', 'Kmph', '', 'MM', '', 1)
 IMPERIAL = _Unit('F', 'Miles', 'Inches', 'Inches', 'Miles', 2.54)
 
 LATLON_REGEX = re.compile(r'^Lat (\-?[\d\.]+) and Lon (\-?[\d\.]+)$')
+COORDINATES_REGEX = re.compile(r'^([+\-]?\d+(?:\.\d+)?)\s*,\s*([+\-]?\d+(?:\.\d+)?)$')
 
 KIND_EMOJIS = (
   '☀️',
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+"""
+Incremental diffing between successive forecasts for the same location.
+
+A patch only contains what changed, and is made of JSON-ready primitives so that it can be sent as-is:
+
+.. code-block:: python
+
+  {
+    'current': {'temperature': 21, 'kind': 'SUNNY'},
+    'daily': {
+      '2026-10-19': {
+        'highest_temperature': 24,
+        'hourly': {'15:00:00': {'chances_of_rain': 40}},
+      },
+      '2026-10-16': None,
+      '2026-10-22': {...},
+    },
+  }
+
+``current`` holds changed current conditions. ``daily`` holds changed daily forecasts keyed by their ISO 8601 :attr:`.DailyForecast.date`, each with its changed hourly forecasts keyed by their ISO 8601 :attr:`.HourlyForecast.time` under ``hourly``. Removed slots are :py:obj:`None`, and new slots contain every attribute. Empty sections are omitted, meaning that identical forecasts produce ``{}``.
+
+Both forecasts should be parsed with the same ``fields``.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from collections.abc import Callable
+
+
+def _diff_fields(previous: dict, current: dict, skip: str | None = None) -> dict:
+  return {
+    name: value
+    for name, value in current.items()
+    if name != skip and (name not in previous or previous[name] != value)
+  }
+
+
+def _diff_slots(
+  previous: list[dict],
+  current: list[dict],
+  key: str,
+  diff_slot: 'Callable[[dict, dict], dict]',
+) -> dict:
+  remaining = {slot[key]: slot for slot in previous}
+  changes = {}
+
+  for slot in current:
+    if slot_changes := diff_slot(remaining.pop(slot[key], {}), slot):
+      changes[slot[key]] = slot_changes
+
+  for slot_key in remaining:
+    changes[slot_key] = None
+
+  return changes
+
+
+def _diff_daily(previous: dict, current: dict) -> dict:
+  changes = _diff_fields(previous, current, 'hourly_forecasts')
+
+  if hourly := _diff_slots(
+    previous.get('hourly_forecasts', []),
+    current.get('hourly_forecasts', []),
+    'time',
+    _diff_fields,
+  ):
+    changes['hourly'] = hourly
+
+  return changes
+
+
+def _patch_slots(
+  previous: list[dict],
+  changes: dict,
+  key: str,
+  patch_slot: 'Callable[[dict, dict], dict]',
+) -> list[dict]:
+  slots = {slot[key]: slot for slot in previous}
+
+  for slot_key, slot_changes in changes.items():
+    if slot_changes is None:
+      slots.pop(slot_key, None)
+    else:
+      slots[slot_key] = patch_slot(slots.get(slot_key, {key: slot_key}), slot_changes)
+
+  # ISO 8601 dates and times sort chronologically as strings.
+  return sorted(slots.values(), key=lambda slot: slot[key])
+
+
+def _patch_hourly(previous: dict, changes: dict) -> dict:
+  return {**previous, **changes}
+
+
+def _patch_daily(previous: dict, changes: dict) -> dict:
+  daily = {**previous, **changes}
+
+  if 'hourly' in changes:
+    del daily['hourly']
+
+    daily['hourly_forecasts'] = _patch_slots(
+      previous.get('hourly_forecasts', []), changes['hourly'], 'time', _patch_hourly
+    )
+
+  return daily
+
+
+def diff(previous: dict, current: dict) -> dict:
+  """
+  Computes the patch between two converted forecasts.
+
+  :param previous: The previous forecast, as converted by :func:`.serialization.to_dict`.
+  :type previous: :py:class:`dict`
+  :param current: The current forecast, as converted by :func:`.serialization.to_dict`.
+  :type current: :py:class:`dict`
+
+  :returns: The patch which turns ``previous`` into ``current``.
+  :rtype: :py:class:`dict`
+  """
+  patch = {}
+
+  if current_changes := _diff_fields(previous, current, 'daily_forecasts'):
+    patch['current'] = current_changes
+
+  if daily := _diff_slots(
+    previous.get('daily_forecasts', []),
+    current.get('daily_forecasts', []),
+    'date',
+    _diff_daily,
+  ):
+    patch['daily'] = daily
+
+  return patch
+
+
+def apply(previous: dict, patch: dict) -> dict:
+  """
+  Applies a patch to a converted forecast. This is useful for consumers which only deal with JSON.
+
+  :param previous: The forecast the patch was computed against, as converted by :func:`.serialization.to_dict`. It is left unmodified.
+  :type previous: :py:class:`dict`
+  :param patch: The patch computed by :func:`diff`.
+  :type patch: :py:class:`dict`
+
+  :returns: The converted current forecast.
+  :rtype: :py:class:`dict`
+  """
+  current = {**previous, **patch.get('current', {})}
+
+  if 'daily' in patch:
+    current['daily_forecasts'] = _patch_slots(
+      previous.get('daily_forecasts', []), patch['daily'], 'date', _patch_daily
+    )
+
+  return current
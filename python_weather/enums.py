@@ -1,10 +1,33 @@
 # SPDX-License-Identifier: MIT
 # SPDX-FileCopyrightText: 2021-2026 null8626
 
+from typing import TYPE_CHECKING, TypeVar
 from enum import Enum
 
 from .constants import KIND_EMOJIS, WIND_DIRECTION_EMOJIS
 
+if TYPE_CHECKING:
+  from typing import Any
+
+E = TypeVar('E', bound=Enum)
+
+_CLONES: 'dict[tuple[type, str, str, Any], Any]' = {}
+
+
+def _clone(cls: type[E], name: str, attribute: str, value: 'Any') -> E:
+  # Enum members are shared by every thread, so values which differ between forecasts are carried by immutable
+  # copies of them instead. Copies are memoized, and the dictionary's setdefault() keeps concurrent callers on the
+  # same copy even without the GIL.
+  key = (cls, name, attribute, value)
+
+  if (enum := _CLONES.get(key)) is None:
+    enum = object.__new__(cls)
+    enum.__dict__.update(cls[name].__dict__)
+    setattr(enum, attribute, value)
+    enum = _CLONES.setdefault(key, enum)
+
+  return enum
+
 
 class BasicEnum(Enum):
   """An ordinary enum."""
@@ -21,7 +44,9 @@ class BasicEnum(Enum):
 
   @property
   def _index(self) -> int:
-    return next(filter(lambda kind: self is kind[1], enumerate(self.__class__)))[0]
+    return next(
+      filter(lambda kind: self._name_ == kind[1]._name_, enumerate(self.__class__))
+    )[0]
 
 
 class IndexedEnum(Enum):
@@ -67,6 +92,12 @@ class IndexedEnum(Enum):
     """The floating point representation of the enum's index value."""
     return float(self.index)
 
+  def __reduce_ex__(self, protocol: 'Any') -> tuple:
+    if (index := getattr(self, 'index', None)) is None:
+      return self.__class__, (self._value_,)
+
+    return _clone, (self.__class__, self._name_, 'index', index)
+
 
 class HeatIndex(IndexedEnum):
   """A heat index."""
@@ -80,10 +111,7 @@ class HeatIndex(IndexedEnum):
 
   @staticmethod
   def _new(celcius_index: int, true_index: int) -> 'HeatIndex':
-    enum = HeatIndex(celcius_index)
-    enum.index = true_index
-
-    return enum
+    return _clone(HeatIndex, HeatIndex(celcius_index)._name_, 'index', true_index)
 
   @classmethod
   def _missing_(cls, value: object) -> 'HeatIndex | None':
@@ -111,10 +139,7 @@ class UltraViolet(BasicEnum, IndexedEnum):
 
   @staticmethod
   def _new(index: int) -> 'UltraViolet':
-    enum = UltraViolet(index)
-    enum.index = index
-
-    return enum
+    return _clone(UltraViolet, UltraViolet(index)._name_, 'index', index)
 
   @classmethod
   def _missing_(cls, value: object) -> 'UltraViolet | None':
@@ -158,16 +183,27 @@ class WindDirection(BasicEnum):
 
   @staticmethod
   def _new(value: str, degrees: float) -> 'WindDirection':
-    enum = WindDirection(value)
-    enum.degrees = degrees
+    return _clone(WindDirection, WindDirection(value)._name_, 'degrees', degrees)
+
+  def __eq__(self, other: object) -> bool:
+    """Checks if the other is the same wind direction, regardless of their angles."""
+    return isinstance(other, WindDirection) and self._value_ == other._value_
+
+  def __hash__(self) -> int:
+    """The wind direction's hash, regardless of its angle."""
+    return hash(self._value_)
+
+  def __reduce_ex__(self, protocol: 'Any') -> tuple:
+    if (degrees := getattr(self, 'degrees', None)) is None:
+      return self.__class__, (self._value_,)
 
-    return enum
+    return _clone, (self.__class__, self._name_, 'degrees', degrees)
 
   def __contains__(self, other: 'WindDirection | float | int') -> bool:
     """Checks if the other's angle is within the enum's wind direction."""
     members = list(self.__class__)
 
-    return self is members[int(((float(other) % 360) + 11.25) // 22.5) % len(members)]
+    return self == members[int(((float(other) % 360) + 11.25) // 22.5) % len(members)]
 
   def __int__(self) -> int:
     """The integer representation of the wind direction's angle."""
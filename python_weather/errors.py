@@ -24,6 +24,32 @@ class RequestError(Error):
   def __post_init__(self) -> None:
     super(Error, self).__init__(f'{self.status}: {self.reason}')
 
+  def __reduce__(self) -> tuple:
+    return self.__class__, (self.status, self.reason)
+
   def __repr__(self) -> str:  # pragma: nocover
     """The error's debug string representation."""
     return f'<{__class__.__module__}.{__class__.__name__} status={self.status} reason={self.reason!r}>'
+
+
+class DeadlineError(Error):
+  """Thrown when a request can't be completed before its deadline. Extends :class:`.Error`."""
+
+  __slots__: tuple[str, ...] = ()
+
+
+class CircuitOpenError(Error):
+  """Thrown when requests to a host are short-circuited after it failed repeatedly. Extends :class:`.Error`."""
+
+  __slots__: tuple[str, ...] = ('host',)
+
+  host: str
+  """The unavailable host."""
+
+  def __init__(self, host: str):
+    super().__init__(f'Requests to {host} are paused after repeated failures.')
+
+    self.host = host
+
+  def __reduce__(self) -> tuple:
+    return self.__class__, (self.host,)
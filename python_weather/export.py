@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from functools import lru_cache
+
+if TYPE_CHECKING:
+  from collections.abc import Callable, Iterable
+  from typing import Any
+
+  from pyarrow import RecordBatch, Schema
+
+  from .forecast import DailyForecast, Forecast, HourlyForecast
+
+  _Column = tuple[str, str, Callable[[Forecast, DailyForecast, HourlyForecast], Any]]
+
+
+# Key columns shared by both granularities.
+_KEY_COLUMNS: 'tuple[_Column, ...]' = (
+  ('location', 'string', lambda f, d, h: f.location),
+  ('region', 'string', lambda f, d, h: f.region),
+  ('country', 'string', lambda f, d, h: f.country),
+  ('latitude', 'float64', lambda f, d, h: f.coordinates[0]),
+  ('longitude', 'float64', lambda f, d, h: f.coordinates[1]),
+  ('observed_at', 'timestamp', lambda f, d, h: f.datetime),
+)
+
+_HOURLY_COLUMNS: 'tuple[_Column, ...]' = (
+  *_KEY_COLUMNS,
+  ('datetime', 'timestamp', lambda f, d, h: datetime.combine(d.date, h.time)),
+  ('temperature', 'int16', lambda f, d, h: h.temperature),
+  ('feels_like', 'int16', lambda f, d, h: h.feels_like),
+  ('dew_point', 'int16', lambda f, d, h: h.dew_point),
+  ('heat_index', 'int16', lambda f, d, h: h.heat_index.index),
+  ('wind_chill', 'int16', lambda f, d, h: h.wind_chill),
+  ('wind_speed', 'int16', lambda f, d, h: h.wind_speed),
+  ('wind_gust', 'int16', lambda f, d, h: h.wind_gust),
+  ('wind_direction', 'string', lambda f, d, h: h.wind_direction.value),
+  ('wind_degrees', 'float32', lambda f, d, h: h.wind_direction.degrees),
+  ('kind', 'string', lambda f, d, h: h.kind.name),
+  ('description', 'string', lambda f, d, h: h.description),
+  ('cloud_cover', 'int8', lambda f, d, h: h.cloud_cover),
+  ('humidity', 'int8', lambda f, d, h: h.humidity),
+  ('ultraviolet', 'int8', lambda f, d, h: h.ultraviolet.index),
+  ('precipitation', 'float32', lambda f, d, h: h.precipitation),
+  ('pressure', 'float32', lambda f, d, h: h.pressure),
+  ('visibility', 'int16', lambda f, d, h: h.visibility),
+  ('chances_of_fog', 'int8', lambda f, d, h: h.chances_of_fog),
+  ('chances_of_frost', 'int8', lambda f, d, h: h.chances_of_frost),
+  (
+    'chances_of_high_temperature',
+    'int8',
+    lambda f, d, h: h.chances_of_high_temperature,
+  ),
+  ('chances_of_overcast', 'int8', lambda f, d, h: h.chances_of_overcast),
+  ('chances_of_rain', 'int8', lambda f, d, h: h.chances_of_rain),
+  ('chances_of_remaining_dry', 'int8', lambda f, d, h: h.chances_of_remaining_dry),
+  ('chances_of_snow', 'int8', lambda f, d, h: h.chances_of_snow),
+  ('chances_of_sunshine', 'int8', lambda f, d, h: h.chances_of_sunshine),
+  ('chances_of_thunder', 'int8', lambda f, d, h: h.chances_of_thunder),
+  ('chances_of_windy', 'int8', lambda f, d, h: h.chances_of_windy),
+)
+
+_DAILY_COLUMNS: 'tuple[_Column, ...]' = (
+  *_KEY_COLUMNS,
+  ('date', 'date', lambda f, d, h: d.date),
+  ('temperature', 'int16', lambda f, d, h: d.temperature),
+  ('lowest_temperature', 'int16', lambda f, d, h: d.lowest_temperature),
+  ('highest_temperature', 'int16', lambda f, d, h: d.highest_temperature),
+  ('snowfall', 'float32', lambda f, d, h: d.snowfall),
+  ('sunlight', 'float32', lambda f, d, h: d.sunlight),
+  ('sunrise', 'time', lambda f, d, h: d.sunrise),
+  ('sunset', 'time', lambda f, d, h: d.sunset),
+  ('moonrise', 'time', lambda f, d, h: d.moonrise),
+  ('moonset', 'time', lambda f, d, h: d.moonset),
+  ('moon_phase', 'string', lambda f, d, h: d.moon_phase.name),
+  ('moon_illumination', 'int8', lambda f, d, h: d.moon_illumination),
+)
+
+GRANULARITIES = ('hourly', 'daily')
+
+
+def _import_pyarrow() -> 'Any':
+  try:
+    import pyarrow
+  except ImportError as err:  # pragma: nocover
+    raise ImportError(
+      'Exporting forecasts requires pyarrow. Install it with `pip install python-weather[arrow]`.'
+    ) from err
+
+  return pyarrow
+
+
+def _columns(granularity: str) -> 'tuple[_Column, ...]':
+  if granularity == 'hourly':
+    return _HOURLY_COLUMNS
+  elif granularity == 'daily':
+    return _DAILY_COLUMNS
+
+  raise ValueError(f'Expected granularity to be one of {GRANULARITIES!r}.')
+
+
+@lru_cache(maxsize=len(GRANULARITIES))
+def schema(granularity: str = 'hourly') -> 'Schema':
+  """
+  Returns the Arrow schema of exported forecast records.
+
+  :param granularity: Either ``'hourly'`` (one row per :class:`.HourlyForecast`) or ``'daily'`` (one row per :class:`.DailyForecast`). Defaults to ``'hourly'``.
+  :type granularity: :py:class:`str`
+
+  :exception ImportError: pyarrow is not installed.
+  :exception ValueError: ``granularity`` is invalid.
+
+  :returns: The Arrow schema.
+  :rtype: :class:`pyarrow.Schema`
+  """
+  columns = _columns(granularity)
+  pa = _import_pyarrow()
+  types = {
+    'string': pa.string(),
+    'float64': pa.float64(),
+    'float32': pa.float32(),
+    'int16': pa.int16(),
+    'int8': pa.int8(),
+    'timestamp': pa.timestamp('s'),
+    'date': pa.date32(),
+    'time': pa.time32('s'),
+  }
+
+  return pa.schema([pa.field(name, types[kind]) for name, kind, _ in columns])
+
+
+def to_record_batch(
+  forecasts: 'Iterable[Forecast]', granularity: str = 'hourly'
+) -> 'RecordBatch':
+  """
+  Converts forecasts into a single Arrow record batch, building each column directly from the forecast objects.
+
+  Example:
+
+  .. code-block:: python
+
+    from python_weather.export import to_record_batch
+
+    batch = to_record_batch(forecasts, 'hourly')
+
+  :param forecasts: The fully parsed forecasts to be exported.
+  :type forecasts: :py:class:`~collections.abc.Iterable` [:class:`.Forecast`]
+  :param granularity: Either ``'hourly'`` (one row per :class:`.HourlyForecast`) or ``'daily'`` (one row per :class:`.DailyForecast`). Defaults to ``'hourly'``.
+  :type granularity: :py:class:`str`
+
+  :exception ImportError: pyarrow is not installed.
+  :exception ValueError: ``granularity`` is invalid.
+
+  :returns: The Arrow record batch.
+  :rtype: :class:`pyarrow.RecordBatch`
+  """
+  columns = _columns(granularity)
+  arrow_schema = schema(granularity)
+  pa = _import_pyarrow()
+
+  if granularity == 'hourly':
+    rows = [
+      (forecast, daily, hourly)
+      for forecast in forecasts
+      for daily in forecast.daily_forecasts
+      for hourly in daily.hourly_forecasts
+    ]
+  else:
+    rows = [
+      (forecast, daily, None)
+      for forecast in forecasts
+      for daily in forecast.daily_forecasts
+    ]
+
+  return pa.RecordBatch.from_arrays(
+    [
+      pa.array([getter(*row) for row in rows], type=field.type)
+      for (_, _, getter), field in zip(columns, arrow_schema)
+    ],
+    schema=arrow_schema,
+  )
+
+
+def write_parquet(
+  forecasts: 'Iterable[Forecast]',
+  where: 'Any',
+  *,
+  granularity: str = 'hourly',
+  batch_size: int = 256,
+  **kwargs: 'Any',
+) -> int:
+  """
+  Streams forecasts into a Parquet file, converting at most ``batch_size`` forecasts at a time so that memory usage stays flat regardless of the input size.
+
+  Example:
+
+  .. code-block:: python
+
+    from python_weather.export import write_parquet
+
+    write_parquet(forecasts, 'hourly.parquet')
+
+  :param forecasts: The fully parsed forecasts to be exported. This can be a lazy iterable.
+  :type forecasts: :py:class:`~collections.abc.Iterable` [:class:`.Forecast`]
+  :param where: The file path or writable binary file object.
+  :param granularity: Either ``'hourly'`` or ``'daily'``. Defaults to ``'hourly'``.
+  :type granularity: :py:class:`str`
+  :param batch_size: The amount of forecasts converted per record batch. Defaults to ``256``.
+  :type batch_size: :py:class:`int`
+  :param kwargs: Keyword arguments passed to :class:`pyarrow.parquet.ParquetWriter`.
+
+  :exception ImportError: pyarrow is not installed.
+  :exception ValueError: ``granularity`` or ``batch_size`` is invalid.
+
+  :returns: The amount of rows written.
+  :rtype: :py:class:`int`
+  """
+  if batch_size < 1:
+    raise ValueError('The batch size must be positive.')
+
+  arrow_schema = schema(granularity)
+  rows = 0
+
+  import pyarrow.parquet as pq
+
+  with pq.ParquetWriter(where, arrow_schema, **kwargs) as writer:
+    pending = []
+
+    for forecast in forecasts:
+      pending.append(forecast)
+
+      if len(pending) == batch_size:
+        batch = to_record_batch(pending, granularity)
+        writer.write_batch(batch)
+        rows += batch.num_rows
+        pending.clear()
+
+    if pending:
+      batch = to_record_batch(pending, granularity)
+      writer.write_batch(batch)
+      rows += batch.num_rows
+
+  return rows
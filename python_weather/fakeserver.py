@@ -0,0 +1,417 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+"""
+A local wttr.in-compatible stand-in server for benchmarking and testing without network access.
+
+Run it with:
+
+.. code-block:: console
+
+  python -m python_weather.fakeserver --port 8080 --latency 0.05 --rate-5xx 0.01
+
+Then point a :class:`.Client` at it:
+
+.. code-block:: python
+
+  client = python_weather.Client(base_url='http://127.0.0.1:8080')
+"""
+
+from datetime import datetime, timedelta
+from argparse import ArgumentParser
+from typing import TYPE_CHECKING
+from asyncio import sleep
+from random import Random
+from hashlib import blake2b
+import json
+import time
+
+from aiohttp import web
+
+from .constants import COORDINATES_REGEX
+from .enums import Kind, WindDirection
+
+if TYPE_CHECKING:
+  from collections.abc import Sequence
+
+
+_KINDS = tuple(kind.value for kind in Kind)
+_DIRECTIONS = tuple(direction.value for direction in WindDirection)
+_PHASES = (
+  'New Moon',
+  'Waxing Crescent',
+  'First Quarter',
+  'Waxing Gibbous',
+  'Full Moon',
+  'Waning Gibbous',
+  'Last Quarter',
+  'Waning Crescent',
+)
+
+
+def _fahrenheit(celcius: int) -> str:
+  return str(round(celcius * 9 / 5 + 32))
+
+
+def _clock(hours: float) -> datetime:
+  return datetime(2000, 1, 1) + timedelta(hours=hours % 24)
+
+
+def _conditions(rng: Random, temperature: int, lang: str | None) -> dict:
+  kind = rng.choice(_KINDS)
+  wind_degrees = rng.randrange(360)
+  wind_speed = rng.randrange(0, 60)
+  precipitation = round(rng.uniform(0.0, 5.0) if rng.random() < 0.3 else 0.0, 1)
+  pressure = rng.randrange(980, 1040)
+  visibility = rng.randrange(2, 11)
+  description = Kind(kind).name.replace('_', ' ').capitalize()
+  output = {
+    'FeelsLikeC': str(temperature - rng.randrange(0, 4)),
+    'cloudcover': str(rng.randrange(101)),
+    'humidity': str(rng.randrange(20, 101)),
+    'precipInches': str(round(precipitation / 25.4, 1)),
+    'precipMM': str(precipitation),
+    'pressure': str(pressure),
+    'pressureInches': str(round(pressure / 33.864)),
+    'uvIndex': str(rng.randrange(0, 12)),
+    'visibility': str(visibility),
+    'visibilityMiles': str(round(visibility / 1.609)),
+    'weatherCode': str(kind),
+    'weatherDesc': [{'value': description}],
+    'weatherIconUrl': [{'value': ''}],
+    'winddir16Point': _DIRECTIONS[int((wind_degrees + 11.25) // 22.5) % 16],
+    'winddirDegree': str(wind_degrees),
+    'windspeedKmph': str(wind_speed),
+    'windspeedMiles': str(round(wind_speed / 1.609)),
+  }
+
+  output['FeelsLikeF'] = _fahrenheit(int(output['FeelsLikeC']))
+
+  if lang is not None:
+    output[f'lang_{lang}'] = [{'value': f'{description} ({lang})'}]
+
+  return output
+
+
+def _hourly(rng: Random, hour: int, temperature: int, lang: str | None) -> dict:
+  output = _conditions(rng, temperature, lang)
+  heat_index = temperature + rng.randrange(0, 3)
+  wind_chill = temperature - rng.randrange(0, 5)
+  dew_point = temperature - rng.randrange(2, 10)
+  wind_gust = int(output['windspeedKmph']) + rng.randrange(0, 20)
+
+  output.update(
+    {
+      'DewPointC': str(dew_point),
+      'DewPointF': _fahrenheit(dew_point),
+      'HeatIndexC': str(heat_index),
+      'HeatIndexF': _fahrenheit(heat_index),
+      'WindChillC': str(wind_chill),
+      'WindChillF': _fahrenheit(wind_chill),
+      'WindGustKmph': str(wind_gust),
+      'WindGustMiles': str(round(wind_gust / 1.609)),
+      'diffRad': '0.0',
+      'shortRad': '0.0',
+      'tempC': str(temperature),
+      'tempF': _fahrenheit(temperature),
+      'time': str(hour * 100),
+    }
+  )
+
+  for chance in (
+    'fog',
+    'frost',
+    'hightemp',
+    'overcast',
+    'rain',
+    'remdry',
+    'snow',
+    'sunshine',
+    'thunder',
+    'windy',
+  ):
+    output[f'chanceof{chance}'] = str(rng.randrange(101))
+
+  return output
+
+
+def generate_payload(
+  location: str,
+  *,
+  rng: Random | None = None,
+  days: int = 3,
+  hourly: bool = True,
+  lang: str | None = None,
+  now: datetime | None = None,
+) -> dict:
+  """
+  Generates a randomized j1 response for a location, structurally identical to wttr.in's.
+
+  :param location: The requested location. ``'lat,lon'`` queries are reflected back as the returned coordinates, while other locations are mapped to stable pseudo-random coordinates.
+  :type location: :py:class:`str`
+  :param rng: The random number generator used. Defaults to :py:obj:`None` (creates a new one).
+  :type rng: :py:class:`random.Random` | :py:obj:`None`
+  :param days: The amount of daily forecasts. Defaults to ``3``.
+  :type days: :py:class:`int`
+  :param hourly: Whether to include 3-hourly forecasts for each day. ``False`` mimics the j2 format. Defaults to ``True``.
+  :type hourly: :py:class:`bool`
+  :param lang: The locale code whose ``lang_xx`` descriptions are included. Defaults to :py:obj:`None` (English only).
+  :type lang: :py:class:`str` | :py:obj:`None`
+  :param now: The local observation time. Defaults to :py:obj:`None` (the current time).
+  :type now: :py:class:`~datetime.datetime` | :py:obj:`None`
+
+  :returns: The generated response.
+  :rtype: :py:class:`dict`
+  """
+  rng = Random() if rng is None else rng
+  now = datetime.now() if now is None else now
+
+  if match := COORDINATES_REGEX.match(location):
+    latitude, longitude = float(match[1]), float(match[2])
+    name = location
+  else:
+    digest = int.from_bytes(
+      blake2b(location.casefold().encode(), digest_size=8).digest(), 'big'
+    )
+    latitude = round((digest % 180_000) / 1000 - 90, 3)
+    longitude = round(((digest >> 20) % 360_000) / 1000 - 180, 3)
+    name = location.title()
+
+  base_temperature = round(30 - abs(latitude) * 0.5) + rng.randrange(-5, 6)
+  current = _conditions(rng, base_temperature, lang)
+
+  current.update(
+    {
+      'localObsDateTime': now.strftime('%Y-%m-%d %I:%M %p'),
+      'observation_time': now.strftime('%I:%M %p'),
+      'temp_C': str(base_temperature),
+      'temp_F': _fahrenheit(base_temperature),
+    }
+  )
+
+  weather = []
+
+  for day in range(days):
+    temperatures = [base_temperature + rng.randrange(-6, 7) for _ in range(0, 24, 3)]
+    sunrise = rng.uniform(5.0, 7.0)
+    moonrise = rng.uniform(0.0, 24.0)
+    snowfall = round(rng.uniform(0.0, 10.0), 1) if base_temperature < 0 else 0.0
+    daily = {
+      'astronomy': [
+        {
+          'moon_illumination': str(rng.randrange(101)),
+          'moon_phase': rng.choice(_PHASES),
+          'moonrise': _clock(moonrise).strftime('%I:%M %p'),
+          'moonset': _clock(moonrise + 12.4).strftime('%I:%M %p'),
+          'sunrise': _clock(sunrise).strftime('%I:%M %p'),
+          'sunset': _clock(sunrise + 12.0).strftime('%I:%M %p'),
+        }
+      ],
+      'avgtempC': str(round(sum(temperatures) / len(temperatures))),
+      'date': (now + timedelta(days=day)).date().isoformat(),
+      'maxtempC': str(max(temperatures)),
+      'mintempC': str(min(temperatures)),
+      'sunHour': str(round(rng.uniform(0.0, 12.0), 1)),
+      'totalSnow_cm': str(snowfall),
+      'uvIndex': str(rng.randrange(0, 12)),
+    }
+
+    for key in ('avgtemp', 'maxtemp', 'mintemp'):
+      daily[f'{key}F'] = _fahrenheit(int(daily[f'{key}C']))
+
+    if hourly:
+      daily['hourly'] = [
+        _hourly(rng, i * 3, temperature, lang)
+        for i, temperature in enumerate(temperatures)
+      ]
+
+    weather.append(daily)
+
+  return {
+    'current_condition': [current],
+    'nearest_area': [
+      {
+        'areaName': [{'value': name}],
+        'country': [{'value': 'Fakeland'}],
+        'latitude': str(latitude),
+        'longitude': str(longitude),
+        'population': str(rng.randrange(0, 10_000_000)),
+        'region': [{'value': 'Fake Region'}],
+        'weatherUrl': [{'value': ''}],
+      }
+    ],
+    'request': [{'query': f'Lat {latitude} and Lon {longitude}', 'type': 'LatLon'}],
+    'weather': weather,
+  }
+
+
+class _TokenBucket:
+  __slots__: tuple[str, ...] = ('__capacity', '__rate', '__tokens', '__updated_at')
+
+  __capacity: float
+  __rate: float
+  __tokens: float
+  __updated_at: float
+
+  def __init__(self, rate: float):
+    self.__capacity = max(rate, 1.0)
+    self.__rate = rate
+    self.__tokens = self.__capacity
+    self.__updated_at = time.monotonic()
+
+  def acquire(self) -> bool:
+    now = time.monotonic()
+
+    self.__tokens = min(
+      self.__capacity, self.__tokens + (now - self.__updated_at) * self.__rate
+    )
+    self.__updated_at = now
+
+    if self.__tokens < 1.0:
+      return False
+
+    self.__tokens -= 1.0
+
+    return True
+
+
+def create_app(
+  *,
+  latency: float = 0.0,
+  jitter: float = 0.0,
+  max_rps: float | None = None,
+  rate_429: float = 0.0,
+  rate_5xx: float = 0.0,
+  days: int = 3,
+  seed: int | None = None,
+  compress: bool = True,
+) -> web.Application:
+  """
+  Creates the stand-in server's :class:`~aiohttp.web.Application`, e.g. for use with :class:`aiohttp.test_utils.TestServer`.
+
+  :param latency: The base amount of seconds every response is delayed by. Defaults to ``0``.
+  :type latency: :py:class:`float`
+  :param jitter: The maximum amount of seconds randomly added on top of ``latency``. Defaults to ``0``.
+  :type jitter: :py:class:`float`
+  :param max_rps: The maximum sustained requests per second before responding with ``429 Too Many Requests``. Defaults to :py:obj:`None` (unlimited).
+  :type max_rps: :py:class:`float` | :py:obj:`None`
+  :param rate_429: The probability of a request randomly failing with ``429 Too Many Requests``. Defaults to ``0``.
+  :type rate_429: :py:class:`float`
+  :param rate_5xx: The probability of a request randomly failing with ``503 Service Unavailable``. Defaults to ``0``.
+  :type rate_5xx: :py:class:`float`
+  :param days: The amount of daily forecasts per response. Defaults to ``3``.
+  :type days: :py:class:`int`
+  :param seed: The random seed used. Defaults to :py:obj:`None`.
+  :type seed: :py:class:`int` | :py:obj:`None`
+  :param compress: Whether to compress responses according to the ``Accept-Encoding`` header, like wttr.in does. Defaults to ``True``.
+  :type compress: :py:class:`bool`
+
+  :exception ValueError: Any of the numeric arguments are out of range.
+
+  :returns: The application.
+  :rtype: :class:`~aiohttp.web.Application`
+  """
+  if latency < 0 or jitter < 0:
+    raise ValueError('The latency and jitter must not be negative.')
+  elif not (0 <= rate_429 <= 1 and 0 <= rate_5xx <= 1):
+    raise ValueError('The error rates must be between 0 and 1.')
+  elif max_rps is not None and max_rps <= 0:
+    raise ValueError('The maximum requests per second must be positive.')
+
+  rng = Random(seed)
+  bucket = None if max_rps is None else _TokenBucket(max_rps)
+
+  async def handle(request: web.Request) -> web.Response:
+    delay = latency + (rng.uniform(0.0, jitter) if jitter else 0.0)
+
+    if delay:
+      await sleep(delay)
+
+    if (bucket is not None and not bucket.acquire()) or rng.random() < rate_429:
+      return web.Response(status=429, text='Too Many Requests')
+    elif rng.random() < rate_5xx:
+      return web.Response(status=503, text='Service Unavailable')
+
+    response_format = request.query.get('format', 'j1')
+
+    if response_format not in ('j1', 'j2'):
+      return web.Response(status=400, text='Only the j1 and j2 formats are supported.')
+
+    lang = request.query.get('lang')
+
+    payload = generate_payload(
+      request.match_info['location'].replace('+', ' '),
+      rng=rng,
+      days=days,
+      hourly=response_format == 'j1',
+      lang=None if lang == 'en' else lang,
+    )
+
+    response = web.Response(text=json.dumps(payload), content_type='text/plain')
+
+    if compress:
+      response.enable_compression()
+
+    return response
+
+  app = web.Application()
+  app.router.add_get('/{location}', handle)
+
+  return app
+
+
+def main(argv: 'Sequence[str] | None' = None) -> None:
+  """
+  The command-line entry point.
+
+  :param argv: The command-line arguments. Defaults to :py:obj:`None` (uses :py:data:`sys.argv`).
+  :type argv: :py:class:`~collections.abc.Sequence` [:py:class:`str`] | :py:obj:`None`
+  """
+  parser = ArgumentParser(
+    prog='python -m python_weather.fakeserver',
+    description='A local wttr.in-compatible stand-in server for benchmarking.',
+  )
+  parser.add_argument('--host', default='127.0.0.1')
+  parser.add_argument('--port', type=int, default=8080)
+  parser.add_argument(
+    '--latency', type=float, default=0.0, help='base response delay in seconds'
+  )
+  parser.add_argument(
+    '--jitter', type=float, default=0.0, help='maximum random extra delay in seconds'
+  )
+  parser.add_argument(
+    '--max-rps',
+    type=float,
+    default=None,
+    help='throughput cap before responding with 429',
+  )
+  parser.add_argument(
+    '--rate-429', type=float, default=0.0, help='probability of a random 429 response'
+  )
+  parser.add_argument(
+    '--rate-5xx', type=float, default=0.0, help='probability of a random 503 response'
+  )
+  parser.add_argument(
+    '--days', type=int, default=3, help='amount of daily forecasts per response'
+  )
+  parser.add_argument('--seed', type=int, default=None)
+
+  args = parser.parse_args(argv)
+
+  web.run_app(
+    create_app(
+      latency=args.latency,
+      jitter=args.jitter,
+      max_rps=args.max_rps,
+      rate_429=args.rate_429,
+      rate_5xx=args.rate_5xx,
+      days=args.days,
+      seed=args.seed,
+    ),
+    host=args.host,
+    port=args.port,
+  )
+
+
+if __name__ == '__main__':  # pragma: nocover
+  main()
@@ -1,16 +1,26 @@
 # SPDX-License-Identifier: MIT
 # SPDX-FileCopyrightText: 2021-2026 null8626
 
-from datetime import datetime, date, time
-from typing import TYPE_CHECKING
-
+from datetime import datetime, date, time, timedelta
+from typing import TYPE_CHECKING, ClassVar
+from bisect import bisect_left
+import copy
+import sys
+import os
+
+from .serialization import from_dict, to_dict, to_json_bytes
+from .diff import apply as _apply_patch, diff as _diff
+from .base import BaseForecast
 from .enums import Phase, HeatIndex
 from .constants import LATLON_REGEX
-from .base import BaseForecast
 
 if TYPE_CHECKING:
-  from collections.abc import Iterator
+  from collections.abc import Iterable, Iterator
+  from typing import Any
 
+  from pyarrow import RecordBatch
+
+  from .base import _Projection
   from .constants import _Unit
   from .enums import Locale
 
@@ -36,6 +46,8 @@ class HourlyForecast(BaseForecast):
     'wind_gust',
   )
 
+  _fields: ClassVar['_Projection'] = dict.fromkeys(BaseForecast.__slots__ + __slots__)
+
   chances_of_fog: int
   """Chances of a fog in percent."""
 
@@ -81,7 +93,13 @@ class HourlyForecast(BaseForecast):
   wind_gust: int
   """The wind gust value in either kilometers/hour or miles/hour."""
 
-  def __init__(self, json: dict, unit: '_Unit', locale: 'Locale'):
+  def __init__(
+    self,
+    json: dict,
+    unit: '_Unit',
+    locale: 'Locale',
+    fields: '_Projection | None' = None,
+  ):
     # For inheritance purposes.
     if 'temp_C' not in json:
       json['temp_C'] = json.pop('tempC')
@@ -89,33 +107,63 @@ class HourlyForecast(BaseForecast):
     if 'temp_F' not in json:
       json['temp_F'] = json.pop('tempF')
 
-    celcius_index = int(json['HeatIndexC'])
-    t = json['time']
-
-    self.chances_of_fog = int(json['chanceoffog'])
-    self.chances_of_frost = int(json['chanceoffrost'])
-    self.chances_of_high_temperature = int(json['chanceofhightemp'])
-    self.chances_of_overcast = int(json['chanceofovercast'])
-    self.chances_of_rain = int(json['chanceofrain'])
-    self.chances_of_remaining_dry = int(json['chanceofremdry'])
-    self.chances_of_snow = int(json['chanceofsnow'])
-    self.chances_of_sunshine = int(json['chanceofsunshine'])
-    self.chances_of_thunder = int(json['chanceofthunder'])
-    self.chances_of_windy = int(json['chanceofwindy'])
-    self.time = time() if len(t) < 3 else datetime.strptime(t, '%H%M').time()
-    self.dew_point = int(json[f'DewPoint{unit.temperature}'])
-    self.heat_index = HeatIndex._new(
-      celcius_index,
-      int(json[f'HeatIndex{unit.temperature}']),
-    )
-    self.wind_chill = int(json[f'WindChill{unit.temperature}'])
-    self.wind_gust = int(json[f'WindGust{unit.velocity}'])
+    if fields is None:
+      fields = __class__._fields
+
+    if 'chances_of_fog' in fields:
+      self.chances_of_fog = int(json['chanceoffog'])
+
+    if 'chances_of_frost' in fields:
+      self.chances_of_frost = int(json['chanceoffrost'])
+
+    if 'chances_of_high_temperature' in fields:
+      self.chances_of_high_temperature = int(json['chanceofhightemp'])
+
+    if 'chances_of_overcast' in fields:
+      self.chances_of_overcast = int(json['chanceofovercast'])
+
+    if 'chances_of_rain' in fields:
+      self.chances_of_rain = int(json['chanceofrain'])
+
+    if 'chances_of_remaining_dry' in fields:
+      self.chances_of_remaining_dry = int(json['chanceofremdry'])
+
+    if 'chances_of_snow' in fields:
+      self.chances_of_snow = int(json['chanceofsnow'])
+
+    if 'chances_of_sunshine' in fields:
+      self.chances_of_sunshine = int(json['chanceofsunshine'])
+
+    if 'chances_of_thunder' in fields:
+      self.chances_of_thunder = int(json['chanceofthunder'])
+
+    if 'chances_of_windy' in fields:
+      self.chances_of_windy = int(json['chanceofwindy'])
+
+    if 'time' in fields:
+      t = json['time']
+      self.time = time() if len(t) < 3 else datetime.strptime(t, '%H%M').time()
 
-    super().__init__(json, unit, locale)
+    if 'dew_point' in fields:
+      self.dew_point = int(json[f'DewPoint{unit.temperature}'])
+
+    if 'heat_index' in fields:
+      self.heat_index = HeatIndex._new(
+        int(json['HeatIndexC']),
+        int(json[f'HeatIndex{unit.temperature}']),
+      )
+
+    if 'wind_chill' in fields:
+      self.wind_chill = int(json[f'WindChill{unit.temperature}'])
+
+    if 'wind_gust' in fields:
+      self.wind_gust = int(json[f'WindGust{unit.velocity}'])
+
+    super().__init__(json, unit, locale, fields)
 
   def __repr__(self) -> str:
     """The forecast's debug string representation."""
-    return f'<{__class__.__module__}.{__class__.__name__} time={self.time!r} temperature={self.temperature} kind={self.kind!r}>'
+    return f'<{__class__.__module__}.{__class__.__name__} time={getattr(self, "time", None)!r} temperature={getattr(self, "temperature", None)} kind={getattr(self, "kind", None)!r}>'
 
 
 class DailyForecast:
@@ -137,6 +185,9 @@ class DailyForecast:
     'hourly_forecasts',
   )
 
+  _fields: ClassVar['_Projection'] = dict.fromkeys(__slots__)
+  _nested: ClassVar[dict[str, type]] = {'hourly_forecasts': HourlyForecast}
+
   moon_illumination: int
   """The percentage of the moon illuminated."""
 
@@ -176,24 +227,62 @@ class DailyForecast:
   hourly_forecasts: list[HourlyForecast]
   """The hourly forecasts of this day."""
 
-  def __init__(self, json: dict, unit: '_Unit', locale: 'Locale'):
+  def __init__(
+    self,
+    json: dict,
+    unit: '_Unit',
+    locale: 'Locale',
+    fields: '_Projection | None' = None,
+  ):
+    if fields is None:
+      fields = __class__._fields
+
     astronomy = json['astronomy'][0]
 
-    self.moon_illumination = int(astronomy['moon_illumination'])
-    self.moon_phase = Phase(astronomy['moon_phase'])
-    self.moonrise = __class__.__parse_time(astronomy['moonrise'])
-    self.moonset = __class__.__parse_time(astronomy['moonset'])
-    self.sunrise = __class__.__parse_time(astronomy['sunrise'])
-    self.sunset = __class__.__parse_time(astronomy['sunset'])
-    self.date = date.fromisoformat(json['date'])
-    self.sunlight = float(json['sunHour'])
-    self.lowest_temperature = int(json[f'mintemp{unit.temperature}'])
-    self.highest_temperature = int(json[f'maxtemp{unit.temperature}'])
-    self.temperature = int(json[f'avgtemp{unit.temperature}'])
-    self.snowfall = float(json['totalSnow_cm']) / unit.cm_divisor
-    self.hourly_forecasts = [
-      HourlyForecast(elem, unit, locale) for elem in json['hourly']
-    ]
+    if 'moon_illumination' in fields:
+      self.moon_illumination = int(astronomy['moon_illumination'])
+
+    if 'moon_phase' in fields:
+      self.moon_phase = Phase(astronomy['moon_phase'])
+
+    if 'moonrise' in fields:
+      self.moonrise = __class__.__parse_time(astronomy['moonrise'])
+
+    if 'moonset' in fields:
+      self.moonset = __class__.__parse_time(astronomy['moonset'])
+
+    if 'sunrise' in fields:
+      self.sunrise = __class__.__parse_time(astronomy['sunrise'])
+
+    if 'sunset' in fields:
+      self.sunset = __class__.__parse_time(astronomy['sunset'])
+
+    if 'date' in fields:
+      self.date = date.fromisoformat(json['date'])
+
+    if 'sunlight' in fields:
+      self.sunlight = float(json['sunHour'])
+
+    if 'lowest_temperature' in fields:
+      self.lowest_temperature = int(json[f'mintemp{unit.temperature}'])
+
+    if 'highest_temperature' in fields:
+      self.highest_temperature = int(json[f'maxtemp{unit.temperature}'])
+
+    if 'temperature' in fields:
+      self.temperature = int(json[f'avgtemp{unit.temperature}'])
+
+    if 'snowfall' in fields:
+      self.snowfall = float(json['totalSnow_cm']) / unit.cm_divisor
+
+    if 'hourly_forecasts' in fields:
+      hourly_fields = fields['hourly_forecasts']
+
+      self.hourly_forecasts = [
+        HourlyForecast(elem, unit, locale, hourly_fields) for elem in json['hourly']
+      ]
+    else:
+      self.hourly_forecasts = []
 
   @staticmethod
   def __parse_time(timestamp: str) -> time | None:
@@ -204,7 +293,41 @@ class DailyForecast:
 
   def __repr__(self) -> str:
     """The forecast's debug string representation."""
-    return f'<{__class__.__module__}.{__class__.__name__} date={self.date!r} temperature={self.temperature}>'
+    return f'<{__class__.__module__}.{__class__.__name__} date={getattr(self, "date", None)!r} temperature={getattr(self, "temperature", None)}>'
+
+  def to_dict(self) -> dict:
+    """
+    Converts this forecast into a dictionary of JSON-ready primitives, including its hourly forecasts.
+
+    :returns: The converted forecast. See :func:`.serialization.to_dict` for the conversion rules.
+    :rtype: :py:class:`dict`
+    """
+    return to_dict(self)
+
+  def to_json_bytes(self) -> bytes:
+    """
+    Serializes this forecast into UTF-8 encoded JSON, using :mod:`orjson` if it's installed.
+
+    :returns: The serialized forecast.
+    :rtype: :py:class:`bytes`
+    """
+    return to_json_bytes(self)
+
+  @classmethod
+  def from_dict(cls, data: dict) -> 'DailyForecast':
+    """
+    Rebuilds a forecast from :meth:`to_dict`'s output.
+
+    :param data: The converted forecast.
+    :type data: :py:class:`dict`
+
+    :exception KeyError: ``data`` contains an invalid enum name.
+    :exception ValueError: ``data`` contains an invalid date or time.
+
+    :returns: The rebuilt forecast.
+    :rtype: :class:`.DailyForecast`
+    """
+    return from_dict(cls, data)
 
   def __len__(self) -> int:
     """The amount of hourly forecasts."""
@@ -215,8 +338,8 @@ class DailyForecast:
     return iter(self.hourly_forecasts)
 
 
-class Forecast(BaseForecast):
-  """A set of weather forecasts for a certain location."""
+class CurrentForecast(BaseForecast):
+  """The current weather conditions for a certain location."""
 
   __slots__: tuple[str, ...] = (
     'local_population',
@@ -225,9 +348,10 @@ class Forecast(BaseForecast):
     'country',
     'datetime',
     'coordinates',
-    'daily_forecasts',
   )
 
+  _fields: ClassVar['_Projection'] = dict.fromkeys(BaseForecast.__slots__ + __slots__)
+
   local_population: int
   """The local population count."""
 
@@ -246,39 +370,360 @@ class Forecast(BaseForecast):
   coordinates: tuple[float, float]
   """This forecast's latitude and longitude."""
 
-  daily_forecasts: list[DailyForecast]
-  """Daily weather forecasts in this location."""
+  def __init__(
+    self,
+    json: dict,
+    unit: '_Unit',
+    locale: 'Locale',
+    fields: 'Iterable[str] | None' = None,
+  ):
+    projection = __class__._project(fields)
 
-  def __init__(self, json: dict, unit: '_Unit', locale: 'Locale'):
     current = json['current_condition'][0]
     nearest = json['nearest_area'][0]
 
-    self.local_population = int(nearest['population'])
-    self.region = nearest['region'][0]['value']
-    self.location = nearest['areaName'][0]['value']
-    self.country = nearest['country'][0]['value']
-    self.datetime = datetime.strptime(current['localObsDateTime'], '%Y-%m-%d %I:%M %p')
+    if 'local_population' in projection:
+      self.local_population = int(nearest['population'])
 
-    try:
-      req = next(filter(lambda x: x['type'] == 'LatLon', json['request']))
-      match = LATLON_REGEX.match(req['query'])
+    if 'region' in projection:
+      self.region = nearest['region'][0]['value']
 
-      if TYPE_CHECKING:
-        assert match is not None
+    if 'location' in projection:
+      self.location = nearest['areaName'][0]['value']
 
-      self.coordinates = float(match[1]), float(match[2])
-    except (AssertionError, KeyError, StopIteration):
-      self.coordinates = float(nearest['latitude']), float(nearest['longitude'])
+    if 'country' in projection:
+      self.country = nearest['country'][0]['value']
 
-    self.daily_forecasts = [
-      DailyForecast(elem, unit, locale) for elem in json['weather']
-    ]
+    if 'datetime' in projection:
+      self.datetime = datetime.strptime(
+        current['localObsDateTime'], '%Y-%m-%d %I:%M %p'
+      )
 
-    super().__init__(current, unit, locale)
+    if 'coordinates' in projection:
+      try:
+        req = next(filter(lambda x: x['type'] == 'LatLon', json['request']))
+        match = LATLON_REGEX.match(req['query'])
+
+        if TYPE_CHECKING:
+          assert match is not None
+
+        self.coordinates = float(match[1]), float(match[2])
+      except (AssertionError, KeyError, StopIteration):
+        self.coordinates = float(nearest['latitude']), float(nearest['longitude'])
+
+    super().__init__(current, unit, locale, projection)
 
   def __repr__(self) -> str:
     """The forecast's debug string representation."""
-    return f'<{__class__.__module__}.{__class__.__name__} location={self.location!r} datetime={self.datetime!r} temperature={self.temperature}>'
+    return f'<{self.__class__.__module__}.{self.__class__.__name__} location={getattr(self, "location", None)!r} datetime={getattr(self, "datetime", None)!r} temperature={getattr(self, "temperature", None)}>'
+
+
+class Forecast(CurrentForecast):
+  """A set of weather forecasts for a certain location."""
+
+  __slots__: tuple[str, ...] = ('daily_forecasts', '__index')
+
+  _fields: ClassVar['_Projection'] = dict.fromkeys(
+    BaseForecast.__slots__ + CurrentForecast.__slots__ + ('daily_forecasts',)
+  )
+  _nested: ClassVar[dict[str, type]] = {'daily_forecasts': DailyForecast}
+
+  daily_forecasts: list[DailyForecast]
+  """Daily weather forecasts in this location."""
+
+  __index: 'tuple[list[datetime], list[HourlyForecast]] | None'
+
+  def __init__(
+    self,
+    json: dict,
+    unit: '_Unit',
+    locale: 'Locale',
+    fields: 'Iterable[str] | None' = None,
+  ):
+    projection = __class__._project(fields)
+    self.__index = None
+
+    if 'daily_forecasts' in projection:
+      daily_fields = projection['daily_forecasts']
+
+      self.daily_forecasts = [
+        DailyForecast(elem, unit, locale, daily_fields) for elem in json['weather']
+      ]
+    else:
+      self.daily_forecasts = []
+
+    super().__init__(json, unit, locale, projection)
+
+  def to_arrow(self, granularity: str = 'hourly') -> 'RecordBatch':
+    """
+    Exports this forecast into an Arrow record batch. Requires pyarrow to be installed.
+
+    Example:
+
+    .. code-block:: python
+
+      batch = weather.to_arrow('daily')
+
+    :param granularity: Either ``'hourly'`` (one row per :class:`.HourlyForecast`) or ``'daily'`` (one row per :class:`.DailyForecast`). Defaults to ``'hourly'``.
+    :type granularity: :py:class:`str`
+
+    :exception ImportError: pyarrow is not installed.
+    :exception ValueError: ``granularity`` is invalid.
+
+    :returns: The Arrow record batch.
+    :rtype: :class:`pyarrow.RecordBatch`
+    """
+    from .export import to_record_batch
+
+    return to_record_batch((self,), granularity)
+
+  def resample(
+    self,
+    step: timedelta = timedelta(hours=1),
+    *,
+    method: str = 'linear',
+    fields: 'Iterable[str] | None' = None,
+  ) -> 'dict[str, list[Any]]':
+    """
+    Resamples the 3-hourly forecasts into an evenly spaced series, interpolating numeric attributes and holding categorical ones.
+
+    Example:
+
+    .. code-block:: python
+
+      series = weather.resample(timedelta(minutes=15), method='cubic')
+
+    :param step: The spacing between resampled values. Defaults to one hour.
+    :type step: :py:class:`~datetime.timedelta`
+    :param method: Either ``'linear'`` or ``'cubic'`` (monotone). Defaults to ``'linear'``.
+    :type method: :py:class:`str`
+    :param fields: The resampled attributes. Defaults to :py:obj:`None` (every supported attribute).
+    :type fields: :py:class:`~collections.abc.Iterable` [:py:class:`str`] | :py:obj:`None`
+
+    :exception ValueError: ``step``, ``method`` or any of the ``fields`` is invalid.
+
+    :returns: The resampled columns. See :func:`.resample.resample` for more information.
+    :rtype: :py:class:`dict` [:py:class:`str`, :py:class:`list`]
+    """
+    from .resample import resample
+
+    return resample(self, step, method=method, fields=fields)
+
+  def diff(self, previous: 'Forecast') -> dict:
+    """
+    Computes what changed since a previous forecast for the same location.
+
+    Example:
+
+    .. code-block:: python
+
+      patch = weather.diff(previous_weather)
+
+      if patch:
+        await websocket.send_json(patch)
+
+    :param previous: The previous forecast, parsed with the same ``fields``.
+    :type previous: :class:`.Forecast`
+
+    :returns: Only the changed attributes, per current/daily/hourly slot. See :mod:`python_weather.diff` for the patch format.
+    :rtype: :py:class:`dict`
+    """
+    return _diff(previous.to_dict(), self.to_dict())
+
+  def apply_patch(self, patch: dict) -> 'Forecast':
+    """
+    Rebuilds the newer forecast a patch was computed for, leaving this forecast unmodified.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = previous_weather.apply_patch(patch)
+
+    :param patch: The patch computed by :meth:`diff` against this forecast.
+    :type patch: :py:class:`dict`
+
+    :returns: The rebuilt forecast.
+    :rtype: :class:`.Forecast`
+    """
+    return self.__class__.from_dict(_apply_patch(self.to_dict(), patch))
+
+  @classmethod
+  def from_dict(cls, data: dict) -> 'Forecast':
+    """
+    Rebuilds a forecast from :meth:`to_dict`'s output, e.g. one read back from a cache or a message queue.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = python_weather.Forecast.from_dict(data)
+
+    :param data: The converted forecast.
+    :type data: :py:class:`dict`
+
+    :exception KeyError: ``data`` contains an invalid enum name.
+    :exception ValueError: ``data`` contains an invalid date or time.
+
+    :returns: The rebuilt forecast.
+    :rtype: :class:`.Forecast`
+    """
+    forecast = from_dict(cls, data)
+    forecast.__index = None
+
+    return forecast
+
+  @classmethod
+  def parse_many(
+    cls,
+    payloads: 'Iterable[bytes | dict]',
+    unit: '_Unit',
+    locale: 'Locale',
+    *,
+    fields: 'Iterable[str] | None' = None,
+    max_workers: int | None = None,
+  ) -> list['Forecast']:
+    """
+    Parses many raw wttr.in responses at once, e.g. ones read back from an archive during ingestion.
+
+    Responses are decoded and parsed in a thread pool. Parsing shares no mutable state between threads, so on free-threaded CPython builds (such as ``python3.14t``) the work is spread across every CPU core.
+
+    Example:
+
+    .. code-block:: python
+
+      forecasts = python_weather.Forecast.parse_many(
+        bodies, python_weather.METRIC, python_weather.Locale.ENGLISH
+      )
+
+    :param payloads: The raw responses, either as JSON or :mod:`python_weather.compact` bytes or as already decoded dictionaries. Dictionaries are consumed by parsing, so each of them must only be passed once.
+    :type payloads: :py:class:`~collections.abc.Iterable` [:py:class:`bytes` | :py:class:`dict`]
+    :param unit: The unit system the responses were requested with.
+    :type unit: ``_Unit``
+    :param locale: The locale the responses were requested with.
+    :type locale: :class:`.Locale`
+    :param fields: The attributes to parse, as in :meth:`.Client.get`. Defaults to :py:obj:`None` (parses every attribute).
+    :type fields: :py:class:`~collections.abc.Iterable` [:py:class:`str`] | :py:obj:`None`
+    :param max_workers: The amount of threads to parse with. Defaults to :py:obj:`None` (one per CPU core without the GIL, otherwise parses in the calling thread since the GIL would serialize the threads anyway).
+    :type max_workers: :py:class:`int` | :py:obj:`None`
+
+    :exception ValueError: ``max_workers`` is not positive, ``fields`` contains an unknown attribute, or a response is corrupted.
+
+    :returns: The parsed forecasts, in the same order as ``payloads``.
+    :rtype: :py:class:`list` [:class:`.Forecast`]
+    """
+    from .compact import _decode
+
+    projection = cls._project(fields)
+    payloads = list(payloads)
+
+    if max_workers is None:
+      max_workers = (
+        1 if getattr(sys, '_is_gil_enabled', lambda: True)() else os.cpu_count() or 1
+      )
+    elif max_workers < 1:
+      raise ValueError('The amount of workers must be positive.')
+
+    def parse(payload: 'bytes | dict') -> 'Forecast':
+      return cls(
+        payload if isinstance(payload, dict) else _decode(payload),
+        unit,
+        locale,
+        projection,
+      )
+
+    if max_workers == 1 or len(payloads) < 2:
+      return list(map(parse, payloads))
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(min(max_workers, len(payloads))) as executor:
+      return list(executor.map(parse, payloads))
+
+  def at(self, when: datetime, *, interpolate: bool = False) -> HourlyForecast:
+    """
+    Looks up the hourly forecast at an arbitrary local date and time in ``O(log n)``.
+
+    The sorted index this uses is built on first use. Call :meth:`reindex` after modifying :attr:`daily_forecasts` or their hourly forecasts.
+
+    Example:
+
+    .. code-block:: python
+
+      hourly = weather.at(datetime(2026, 10, 19, 14, 30), interpolate=True)
+
+    :param when: The naive local date and time. Values outside of the forecasted range are clamped to the first or last hourly forecast.
+    :type when: :py:class:`~datetime.datetime`
+    :param interpolate: Whether to return a new hourly forecast whose numeric attributes are linearly interpolated between the surrounding hourly forecasts, and whose other attributes are held from the preceding one. Defaults to :py:obj:`False` (returns the closest hourly forecast).
+    :type interpolate: :py:class:`bool`
+
+    :exception ValueError: This forecast has no hourly forecasts.
+
+    :returns: The requested hourly forecast.
+    :rtype: :class:`.HourlyForecast`
+    """
+    if (index := getattr(self, '_Forecast__index', None)) is None:
+      index = self.reindex()
+
+    keys, slots = index
+
+    if not slots:
+      raise ValueError('This forecast has no hourly forecasts.')
+
+    position = bisect_left(keys, when)
+
+    if position == 0:
+      return slots[0]
+    elif position == len(keys):
+      return slots[-1]
+    elif keys[position] == when:
+      return slots[position]
+
+    before, after = keys[position - 1], keys[position]
+
+    if not interpolate:
+      return slots[position - 1] if when - before <= after - when else slots[position]
+
+    from .resample import NUMERIC_FIELDS
+
+    start, end = slots[position - 1], slots[position]
+    weight = (when - before) / (after - before)
+    hourly = copy.copy(start)
+    hourly.time = when.time()
+
+    for field in NUMERIC_FIELDS:
+      if (value := getattr(start, field, None)) is not None:
+        interpolated = value + (getattr(end, field) - value) * weight
+        setattr(
+          hourly,
+          field,
+          round(interpolated) if isinstance(value, int) else interpolated,
+        )
+
+    return hourly
+
+  def reindex(self) -> 'tuple[list[datetime], list[HourlyForecast]]':
+    """
+    Rebuilds the sorted index used by :meth:`at`.
+
+    :returns: The hourly forecasts' local dates and times and the hourly forecasts themselves, sorted chronologically.
+    :rtype: :py:class:`tuple` [:py:class:`list` [:py:class:`~datetime.datetime`], :py:class:`list` [:class:`.HourlyForecast`]]
+    """
+    pairs = sorted(
+      (
+        (datetime.combine(daily.date, hourly.time), hourly)
+        for daily in self.daily_forecasts
+        for hourly in daily.hourly_forecasts
+      ),
+      key=lambda pair: pair[0],
+    )
+
+    self.__index = index = (
+      [key for key, _ in pairs],
+      [hourly for _, hourly in pairs],
+    )
+
+    return index
 
   def __len__(self) -> int:
     """The amount of daily forecasts."""
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from collections import deque
+
+from .aggregate import _percentile
+
+_MIN_SAMPLES = 16
+
+
+class HedgePolicy:
+  """
+  Decides how long a :class:`.Client` waits for a response before sending a second, identical request and taking whichever answers first.
+
+  The delay is a percentile of recently observed latencies, so that only the slowest requests are hedged: hedging at the 95th percentile costs around 5% of extra requests while cutting the latency tail.
+
+  Example:
+
+  .. code-block:: python
+
+    client = python_weather.Client(
+      hedging=python_weather.HedgePolicy(90.0, initial_delay=0.5)
+    )
+
+  :param percentile: The latency percentile after which requests are hedged, between ``0`` and ``100``. Defaults to ``95``.
+  :type percentile: :py:class:`float`
+  :param window: The amount of recent latencies kept. Defaults to ``256``.
+  :type window: :py:class:`int`
+  :param initial_delay: The delay in seconds used until enough latencies are observed. Defaults to ``1``.
+  :type initial_delay: :py:class:`float`
+  :param min_delay: The minimum delay in seconds, which prevents hedging every request while the upstream is fast. Defaults to ``0``.
+  :type min_delay: :py:class:`float`
+
+  :exception ValueError: ``percentile`` is out of range, ``window`` is not positive, or any delay is negative.
+  """
+
+  __slots__: tuple[str, ...] = (
+    '__initial_delay',
+    '__latencies',
+    '__min_delay',
+    '__percentile',
+  )
+
+  __initial_delay: float
+  __latencies: deque[float]
+  __min_delay: float
+  __percentile: float
+
+  def __init__(
+    self,
+    percentile: float = 95.0,
+    *,
+    window: int = 256,
+    initial_delay: float = 1.0,
+    min_delay: float = 0.0,
+  ):
+    if not 0 <= percentile <= 100:
+      raise ValueError('The percentile must be between 0 and 100.')
+    elif window < 1:
+      raise ValueError('The window must be positive.')
+    elif initial_delay < 0 or min_delay < 0:
+      raise ValueError('The delays must not be negative.')
+
+    self.__percentile = percentile
+    self.__latencies = deque(maxlen=window)
+    self.__initial_delay = initial_delay
+    self.__min_delay = min_delay
+
+  def __repr__(self) -> str:
+    """The hedge policy's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} percentile={self.__percentile} delay={self.delay}>'
+
+  @property
+  def percentile(self) -> float:
+    """The latency percentile after which requests are hedged."""
+    return self.__percentile
+
+  @property
+  def delay(self) -> float:
+    """The current amount of seconds to wait before hedging a request."""
+    if len(self.__latencies) < _MIN_SAMPLES:
+      return max(self.__initial_delay, self.__min_delay)
+
+    return max(
+      _percentile(sorted(self.__latencies), self.__percentile), self.__min_delay
+    )
+
+  def record(self, latency: float) -> None:
+    """
+    Records a successful request's latency.
+
+    :param latency: The latency in seconds.
+    :type latency: :py:class:`float`
+    """
+    self.__latencies.append(latency)
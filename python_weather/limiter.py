@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from asyncio import sleep
+import time
+
+from .scheduler import _remaining
+from .errors import DeadlineError
+
+
+class RateLimiter:
+  """
+  An asynchronous token bucket limiting how many requests a :class:`.Client` sends per second.
+
+  Callers reserve their slot immediately, so concurrent requests are spaced out evenly in the order they arrived.
+
+  :param rate: The maximum amount of requests per second.
+  :type rate: :py:class:`float`
+  :param burst: The amount of requests that may be sent at once after being idle. Defaults to ``1``.
+  :type burst: :py:class:`int`
+
+  :exception ValueError: ``rate`` or ``burst`` is not positive.
+  """
+
+  __slots__: tuple[str, ...] = ('__burst', '__rate', '__tokens', '__updated_at')
+
+  __burst: int
+  __rate: float
+  __tokens: float
+  __updated_at: float
+
+  def __init__(self, rate: float, *, burst: int = 1):
+    if rate <= 0 or burst < 1:
+      raise ValueError('The rate and burst must be positive.')
+
+    self.__rate = rate
+    self.__burst = burst
+    self.__tokens = float(burst)
+    self.__updated_at = time.monotonic()
+
+  def __repr__(self) -> str:
+    """The rate limiter's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} rate={self.__rate} burst={self.__burst}>'
+
+  @property
+  def rate(self) -> float:
+    """The maximum amount of requests per second."""
+    return self.__rate
+
+  async def acquire(self, *, deadline: float | None = None) -> None:
+    """
+    Waits until another request may be sent.
+
+    :param deadline: The :py:func:`time.monotonic` time to give up at. If the wait would last past it, no slot is reserved. Defaults to :py:obj:`None` (waits as long as needed).
+    :type deadline: :py:class:`float` | :py:obj:`None`
+
+    :exception DeadlineError: The request could not be sent before the deadline.
+    """
+    remaining = _remaining(deadline)
+    now = time.monotonic()
+    tokens = (
+      min(self.__burst, self.__tokens + (now - self.__updated_at) * self.__rate) - 1.0
+    )
+    delay = -tokens / self.__rate
+
+    if remaining is not None and delay >= remaining:
+      raise DeadlineError('The rate limit would delay the request past its deadline.')
+
+    self.__tokens = tokens
+    self.__updated_at = now
+
+    if tokens < 0:
+      await sleep(delay)
@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from decimal import Decimal
+
+from .constants import COORDINATES_REGEX
+from .errors import Error
+
+
+class LocationNormalizer:
+  """
+  Folds equivalent location queries into a single canonical form.
+
+  Textual queries are whitespace-collapsed and case-folded, while coordinate queries (``'lat,lon'``) are snapped to a grid. Once a forecast is fetched, the query is additionally aliased to the forecast's own (snapped) coordinates, so that ``'New York'`` and ``'40.7128,-74.0060'`` end up sharing the same :meth:`key`.
+
+  Example:
+
+  .. code-block:: python
+
+    normalizer = python_weather.LocationNormalizer(grid=0.01)
+
+    normalizer.normalize(' New  York ')  # 'new york'
+    normalizer.normalize('40.7128,-74.0060')  # '40.71,-74.01'
+
+  :param grid: The coordinate grid size in degrees. Defaults to ``0.01`` (roughly one kilometer).
+  :type grid: :py:class:`float`
+  :param max_aliases: The maximum amount of learned aliases to remember before the oldest ones are evicted. Defaults to ``4096``.
+  :type max_aliases: :py:class:`int`
+
+  :exception Error: ``grid`` is not positive or ``max_aliases`` is negative.
+  """
+
+  __slots__: tuple[str, ...] = ('__grid', '__digits', '__max_aliases', '__aliases')
+
+  __grid: float
+  __digits: int
+  __max_aliases: int
+  __aliases: dict[str, str]
+
+  def __init__(self, *, grid: float = 0.01, max_aliases: int = 4096):
+    if grid <= 0:
+      raise Error('The coordinate grid size must be positive.')
+    elif max_aliases < 0:
+      raise Error('The maximum amount of aliases must not be negative.')
+
+    exponent = Decimal(str(grid)).normalize().as_tuple().exponent
+
+    self.__grid = grid
+    self.__digits = max(0, -exponent) if isinstance(exponent, int) else 0
+    self.__max_aliases = max_aliases
+    self.__aliases = {}
+
+  def __repr__(self) -> str:
+    """The normalizer's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} grid={self.__grid} aliases={len(self.__aliases)}>'
+
+  def __len__(self) -> int:
+    """The amount of learned aliases."""
+    return len(self.__aliases)
+
+  @property
+  def grid(self) -> float:
+    """The coordinate grid size in degrees."""
+    return self.__grid
+
+  def snap(self, latitude: float, longitude: float) -> str:
+    """
+    Snaps a pair of coordinates to the grid.
+
+    :param latitude: The latitude.
+    :type latitude: :py:class:`float`
+    :param longitude: The longitude.
+    :type longitude: :py:class:`float`
+
+    :returns: The snapped coordinates as a ``'lat,lon'`` query.
+    :rtype: :py:class:`str`
+    """
+    grid = self.__grid
+    digits = self.__digits
+
+    # Adding 0.0 turns a negative zero into a positive one.
+    latitude = round(latitude / grid) * grid + 0.0
+    longitude = round(longitude / grid) * grid + 0.0
+
+    return f'{latitude:.{digits}f},{longitude:.{digits}f}'
+
+  def normalize(self, location: str) -> str:
+    """
+    Normalizes a location query. The result is what gets sent to the API.
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+
+    :returns: The normalized location query. This is empty if ``location`` only consists of whitespace.
+    :rtype: :py:class:`str`
+    """
+    location = ' '.join(location.split())
+
+    if match := COORDINATES_REGEX.match(location):
+      return self.snap(float(match[1]), float(match[2]))
+
+    return location.casefold()
+
+  def key(self, location: str) -> str:
+    """
+    Resolves a location query into its canonical key, suitable for caching or coalescing requests.
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+
+    :returns: The canonical key. This is the learned coordinates if available, otherwise the normalized query.
+    :rtype: :py:class:`str`
+    """
+    query = self.normalize(location)
+
+    return self.__aliases.get(query, query)
+
+  def learn(self, location: str, coordinates: tuple[float, float]) -> str:
+    """
+    Aliases a location query to the coordinates of the forecast it returned.
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+    :param coordinates: The returned forecast's :attr:`.Forecast.coordinates`.
+    :type coordinates: :py:class:`tuple` [:py:class:`float`, :py:class:`float`]
+
+    :returns: The newly learned canonical key.
+    :rtype: :py:class:`str`
+    """
+    query = self.normalize(location)
+    key = self.snap(*coordinates)
+
+    if query != key and self.__max_aliases:
+      aliases = self.__aliases
+      aliases.pop(query, None)
+
+      while len(aliases) >= self.__max_aliases:
+        del aliases[next(iter(aliases))]
+
+      aliases[query] = key
+
+    return key
+
+  def clear(self) -> None:
+    """Forgets every learned alias."""
+    self.__aliases.clear()
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from typing import TYPE_CHECKING
+from random import Random
+import time
+
+if TYPE_CHECKING:
+  from collections.abc import Collection, Iterator, Sequence
+
+
+class Mirror:
+  """The health statistics of a single upstream wttr.in-compatible server."""
+
+  __slots__: tuple[str, ...] = (
+    'available_at',
+    'failures',
+    'latency',
+    'requests',
+    'url',
+  )
+
+  url: str
+  """The base URL, without a trailing slash."""
+
+  latency: float | None
+  """The exponentially weighted moving average of successful response times in seconds, or :py:obj:`None` if it's never responded yet."""
+
+  failures: int
+  """The amount of consecutive failures."""
+
+  requests: int
+  """The total amount of requests sent."""
+
+  available_at: float
+  """The :py:func:`time.monotonic` timestamp at which this mirror is no longer cooling down from failures."""
+
+  def __init__(self, url: str):
+    self.url = url.rstrip('/')
+    self.latency = None
+    self.failures = 0
+    self.requests = 0
+    self.available_at = 0.0
+
+  def __repr__(self) -> str:
+    """The mirror's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} url={self.url!r} latency={self.latency} failures={self.failures}>'
+
+  @property
+  def healthy(self) -> bool:
+    """Whether this mirror is not cooling down from failures."""
+    return self.available_at <= time.monotonic()
+
+
+class MirrorPool:
+  """
+  A pool of upstream wttr.in-compatible servers with latency-aware selection, health tracking and failover.
+
+  Each request goes to the faster of two randomly picked healthy mirrors, which spreads load while routing around slow ones. A failing mirror is benched for an exponentially growing cooldown.
+
+  Example:
+
+  .. code-block:: python
+
+    client = python_weather.Client(
+      base_url=('http://wttr.internal:8002', 'https://wttr.in')
+    )
+
+  :param urls: The base URLs of the mirrors.
+  :type urls: :py:class:`~collections.abc.Sequence` [:py:class:`str`]
+  :param cooldown: The amount of seconds a mirror is benched for after its first consecutive failure, doubling on every subsequent one. Defaults to ``5``.
+  :type cooldown: :py:class:`float`
+  :param max_cooldown: The maximum amount of seconds a mirror is benched for. Defaults to ``300``.
+  :type max_cooldown: :py:class:`float`
+  :param smoothing: The weight of new response times in the latency moving average. Defaults to ``0.2``.
+  :type smoothing: :py:class:`float`
+
+  :exception ValueError: ``urls`` is empty or any of the numeric arguments are out of range.
+  """
+
+  __slots__: tuple[str, ...] = (
+    '__cooldown',
+    '__max_cooldown',
+    '__mirrors',
+    '__random',
+    '__smoothing',
+  )
+
+  __cooldown: float
+  __max_cooldown: float
+  __mirrors: tuple[Mirror, ...]
+  __random: Random
+  __smoothing: float
+
+  def __init__(
+    self,
+    urls: 'Sequence[str]',
+    *,
+    cooldown: float = 5.0,
+    max_cooldown: float = 300.0,
+    smoothing: float = 0.2,
+  ):
+    if isinstance(urls, str):
+      urls = (urls,)
+
+    if not urls:
+      raise ValueError('At least one mirror must be specified.')
+    elif cooldown < 0 or max_cooldown < cooldown:
+      raise ValueError('The cooldowns must be non-negative and properly ordered.')
+    elif not 0 < smoothing <= 1:
+      raise ValueError('The smoothing factor must be between 0 and 1.')
+
+    self.__mirrors = tuple(Mirror(url) for url in urls)
+    self.__cooldown = cooldown
+    self.__max_cooldown = max_cooldown
+    self.__smoothing = smoothing
+    self.__random = Random()
+
+  def __repr__(self) -> str:
+    """The pool's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} mirrors={self.__mirrors!r}>'
+
+  def __len__(self) -> int:
+    """The amount of mirrors."""
+    return len(self.__mirrors)
+
+  def __iter__(self) -> 'Iterator[Mirror]':
+    """Iterates through the mirrors."""
+    return iter(self.__mirrors)
+
+  def select(self, exclude: 'Collection[Mirror]' = ()) -> Mirror:
+    """
+    Selects a mirror for the next request.
+
+    :param exclude: Mirrors to avoid if possible, e.g. ones that already failed for the current request.
+    :type exclude: :py:class:`~collections.abc.Collection` [:class:`.Mirror`]
+
+    :returns: The faster of two randomly picked healthy mirrors. If every candidate is cooling down, the one recovering the soonest is returned instead.
+    :rtype: :class:`.Mirror`
+    """
+    candidates = [mirror for mirror in self.__mirrors if mirror not in exclude]
+
+    if not candidates:
+      candidates = list(self.__mirrors)
+
+    healthy = [mirror for mirror in candidates if mirror.healthy]
+
+    if not healthy:
+      return min(candidates, key=lambda mirror: mirror.available_at)
+    elif len(healthy) == 1:
+      return healthy[0]
+
+    first, second = self.__random.sample(healthy, 2)
+
+    # Unmeasured mirrors are preferred so that every mirror gets measured.
+    return first if (first.latency or 0.0) <= (second.latency or 0.0) else second
+
+  def has_healthy(self, exclude: 'Collection[Mirror]' = ()) -> bool:
+    """
+    Checks if any mirror is available for failover.
+
+    :param exclude: Mirrors to be disregarded.
+    :type exclude: :py:class:`~collections.abc.Collection` [:class:`.Mirror`]
+
+    :returns: Whether any mirror outside of ``exclude`` is healthy.
+    :rtype: :py:class:`bool`
+    """
+    return any(mirror.healthy for mirror in self.__mirrors if mirror not in exclude)
+
+  def record_success(self, mirror: Mirror, latency: float) -> None:
+    """
+    Records a successful response.
+
+    :param mirror: The mirror which responded.
+    :type mirror: :class:`.Mirror`
+    :param latency: The response time in seconds.
+    :type latency: :py:class:`float`
+    """
+    mirror.requests += 1
+    mirror.failures = 0
+    mirror.available_at = 0.0
+    mirror.latency = (
+      latency
+      if mirror.latency is None
+      else mirror.latency + (latency - mirror.latency) * self.__smoothing
+    )
+
+  def record_failure(self, mirror: Mirror) -> None:
+    """
+    Records a failed request, benching the mirror for a while.
+
+    :param mirror: The mirror which failed.
+    :type mirror: :class:`.Mirror`
+    """
+    mirror.requests += 1
+    mirror.failures += 1
+    mirror.available_at = time.monotonic() + min(
+      self.__cooldown * (2 ** (mirror.failures - 1)), self.__max_cooldown
+    )
@@ -0,0 +1,258 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+"""
+Resampling of wttr.in's 3-hourly forecasts into finer, evenly spaced series.
+
+Numeric attributes are interpolated either linearly or with a monotone cubic (Fritsch-Carlson) spline, which never overshoots the original values. Categorical attributes such as :attr:`.HourlyForecast.kind` are held until the next slot instead.
+
+The interpolation weights only depend on the slot layout and the step, which is the same for virtually every forecast. They are computed once and shared across attributes and forecasts, so that resampling a batch only costs a few multiply-adds per value.
+
+.. code-block:: python
+
+  from datetime import timedelta
+
+  series = weather.resample(timedelta(minutes=15), method='cubic')
+
+  for when, temperature in zip(series['datetime'], series['temperature']):
+    print(when, temperature)
+"""
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from functools import lru_cache
+from bisect import bisect_right
+
+if TYPE_CHECKING:
+  from collections.abc import Iterable
+  from typing import Any
+
+  from .forecast import Forecast, HourlyForecast
+
+  # (held slot, segment start, segment end, Hermite weights...)
+  _Weights = tuple[tuple[int, int, int, float, float, float, float], ...]
+
+
+NUMERIC_FIELDS = (
+  'temperature',
+  'feels_like',
+  'dew_point',
+  'wind_chill',
+  'wind_speed',
+  'wind_gust',
+  'cloud_cover',
+  'humidity',
+  'precipitation',
+  'pressure',
+  'visibility',
+  'chances_of_fog',
+  'chances_of_frost',
+  'chances_of_high_temperature',
+  'chances_of_overcast',
+  'chances_of_rain',
+  'chances_of_remaining_dry',
+  'chances_of_snow',
+  'chances_of_sunshine',
+  'chances_of_thunder',
+  'chances_of_windy',
+)
+"""The :class:`.HourlyForecast` attributes which are interpolated."""
+
+CATEGORICAL_FIELDS = (
+  'kind',
+  'description',
+  'wind_direction',
+  'ultraviolet',
+  'heat_index',
+)
+"""The :class:`.HourlyForecast` attributes which are held until the next slot."""
+
+METHODS = ('linear', 'cubic')
+"""The supported interpolation methods."""
+
+
+@lru_cache(maxsize=64)
+def _weights(offsets: tuple[float, ...], step: float, cubic: bool) -> '_Weights':
+  weights = []
+  last = len(offsets) - 1
+
+  for k in range(int(offsets[-1] // step) + 1):
+    target = k * step
+    held = bisect_right(offsets, target) - 1
+
+    if last == 0:
+      weights.append((0, 0, 0, 1.0, 0.0, 0.0, 0.0))
+    else:
+      segment = min(held, last - 1)
+      width = offsets[segment + 1] - offsets[segment]
+      s = (target - offsets[segment]) / width
+
+      if cubic:
+        # Cubic Hermite basis, with the tangent weights pre-scaled by the segment width.
+        s2 = s * s
+        s3 = s2 * s
+        weights.append(
+          (
+            held,
+            segment,
+            segment + 1,
+            2 * s3 - 3 * s2 + 1,
+            (s3 - 2 * s2 + s) * width,
+            -2 * s3 + 3 * s2,
+            (s3 - s2) * width,
+          )
+        )
+      else:
+        weights.append((held, segment, segment + 1, 1.0 - s, 0.0, s, 0.0))
+
+  return tuple(weights)
+
+
+def _tangents(offsets: tuple[float, ...], values: list[float]) -> list[float]:
+  count = len(values)
+
+  if count < 2:
+    return [0.0] * count
+
+  widths = [offsets[i + 1] - offsets[i] for i in range(count - 1)]
+  slopes = [(values[i + 1] - values[i]) / widths[i] for i in range(count - 1)]
+  tangents = [slopes[0]]
+
+  for i in range(1, count - 1):
+    before, after = slopes[i - 1], slopes[i]
+
+    # Flat tangents at extrema and plateaus keep the spline monotone.
+    if before * after <= 0:
+      tangents.append(0.0)
+    else:
+      w1 = 2 * widths[i] + widths[i - 1]
+      w2 = widths[i] + 2 * widths[i - 1]
+
+      tangents.append((w1 + w2) / (w1 / before + w2 / after))
+
+  tangents.append(slopes[-1])
+
+  return tangents
+
+
+def _validate(method: str, step: timedelta, fields: 'Iterable[str] | None') -> tuple:
+  if method not in METHODS:
+    raise ValueError(f'Expected method to be one of {METHODS!r}.')
+  elif step <= timedelta(0):
+    raise ValueError('The step must be positive.')
+
+  if fields is None:
+    return NUMERIC_FIELDS, CATEGORICAL_FIELDS
+
+  fields = tuple(fields)
+
+  for field in fields:
+    if field not in NUMERIC_FIELDS and field not in CATEGORICAL_FIELDS:
+      raise ValueError(f'Unknown resampled field: {field!r}.')
+
+  return (
+    tuple(field for field in fields if field in NUMERIC_FIELDS),
+    tuple(field for field in fields if field in CATEGORICAL_FIELDS),
+  )
+
+
+def _resample(
+  forecast: 'Forecast',
+  step: timedelta,
+  cubic: bool,
+  numeric: tuple[str, ...],
+  categorical: tuple[str, ...],
+) -> 'dict[str, list[Any]]':
+  slots: list[tuple[datetime, HourlyForecast]] = sorted(
+    (
+      (datetime.combine(daily.date, hourly.time), hourly)
+      for daily in forecast.daily_forecasts
+      for hourly in daily.hourly_forecasts
+    ),
+    key=lambda slot: slot[0],
+  )
+
+  if not slots:
+    return {'datetime': [], **{field: [] for field in numeric + categorical}}
+
+  start = slots[0][0]
+  offsets = tuple((when - start).total_seconds() for when, _ in slots)
+  weights = _weights(offsets, step.total_seconds(), cubic)
+  series = {'datetime': [start + step * i for i in range(len(weights))]}
+
+  for field in numeric:
+    values = [float(getattr(hourly, field)) for _, hourly in slots]
+    tangents = _tangents(offsets, values) if cubic else values
+
+    series[field] = [
+      h00 * values[i] + h10 * tangents[i] + h01 * values[j] + h11 * tangents[j]
+      for _, i, j, h00, h10, h01, h11 in weights
+    ]
+
+  for field in categorical:
+    values = [getattr(hourly, field) for _, hourly in slots]
+
+    series[field] = [values[held] for held, *_ in weights]
+
+  return series
+
+
+def resample(
+  forecast: 'Forecast',
+  step: timedelta = timedelta(hours=1),
+  *,
+  method: str = 'linear',
+  fields: 'Iterable[str] | None' = None,
+) -> 'dict[str, list[Any]]':
+  """
+  Resamples a forecast's hourly forecasts into an evenly spaced series, from its first to its last slot.
+
+  :param forecast: The forecast to be resampled. Its hourly forecasts must include the resampled attributes.
+  :type forecast: :class:`.Forecast`
+  :param step: The spacing between resampled values. Defaults to one hour.
+  :type step: :py:class:`~datetime.timedelta`
+  :param method: Either ``'linear'`` or ``'cubic'`` (monotone). Defaults to ``'linear'``.
+  :type method: :py:class:`str`
+  :param fields: The resampled attributes. Defaults to :py:obj:`None` (every attribute in :data:`NUMERIC_FIELDS` and :data:`CATEGORICAL_FIELDS`).
+  :type fields: :py:class:`~collections.abc.Iterable` [:py:class:`str`] | :py:obj:`None`
+
+  :exception ValueError: ``step``, ``method`` or any of the ``fields`` is invalid.
+
+  :returns: The resampled columns keyed by attribute name, along with a ``'datetime'`` column. Interpolated values are floats.
+  :rtype: :py:class:`dict` [:py:class:`str`, :py:class:`list`]
+  """
+  numeric, categorical = _validate(method, step, fields)
+
+  return _resample(forecast, step, method == 'cubic', numeric, categorical)
+
+
+def resample_many(
+  forecasts: 'Iterable[Forecast]',
+  step: timedelta = timedelta(hours=1),
+  *,
+  method: str = 'linear',
+  fields: 'Iterable[str] | None' = None,
+) -> 'list[dict[str, list[Any]]]':
+  """
+  Resamples a batch of forecasts. This validates the arguments only once, and shares the interpolation weights across forecasts with the same slot layout.
+
+  :param forecasts: The forecasts to be resampled.
+  :type forecasts: :py:class:`~collections.abc.Iterable` [:class:`.Forecast`]
+  :param step: The spacing between resampled values. Defaults to one hour.
+  :type step: :py:class:`~datetime.timedelta`
+  :param method: Either ``'linear'`` or ``'cubic'`` (monotone). Defaults to ``'linear'``.
+  :type method: :py:class:`str`
+  :param fields: The resampled attributes. Defaults to :py:obj:`None` (every supported attribute).
+  :type fields: :py:class:`~collections.abc.Iterable` [:py:class:`str`] | :py:obj:`None`
+
+  :exception ValueError: ``step``, ``method`` or any of the ``fields`` is invalid.
+
+  :returns: The resampled series of each forecast, in order. See :func:`resample` for more information.
+  :rtype: :py:class:`list` [:py:class:`dict` [:py:class:`str`, :py:class:`list`]]
+  """
+  numeric, categorical = _validate(method, step, fields)
+  cubic = method == 'cubic'
+
+  return [
+    _resample(forecast, step, cubic, numeric, categorical) for forecast in forecasts
+  ]
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from asyncio import get_running_loop, wait_for
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING
+from itertools import count
+import asyncio
+import time
+
+from .errors import DeadlineError
+
+if TYPE_CHECKING:
+  from asyncio import Future
+
+
+def _remaining(deadline: float | None) -> float | None:
+  # The amount of seconds left before a time.monotonic() deadline.
+  if deadline is None:
+    return None
+
+  remaining = deadline - time.monotonic()
+
+  if remaining <= 0:
+    raise DeadlineError('The request deadline has passed.')
+
+  return remaining
+
+
+class Scheduler:
+  """
+  Limits how many requests one or more :class:`.Client`\\s have in flight at once.
+
+  Requests waiting for a free slot are queued by priority, and then in the order they arrived, so that interactive lookups jump ahead of background refresh traffic. Requests whose deadline passes while queued are dropped from the queue with a :class:`.DeadlineError`.
+
+  Example:
+
+  .. code-block:: python
+
+    client = python_weather.Client(max_concurrency=32)
+
+    # Background refreshes
+    await client.get('Paris', priority=-1)
+
+    # User-facing lookups
+    await client.get('New York', priority=10, deadline=2.0)
+
+  :param max_concurrency: The maximum amount of requests in flight at once. This should not exceed the connection pool's size.
+  :type max_concurrency: :py:class:`int`
+
+  :exception ValueError: ``max_concurrency`` is not positive.
+  """
+
+  __slots__: tuple[str, ...] = ('__active', '__limit', '__sequence', '__waiters')
+
+  __active: int
+  __limit: int
+  __sequence: count
+  __waiters: 'list[tuple[int, int, Future]]'
+
+  def __init__(self, max_concurrency: int):
+    if max_concurrency < 1:
+      raise ValueError('The maximum concurrency must be positive.')
+
+    self.__active = 0
+    self.__limit = max_concurrency
+    self.__sequence = count()
+    self.__waiters = []
+
+  def __repr__(self) -> str:
+    """The scheduler's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} max_concurrency={self.__limit} active={self.__active}>'
+
+  @property
+  def max_concurrency(self) -> int:
+    """The maximum amount of requests in flight at once."""
+    return self.__limit
+
+  @property
+  def active(self) -> int:
+    """The amount of requests currently in flight."""
+    return self.__active
+
+  @property
+  def waiting(self) -> int:
+    """The amount of requests currently queued."""
+    return sum(not future.done() for _, _, future in self.__waiters)
+
+  async def acquire(self, *, priority: int = 0, deadline: float | None = None) -> None:
+    """
+    Waits until a slot is free. Every successful call must be followed by :meth:`release`.
+
+    :param priority: Requests with a higher priority are granted slots first. Defaults to ``0``.
+    :type priority: :py:class:`int`
+    :param deadline: The :py:func:`time.monotonic` time to give up at. Defaults to :py:obj:`None` (waits indefinitely).
+    :type deadline: :py:class:`float` | :py:obj:`None`
+
+    :exception DeadlineError: The deadline passed before a slot was free.
+    """
+    timeout = _remaining(deadline)
+
+    # Queued requests only exist while every slot is taken.
+    if self.__active < self.__limit:
+      self.__active += 1
+      return
+
+    future = get_running_loop().create_future()
+    heappush(self.__waiters, (-priority, next(self.__sequence), future))
+
+    try:
+      await wait_for(future, timeout)
+    except BaseException as err:
+      # The slot may have been handed over right as the wait was interrupted.
+      if future.done() and not future.cancelled():
+        self.release()
+
+      if isinstance(err, asyncio.TimeoutError):
+        raise DeadlineError('The request deadline passed while queued.') from None
+
+      raise
+
+  def release(self) -> None:
+    """Frees a slot, handing it over to the highest priority queued request if any."""
+    while self.__waiters:
+      _, _, future = heappop(self.__waiters)
+
+      # Waiters whose deadline passed are cancelled, and lazily skipped here.
+      if not future.done():
+        future.set_result(None)
+        return
+
+    self.__active -= 1
@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from datetime import date, datetime, time
+from types import UnionType
+from typing import TYPE_CHECKING, get_args, get_origin
+from enum import Enum
+import json
+import sys
+
+from .enums import HeatIndex, UltraViolet, WindDirection, _clone
+
+try:
+  import orjson
+except ImportError:  # pragma: nocover
+  orjson = None
+
+if TYPE_CHECKING:
+  from collections.abc import Callable
+  from typing import Any, TypeVar
+
+  T = TypeVar('T')
+
+  _Function = Callable[[Any], Any] | None
+  _Plan = tuple[tuple[str, _Function, _Function], ...]
+
+
+_PLANS: dict[type, '_Plan'] = {}
+_MISSING = object()
+_loads: 'Callable[[bytes], Any]' = json.loads if orjson is None else orjson.loads
+
+
+def _dumps(obj: object) -> bytes:
+  if orjson is not None:
+    return orjson.dumps(obj)
+
+  return json.dumps(
+    obj, ensure_ascii=False, separators=(',', ':')
+  ).encode()  # pragma: nocover
+
+
+def _isoformat(value: 'date | time | None') -> str | None:
+  return None if value is None else value.isoformat()
+
+
+def _indexed(value: 'HeatIndex | UltraViolet') -> dict:
+  return {'name': value.name, 'index': value.index}
+
+
+def _wind_direction(value: WindDirection) -> dict:
+  return {'name': value.name, 'degrees': value.degrees}
+
+
+def _name(value: Enum) -> str:
+  return value.name
+
+
+def _optional(parse: 'Callable[[Any], Any]') -> 'Callable[[Any], Any]':
+  return lambda value: None if value is None else parse(value)
+
+
+def _indexed_parser(cls: 'type[HeatIndex | UltraViolet]') -> 'Callable[[dict], Any]':
+  def parse(value: dict) -> 'HeatIndex | UltraViolet':
+    return _clone(cls, value['name'], 'index', value['index'])
+
+  return parse
+
+
+def _parse_wind_direction(value: dict) -> WindDirection:
+  return _clone(WindDirection, value['name'], 'degrees', value['degrees'])
+
+
+def _parser(annotation: 'Any', module_globals: dict) -> 'Callable[[Any], Any] | None':
+  if isinstance(annotation, str):
+    annotation = eval(annotation, module_globals)  # noqa: S307
+
+  origin = get_origin(annotation)
+
+  if origin is list:
+    item_cls = get_args(annotation)[0]
+
+    return lambda items: [from_dict(item_cls, item) for item in items]
+  elif origin is tuple:
+    return tuple
+  elif isinstance(annotation, UnionType):
+    parsers = [_parser(arg, module_globals) for arg in get_args(annotation)]
+    parse = next(filter(None, parsers), None)
+
+    return None if parse is None else _optional(parse)
+  elif annotation in (date, time, datetime):
+    return annotation.fromisoformat
+  elif annotation in (HeatIndex, UltraViolet):
+    return _indexed_parser(annotation)
+  elif annotation is WindDirection:
+    return _parse_wind_direction
+  elif isinstance(annotation, type) and issubclass(annotation, Enum):
+    return annotation.__getitem__
+
+
+def _converter(
+  annotation: 'Any', module_globals: dict
+) -> 'Callable[[Any], Any] | None':
+  if isinstance(annotation, str):
+    annotation = eval(annotation, module_globals)  # noqa: S307
+
+  origin = get_origin(annotation)
+
+  if origin is list:
+    item_plan = _plan(get_args(annotation)[0])
+
+    return lambda items: [_convert(item, item_plan) for item in items]
+  elif origin is tuple:
+    return list
+  elif isinstance(annotation, UnionType):
+    converters = [_converter(arg, module_globals) for arg in get_args(annotation)]
+
+    return next(filter(None, converters), None)
+  elif annotation in (date, time, datetime):
+    return _isoformat
+  elif annotation in (HeatIndex, UltraViolet):
+    return _indexed
+  elif annotation is WindDirection:
+    return _wind_direction
+  elif isinstance(annotation, type) and issubclass(annotation, Enum):
+    return _name
+
+
+def _plan(cls: type) -> '_Plan':
+  if (plan := _PLANS.get(cls)) is not None:
+    return plan
+
+  fields = []
+
+  for base in reversed(cls.__mro__):
+    annotations = base.__dict__.get('__annotations__', {})
+    module_globals = vars(sys.modules[base.__module__])
+
+    for name in base.__dict__.get('__slots__', ()):
+      if not name.startswith('_'):
+        fields.append(
+          (
+            name,
+            _converter(annotations[name], module_globals),
+            _parser(annotations[name], module_globals),
+          )
+        )
+
+  plan = _PLANS[cls] = tuple(fields)
+
+  return plan
+
+
+def _convert(obj: object, plan: '_Plan') -> dict:
+  output = {}
+
+  for name, converter, _ in plan:
+    value = getattr(obj, name, _MISSING)
+
+    if value is not _MISSING:
+      output[name] = value if converter is None else converter(value)
+
+  return output
+
+
+def to_dict(obj: object) -> dict:
+  """
+  Converts a forecast into a dictionary of JSON-ready primitives.
+
+  Enums are converted into their names, with the exception of :class:`.HeatIndex` and :class:`.UltraViolet` (``{'name', 'index'}``) and :class:`.WindDirection` (``{'name', 'degrees'}``). Dates and times are converted into ISO 8601 strings. Attributes left unset by a ``fields`` projection are omitted.
+
+  :param obj: The forecast to be converted.
+  :type obj: :class:`.BaseForecast` | :class:`.DailyForecast`
+
+  :returns: The converted forecast.
+  :rtype: :py:class:`dict`
+  """
+  return _convert(obj, _plan(obj.__class__))
+
+
+def from_dict(cls: type['T'], data: dict) -> 'T':
+  """
+  Rebuilds a forecast from a dictionary produced by :func:`to_dict`, without the original API response.
+
+  :param cls: The forecast's class, e.g. :class:`.Forecast`.
+  :type cls: :py:class:`type`
+  :param data: The converted forecast. Missing attributes are left unset, with the exception of nested forecast lists which become empty instead.
+  :type data: :py:class:`dict`
+
+  :exception KeyError: ``data`` contains an invalid enum name.
+  :exception ValueError: ``data`` contains an invalid date or time.
+
+  :returns: The rebuilt forecast.
+  :rtype: :class:`.BaseForecast` | :class:`.DailyForecast`
+  """
+  obj = cls.__new__(cls)
+
+  for name, _, parse in _plan(cls):
+    value = data.get(name, _MISSING)
+
+    if value is not _MISSING:
+      setattr(obj, name, value if parse is None else parse(value))
+    elif name in cls._nested:
+      setattr(obj, name, [])
+
+  return obj
+
+
+def to_json_bytes(obj: object) -> bytes:
+  """
+  Serializes a forecast into UTF-8 encoded JSON. This uses :mod:`orjson` if it's installed.
+
+  :param obj: The forecast to be serialized.
+  :type obj: :class:`.BaseForecast` | :class:`.DailyForecast`
+
+  :returns: The serialized forecast.
+  :rtype: :py:class:`bytes`
+  """
+  return _dumps(to_dict(obj))
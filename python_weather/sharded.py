@@ -0,0 +1,393 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from asyncio import gather, get_running_loop, run
+from multiprocessing import get_context
+from hashlib import blake2b
+from threading import Thread
+from typing import TYPE_CHECKING
+from bisect import bisect
+from itertools import count
+import os
+
+from .location import LocationNormalizer
+from .errors import Error
+
+if TYPE_CHECKING:
+  from asyncio import AbstractEventLoop, Future, Task
+  from multiprocessing.connection import Connection
+  from multiprocessing.process import BaseProcess
+  from typing import Any
+
+  from .forecast import CurrentForecast, Forecast
+
+
+def _point(key: str) -> int:
+  return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+
+def _receive(connection: 'Connection') -> 'Any':
+  try:
+    return connection.recv()
+  except (EOFError, OSError):
+    return None
+
+
+async def _answer(
+  client: 'Any',
+  replies: 'Connection',
+  request_id: int,
+  method: str,
+  location: str,
+  kwargs: dict,
+) -> None:
+  try:
+    reply = request_id, True, await getattr(client, method)(location, **kwargs)
+  except Exception as err:
+    reply = request_id, False, err
+
+  try:
+    replies.send(reply)
+  except Exception as err:
+    # Usually an error which can't be pickled, such as one carrying a connection.
+    replies.send(
+      (request_id, False, Error(f'{reply[2]!r} could not be sent back: {err}'))
+    )
+
+
+async def _serve(requests: 'Connection', replies: 'Connection', kwargs: dict) -> None:
+  from .client import Client
+
+  try:
+    client = Client(**kwargs)
+  except Exception as err:
+    replies.send((None, False, err))
+
+    return
+
+  replies.send((None, True, None))
+
+  loop = get_running_loop()
+  tasks: 'set[Task]' = set()
+
+  try:
+    while (message := await loop.run_in_executor(None, _receive, requests)) is not None:
+      task = loop.create_task(_answer(client, replies, *message))
+      tasks.add(task)
+      task.add_done_callback(tasks.discard)
+
+    await gather(*tasks)
+  finally:
+    await client.close()
+    replies.close()
+
+
+def _work(
+  requests: 'Connection', replies: 'Connection', kwargs: dict
+) -> None:  # pragma: nocover
+  run(_serve(requests, replies, kwargs))
+
+
+class ShardedClient:
+  """
+  A :class:`.Client` spread across several worker processes, for workloads that outgrow a single event loop and CPU core.
+
+  Every worker process runs its own event loop, :class:`.Client` and connection pool. Requests are routed to workers by consistent hashing of their normalized location, so a location is always served by the same worker and that worker's ``cache`` stays hot. Forecasts are parsed by the workers and sent back pickled, and so are the errors they raise.
+
+  This object must be created and used from one event loop, like a :class:`.Client`. Creating it blocks until every worker is ready. Like any program using the ``'spawn'`` start method, the main module must be guarded with ``if __name__ == '__main__':``.
+
+  Examples:
+
+  .. code-block:: python
+
+    # Explicit cleanup
+    client = python_weather.ShardedClient(workers=4, cache=python_weather.MemoryCache())
+
+    # ...
+
+    await client.close()
+
+    # Implicit cleanup
+    async with python_weather.ShardedClient(workers=4) as client:
+      # ...
+
+  :param workers: The amount of worker processes. Defaults to :py:obj:`None` (one per CPU core).
+  :type workers: :py:class:`int` | :py:obj:`None`
+  :param replicas: The amount of points each worker has on the hash ring. More points spread locations more evenly. Defaults to ``64``.
+  :type replicas: :py:class:`int`
+  :param start_method: The :py:mod:`multiprocessing` start method used for the workers. Defaults to ``'spawn'``, since forking a process with a running event loop is unsafe.
+  :type start_method: :py:class:`str`
+  :param kwargs: Keyword arguments passed to every worker's :class:`.Client`, with the exception of ``session``. They must be picklable, and every worker gets a copy of them, so objects such as a :class:`.RateLimiter` or :class:`.MemoryCache` apply per worker. A :class:`.DiskCache` is shared by every worker.
+
+  :exception Error: ``session`` is specified.
+  :exception ValueError: ``workers`` or ``replicas`` is not positive.
+  :exception Exception: Any error raised by a worker's :class:`.Client` constructor.
+  """
+
+  __slots__: tuple[str, ...] = (
+    '__ids',
+    '__loop',
+    '__normalizer',
+    '__pending',
+    '__points',
+    '__processes',
+    '__readers',
+    '__replies',
+    '__requests',
+    '__shards',
+  )
+
+  __ids: 'count[int]'
+  __loop: 'AbstractEventLoop | None'
+  __normalizer: LocationNormalizer
+  __pending: 'dict[int, tuple[int, Future]]'
+  __points: list[int]
+  __processes: 'list[BaseProcess]'
+  __readers: list[Thread]
+  __replies: 'list[Connection]'
+  __requests: 'list[Connection] | None'
+  __shards: list[int]
+
+  def __init__(
+    self,
+    *,
+    workers: int | None = None,
+    replicas: int = 64,
+    start_method: str = 'spawn',
+    **kwargs: 'Any',
+  ):
+    if 'session' in kwargs:
+      raise Error('A ShardedClient manages its own sessions.')
+
+    if workers is None:
+      workers = os.cpu_count() or 1
+
+    if workers < 1 or replicas < 1:
+      raise ValueError('The amount of workers and replicas must be positive.')
+
+    ring = sorted(
+      (_point(f'{worker}:{replica}'), worker)
+      for worker in range(workers)
+      for replica in range(replicas)
+    )
+
+    self.__points = [point for point, _ in ring]
+    self.__shards = [worker for _, worker in ring]
+    self.__normalizer = kwargs.get('normalizer') or LocationNormalizer()
+    self.__ids = count()
+    self.__loop = None
+    self.__pending = {}
+    self.__processes = []
+    self.__readers = []
+    self.__replies = []
+    self.__requests = []
+
+    context = get_context(start_method)
+
+    try:
+      for worker in range(workers):
+        request_reader, request_writer = context.Pipe(duplex=False)
+        reply_reader, reply_writer = context.Pipe(duplex=False)
+        process = context.Process(
+          target=_work,
+          args=(request_reader, reply_writer, kwargs),
+          name=f'python_weather.ShardedClient-{worker}',
+          daemon=True,
+        )
+
+        self.__processes.append(process)
+        self.__requests.append(request_writer)
+        self.__replies.append(reply_reader)
+
+        process.start()
+        request_reader.close()
+        reply_writer.close()
+
+      for reply_reader in self.__replies:
+        if (handshake := _receive(reply_reader)) is None:
+          raise Error('A worker process exited during startup.')  # pragma: nocover
+        elif not handshake[1]:
+          raise handshake[2]
+    except BaseException:
+      self.__stop()
+      raise
+
+    for worker, reply_reader in enumerate(self.__replies):
+      reader = Thread(
+        target=self.__receive,
+        args=(worker, reply_reader),
+        name=f'python_weather.ShardedClient-{worker}-reader',
+        daemon=True,
+      )
+      reader.start()
+      self.__readers.append(reader)
+
+  def __repr__(self) -> str:
+    """The client's debug string representation."""
+    return (
+      f'<{__class__.__module__}.{__class__.__name__} workers={len(self.__processes)}>'
+    )
+
+  @property
+  def workers(self) -> int:
+    """The amount of worker processes."""
+    return len(self.__processes)
+
+  def shard(self, location: str) -> int:
+    """
+    Resolves the worker a location is routed to.
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+
+    :exception TypeError: The specified location is not a string.
+    :exception ValueError: The specified location is empty.
+
+    :returns: The worker's index, from ``0`` to :attr:`workers` (exclusive).
+    :rtype: :py:class:`int`
+    """
+    position = bisect(self.__points, _point(self.__normalizer.normalize(location)))
+
+    return self.__shards[position % len(self.__shards)]
+
+  def __receive(self, worker: int, connection: 'Connection') -> None:
+    # Replies are unpickled in this thread, so that the event loop is only woken up with finished forecasts.
+    while (reply := _receive(connection)) is not None:
+      self.__notify(self.__resolve, *reply)
+
+    self.__notify(self.__fail, worker)
+
+  def __notify(self, callback: 'Any', *args: 'Any') -> None:
+    if self.__loop is not None:
+      try:
+        self.__loop.call_soon_threadsafe(callback, *args)
+      except RuntimeError:  # pragma: nocover
+        pass
+
+  def __resolve(self, request_id: int, ok: bool, result: 'Any') -> None:
+    if (entry := self.__pending.get(request_id)) is None or entry[1].done():
+      return
+    elif ok:
+      entry[1].set_result(result)
+    else:
+      entry[1].set_exception(result)
+
+  def __fail(self, worker: int) -> None:
+    for shard, future in self.__pending.values():
+      if shard == worker and not future.done():
+        future.set_exception(Error('The worker process exited.'))
+
+  async def __request(self, method: str, location: str, kwargs: dict) -> 'Any':
+    if self.__requests is None:
+      raise Error('Client session is already closed.')
+
+    worker = self.shard(location)
+    self.__loop = loop = get_running_loop()
+    request_id = next(self.__ids)
+    future = loop.create_future()
+    self.__pending[request_id] = worker, future
+
+    try:
+      try:
+        self.__requests[worker].send((request_id, method, location, kwargs))
+      except OSError as err:
+        raise Error('The worker process exited.') from err
+
+      return await future
+    finally:
+      del self.__pending[request_id]
+
+  async def get(self, location: str, **kwargs: 'Any') -> 'Forecast':
+    """
+    Fetches a weather forecast for a specific location from the worker it is routed to.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = await client.get('New York')
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+    :param kwargs: Keyword arguments passed to :meth:`.Client.get`. They must be picklable.
+
+    :exception TypeError: The specified location or any of the specified fields is not a string.
+    :exception ValueError: The specified location is empty or any of the specified fields is unknown.
+    :exception Error: The client is already closed or the worker process exited.
+    :exception RequestError: The client received a non-favorable response from the API.
+    :exception DeadlineError: The forecast could not be fetched within ``deadline`` seconds.
+    :exception CircuitOpenError: The upstream host is unavailable and no stale forecast is cached.
+
+    :returns: The requested weather forecast.
+    :rtype: Forecast
+    """
+    return await self.__request('get', location, kwargs)
+
+  async def get_current(self, location: str, **kwargs: 'Any') -> 'CurrentForecast':
+    """
+    Fetches only the current weather conditions for a specific location from the worker it is routed to.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = await client.get_current('New York')
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+    :param kwargs: Keyword arguments passed to :meth:`.Client.get_current`. They must be picklable.
+
+    :exception TypeError: The specified location or any of the specified fields is not a string.
+    :exception ValueError: The specified location is empty or any of the specified fields is unknown.
+    :exception Error: The client is already closed or the worker process exited.
+    :exception RequestError: The client received a non-favorable response from the API.
+    :exception DeadlineError: The current weather conditions could not be fetched within ``deadline`` seconds.
+    :exception CircuitOpenError: The upstream host is unavailable and no stale current weather conditions are cached.
+
+    :returns: The requested current weather conditions.
+    :rtype: CurrentForecast
+    """
+    return await self.__request('get_current', location, kwargs)
+
+  def __stop(self) -> None:
+    requests = self.__requests or ()
+    self.__requests = None
+
+    # Closing the request pipes lets every worker finish its in-flight requests and exit.
+    for connection in requests:
+      connection.close()
+
+    for process in self.__processes:
+      if process.pid is not None:
+        process.join(5.0)
+
+        if process.is_alive():  # pragma: nocover
+          process.terminate()
+          process.join()
+
+    for reader in self.__readers:
+      reader.join()
+
+    for connection in self.__replies:
+      connection.close()
+
+  async def close(self) -> None:
+    """
+    Closes the client and waits for its worker processes to exit. Subsequent calls are no-op.
+
+    Example:
+
+    .. code-block:: python
+
+      await client.close()
+    """
+    if self.__requests is not None:
+      await get_running_loop().run_in_executor(None, self.__stop)
+
+  async def __aenter__(self) -> 'ShardedClient':
+    """Starts using the client. This method is no-op and just returns itself."""
+    return self
+
+  async def __aexit__(self, *_, **__) -> None:
+    """Closes the client."""
+    await self.close()
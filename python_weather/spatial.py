@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from typing import TYPE_CHECKING
+from math import asin, cos, radians, sin, sqrt
+
+if TYPE_CHECKING:
+  from typing import Any
+
+EARTH_RADIUS = 6371.0088
+"""The Earth's mean radius in kilometers."""
+
+_KM_PER_DEGREE = 111.19508
+
+
+def distance(
+  latitude: float, longitude: float, other_latitude: float, other_longitude: float
+) -> float:
+  """
+  Computes the great-circle distance between two points with the haversine formula.
+
+  :param latitude: The first point's latitude.
+  :type latitude: :py:class:`float`
+  :param longitude: The first point's longitude.
+  :type longitude: :py:class:`float`
+  :param other_latitude: The second point's latitude.
+  :type other_latitude: :py:class:`float`
+  :param other_longitude: The second point's longitude.
+  :type other_longitude: :py:class:`float`
+
+  :returns: The distance in kilometers.
+  :rtype: :py:class:`float`
+  """
+  half_latitude = radians(other_latitude - latitude) / 2
+  half_longitude = radians(other_longitude - longitude) / 2
+  a = (
+    sin(half_latitude) ** 2
+    + cos(radians(latitude)) * cos(radians(other_latitude)) * sin(half_longitude) ** 2
+  )
+
+  return 2 * EARTH_RADIUS * asin(min(1.0, sqrt(a)))
+
+
+class SpatialIndex:
+  """
+  A grid index of points on Earth for nearest-neighbour queries.
+
+  Points are bucketed into cells of ``cell_size`` degrees, so that a query only measures the points in the few cells overlapping its radius.
+
+  Example:
+
+  .. code-block:: python
+
+    index = python_weather.SpatialIndex()
+
+    index.add(40.71, -74.01, 'New York')
+
+    index.nearest(40.715, -74.005, 1.0)  # (0.69..., 40.71, -74.01, 'New York')
+
+  :param cell_size: The size of each grid cell in degrees. This should be in the same order of magnitude as the typical query radius. Defaults to ``0.1`` (around 11 kilometers).
+  :type cell_size: :py:class:`float`
+
+  :exception ValueError: ``cell_size`` is not positive.
+  """
+
+  __slots__: tuple[str, ...] = ('__cell_size', '__cells', '__count')
+
+  __cell_size: float
+  __cells: dict[tuple[int, int], dict[tuple[float, float], 'Any']]
+  __count: int
+
+  def __init__(self, *, cell_size: float = 0.1):
+    if cell_size <= 0:
+      raise ValueError('The cell size must be positive.')
+
+    self.__cell_size = cell_size
+    self.__cells = {}
+    self.__count = 0
+
+  def __repr__(self) -> str:
+    """The index's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} cell_size={self.__cell_size} points={self.__count}>'
+
+  def __len__(self) -> int:
+    """The amount of indexed points."""
+    return self.__count
+
+  def __cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+    return int(latitude // self.__cell_size), int(longitude // self.__cell_size)
+
+  def add(self, latitude: float, longitude: float, value: 'Any') -> None:
+    """
+    Indexes a point, replacing the value of an identical point.
+
+    :param latitude: The point's latitude.
+    :type latitude: :py:class:`float`
+    :param longitude: The point's longitude.
+    :type longitude: :py:class:`float`
+    :param value: The value associated with this point.
+    """
+    points = self.__cells.setdefault(self.__cell(latitude, longitude), {})
+    self.__count += (latitude, longitude) not in points
+    points[latitude, longitude] = value
+
+  def remove(self, latitude: float, longitude: float) -> None:
+    """
+    Removes a point, if it's indexed.
+
+    :param latitude: The point's latitude.
+    :type latitude: :py:class:`float`
+    :param longitude: The point's longitude.
+    :type longitude: :py:class:`float`
+    """
+    cell = self.__cell(latitude, longitude)
+    points = self.__cells.get(cell)
+
+    if points is not None and (latitude, longitude) in points:
+      del points[latitude, longitude]
+      self.__count -= 1
+
+      if not points:
+        del self.__cells[cell]
+
+  def within(
+    self, latitude: float, longitude: float, radius: float
+  ) -> 'list[tuple[float, float, float, Any]]':
+    """
+    Finds every point within a radius.
+
+    :param latitude: The center's latitude.
+    :type latitude: :py:class:`float`
+    :param longitude: The center's longitude.
+    :type longitude: :py:class:`float`
+    :param radius: The radius in kilometers.
+    :type radius: :py:class:`float`
+
+    :returns: The distance in kilometers, latitude, longitude and value of each point, closest first.
+    :rtype: :py:class:`list` [:py:class:`tuple` [:py:class:`float`, :py:class:`float`, :py:class:`float`, Any]]
+    """
+    latitude_span = radius / _KM_PER_DEGREE
+    longitude_span = latitude_span / max(
+      cos(radians(min(abs(latitude) + latitude_span, 90.0))), 1e-9
+    )
+    south, west = self.__cell(latitude - latitude_span, longitude - longitude_span)
+    north, east = self.__cell(latitude + latitude_span, longitude + longitude_span)
+
+    if longitude_span >= 180.0:
+      # Near the poles, every longitude is within reach.
+      cells = [cell for cell in self.__cells if south <= cell[0] <= north]
+    else:
+      offsets = (0,)
+
+      # Queries crossing the antimeridian also scan the wrapped-around columns.
+      if not -180.0 <= longitude - longitude_span <= longitude + longitude_span < 180.0:
+        wrap = round(360.0 / self.__cell_size)
+        offsets = (0, -wrap, wrap)
+
+      cells = [
+        (row, column + offset)
+        for row in range(south, north + 1)
+        for column in range(west, east + 1)
+        for offset in offsets
+      ]
+
+    matches = []
+
+    for cell in cells:
+      for (point_latitude, point_longitude), value in self.__cells.get(
+        cell, {}
+      ).items():
+        point_distance = distance(latitude, longitude, point_latitude, point_longitude)
+
+        if point_distance <= radius:
+          matches.append((point_distance, point_latitude, point_longitude, value))
+
+    matches.sort(key=lambda match: match[0])
+
+    return matches
+
+  def nearest(
+    self, latitude: float, longitude: float, radius: float
+  ) -> 'tuple[float, float, float, Any] | None':
+    """
+    Finds the closest point within a radius.
+
+    :param latitude: The center's latitude.
+    :type latitude: :py:class:`float`
+    :param longitude: The center's longitude.
+    :type longitude: :py:class:`float`
+    :param radius: The radius in kilometers.
+    :type radius: :py:class:`float`
+
+    :returns: The distance in kilometers, latitude, longitude and value of the closest point, or :py:obj:`None` if there is none within ``radius``.
+    :rtype: :py:class:`tuple` [:py:class:`float`, :py:class:`float`, :py:class:`float`, Any] | :py:obj:`None`
+    """
+    matches = self.within(latitude, longitude, radius)
+
+    return matches[0] if matches else None
+
+  def clear(self) -> None:
+    """Removes every point."""
+    self.__cells.clear()
+    self.__count = 0
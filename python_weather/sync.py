@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from asyncio import new_event_loop, run_coroutine_threadsafe
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from threading import Lock, Thread
+from typing import TYPE_CHECKING
+
+from .errors import Error
+from .client import Client
+
+if TYPE_CHECKING:
+  from asyncio import AbstractEventLoop
+  from collections.abc import Coroutine
+  from typing import Any, TypeVar
+
+  from .constants import _Unit
+  from .forecast import CurrentForecast, Forecast
+  from .enums import Locale
+
+  T = TypeVar('T')
+
+
+class SyncClient:
+  """
+  A blocking facade over :class:`.Client` for synchronous code, such as WSGI apps or thread-pool workers.
+
+  A single event loop is kept running in a dedicated background thread for the lifetime of this object, so every call reuses the same :class:`.Client` and its connection pool instead of paying for a fresh event loop and TCP/TLS handshake. This object can be shared across threads.
+
+  Examples:
+
+  .. code-block:: python
+
+    # Explicit cleanup
+    client = python_weather.SyncClient(unit=python_weather.IMPERIAL)
+
+    # ...
+
+    client.close()
+
+    # Implicit cleanup
+    with python_weather.SyncClient(unit=python_weather.IMPERIAL) as client:
+      # ...
+
+  :param kwargs: Keyword arguments passed to the underlying :class:`.Client`, with the exception of ``session`` since it is bound to the background event loop.
+
+  :exception Error: Any of the keyword arguments are invalid for :class:`.Client`.
+  """
+
+  __slots__: tuple[str, ...] = ('__client', '__lock', '__loop', '__thread')
+
+  __client: Client | None
+  __lock: Lock
+  __loop: 'AbstractEventLoop'
+  __thread: Thread
+
+  def __init__(self, **kwargs: 'Any'):
+    if 'session' in kwargs:
+      raise Error('A SyncClient manages its own session.')
+
+    self.__client = None
+    self.__lock = Lock()
+    self.__loop = new_event_loop()
+    self.__thread = Thread(
+      target=self.__loop.run_forever, name='python_weather.SyncClient', daemon=True
+    )
+    self.__thread.start()
+
+    try:
+      self.__client = self.__run(__class__.__create(kwargs))
+    except BaseException:
+      self.__stop()
+      raise
+
+  @staticmethod
+  async def __create(kwargs: dict) -> Client:
+    return Client(**kwargs)
+
+  def __run(self, coro: 'Coroutine[Any, Any, T]', timeout: float | None = None) -> 'T':
+    future = run_coroutine_threadsafe(coro, self.__loop)
+
+    try:
+      return future.result(timeout)
+    except FutureTimeoutError:
+      future.cancel()
+
+      raise TimeoutError(f'No response within {timeout} seconds.') from None
+
+  def __stop(self) -> None:
+    self.__loop.call_soon_threadsafe(self.__loop.stop)
+    self.__thread.join()
+    self.__loop.close()
+
+  @property
+  def __active_client(self) -> Client:
+    if self.__client is None:
+      raise Error('Client session is already closed.')
+
+    return self.__client
+
+  def __repr__(self) -> str:
+    """The client's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} {self.__client!r}>'
+
+  @property
+  def unit(self) -> '_Unit':
+    """The measuring unit used."""
+    return self.__active_client.unit
+
+  @unit.setter
+  def unit(self, to: '_Unit') -> None:
+    """
+    Sets the default measuring unit used.
+
+    :param to: The new default measuring unit to be used.
+
+    :exception Error: ``to`` is not either :data:`~.constants.METRIC` or :data:`~.constants.IMPERIAL`.
+    """
+    self.__active_client.unit = to
+
+  @property
+  def locale(self) -> 'Locale':
+    """The localization used."""
+    return self.__active_client.locale
+
+  @locale.setter
+  def locale(self, to: 'Locale') -> None:
+    """
+    Sets the default localization used.
+
+    :param to: The new :class:`.Locale` to be used.
+    :type to: :class:`.Locale`
+
+    :exception Error: ``to`` is not a part of the :class:`.Locale` enum.
+    """
+    self.__active_client.locale = to
+
+  def get(
+    self, location: str, *, timeout: float | None = None, **kwargs: 'Any'
+  ) -> 'Forecast':
+    """
+    Fetches a weather forecast for a specific location, blocking until it's available.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = client.get('New York')
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+    :param timeout: Maximum amount of seconds to block for. Defaults to :py:obj:`None` (blocks indefinitely).
+    :type timeout: :py:class:`float` | :py:obj:`None`
+    :param kwargs: Keyword arguments passed to :meth:`.Client.get`.
+
+    :exception TypeError: The specified location is not a string.
+    :exception ValueError: The specified location is empty.
+    :exception Error: The client is already closed.
+    :exception RequestError: The client received a non-favorable response from the API.
+    :exception TimeoutError: The forecast did not arrive within ``timeout`` seconds.
+
+    :returns: The requested weather forecast.
+    :rtype: Forecast
+    """
+    return self.__run(self.__active_client.get(location, **kwargs), timeout)
+
+  def get_current(
+    self, location: str, *, timeout: float | None = None, **kwargs: 'Any'
+  ) -> 'CurrentForecast':
+    """
+    Fetches only the current weather conditions for a specific location, blocking until they're available.
+
+    Example:
+
+    .. code-block:: python
+
+      weather = client.get_current('New York')
+
+    :param location: The requested location.
+    :type location: :py:class:`str`
+    :param timeout: Maximum amount of seconds to block for. Defaults to :py:obj:`None` (blocks indefinitely).
+    :type timeout: :py:class:`float` | :py:obj:`None`
+    :param kwargs: Keyword arguments passed to :meth:`.Client.get_current`.
+
+    :exception TypeError: The specified location is not a string.
+    :exception ValueError: The specified location is empty.
+    :exception Error: The client is already closed.
+    :exception RequestError: The client received a non-favorable response from the API.
+    :exception TimeoutError: The current weather conditions did not arrive within ``timeout`` seconds.
+
+    :returns: The requested current weather conditions.
+    :rtype: CurrentForecast
+    """
+    return self.__run(self.__active_client.get_current(location, **kwargs), timeout)
+
+  def close(self) -> None:
+    """
+    Closes the client and stops its background event loop. Subsequent calls are no-op.
+
+    Example:
+
+    .. code-block:: python
+
+      client.close()
+    """
+    with self.__lock:
+      if self.__client is None:
+        return
+
+      client = self.__client
+      self.__client = None
+
+      try:
+        self.__run(client.close())
+      finally:
+        self.__stop()
+
+  def __enter__(self) -> 'SyncClient':
+    """Starts using the client. This method is no-op and just returns itself."""
+    return self
+
+  def __exit__(self, *_, **__) -> None:
+    """Closes the client."""
+    self.close()
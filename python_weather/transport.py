@@ -0,0 +1,469 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2021-2026 null8626
+
+from aiohttp.compression_utils import HAS_BROTLI, HAS_ZSTD
+from aiohttp import ClientError, ClientResponseError
+from collections import Counter, deque
+from typing import TYPE_CHECKING
+from asyncio import sleep
+import asyncio
+from random import Random
+import struct
+import gzip
+import os
+
+from .errors import RequestError
+
+if TYPE_CHECKING:
+  from collections.abc import Mapping
+
+  from aiohttp import ClientSession
+
+
+_LENGTH = struct.Struct('>I')
+
+# Every content coding aiohttp can decode in this environment. Brotli and Zstandard need the `compression` extra.
+_ACCEPT_ENCODING = ', '.join(
+  (
+    'gzip',
+    'deflate',
+    *(('br',) if HAS_BROTLI else ()),
+    *(('zstd',) if HAS_ZSTD else ()),
+  )
+)
+
+
+def load_archive(path: 'str | os.PathLike[str]') -> dict[str, bytes]:
+  """
+  Loads raw responses saved by a :class:`.RecordingTransport`.
+
+  :param path: The archive's file path.
+  :type path: :py:class:`str` | :py:class:`os.PathLike`
+
+  :exception OSError: The archive could not be read.
+  :exception ValueError: The archive is corrupted.
+
+  :returns: The raw response bodies, keyed by their request URL.
+  :rtype: :py:class:`dict` [:py:class:`str`, :py:class:`bytes`]
+  """
+  responses = {}
+
+  with gzip.open(path, 'rb') as f:
+    data = f.read()
+
+  offset = 0
+
+  while offset < len(data):
+    try:
+      (url_length,) = _LENGTH.unpack_from(data, offset)
+      offset += _LENGTH.size
+      url = data[offset : offset + url_length].decode()
+      offset += url_length
+
+      (body_length,) = _LENGTH.unpack_from(data, offset)
+      offset += _LENGTH.size
+    except (struct.error, UnicodeDecodeError):
+      raise ValueError(f'{os.fspath(path)!r} is not a valid archive.') from None
+
+    if offset + body_length > len(data):
+      raise ValueError(f'{os.fspath(path)!r} is not a valid archive.')
+
+    responses[url] = data[offset : offset + body_length]
+    offset += body_length
+
+  return responses
+
+
+def save_archive(
+  path: 'str | os.PathLike[str]', responses: 'Mapping[str, bytes]'
+) -> None:
+  """
+  Saves raw responses into a gzip-compressed archive readable by :func:`load_archive`.
+
+  :param path: The archive's file path.
+  :type path: :py:class:`str` | :py:class:`os.PathLike`
+  :param responses: The raw response bodies, keyed by their request URL.
+  :type responses: :py:class:`~collections.abc.Mapping` [:py:class:`str`, :py:class:`bytes`]
+
+  :exception OSError: The archive could not be written.
+  """
+  with gzip.open(path, 'wb') as f:
+    for url, body in responses.items():
+      encoded_url = url.encode()
+
+      f.write(_LENGTH.pack(len(encoded_url)))
+      f.write(encoded_url)
+      f.write(_LENGTH.pack(len(body)))
+      f.write(body)
+
+
+class Transport:
+  """
+  The base class for transports, which perform the actual HTTP requests on behalf of a :class:`.Client`.
+
+  Subclasses must override :meth:`request`, and may override :meth:`close`.
+  """
+
+  __slots__: tuple[str, ...] = ()
+
+  async def request(
+    self, session: 'ClientSession', url: str, headers: dict[str, str]
+  ) -> bytes:
+    """
+    Performs a GET request.
+
+    :param session: The client's session.
+    :type session: :class:`~aiohttp.ClientSession`
+    :param url: The requested URL.
+    :type url: :py:class:`str`
+    :param headers: The request headers.
+    :type headers: :py:class:`dict` [:py:class:`str`, :py:class:`str`]
+
+    :exception RequestError: The request failed. The client retries these.
+
+    :returns: The raw response body.
+    :rtype: :py:class:`bytes`
+    """
+    raise NotImplementedError
+
+  async def close(self) -> None:
+    """Called once the client using this transport is closed. This method is no-op by default."""
+
+  def __repr__(self) -> str:
+    """The transport's debug string representation."""
+    return f'<{self.__class__.__module__}.{self.__class__.__name__}>'
+
+
+class Transfer:
+  """The size of a single response, as recorded by :class:`.TransferStats`."""
+
+  __slots__: tuple[str, ...] = (
+    'compressed_bytes',
+    'decompressed_bytes',
+    'encoding',
+    'url',
+  )
+
+  compressed_bytes: int
+  """The amount of bytes received over the network."""
+
+  decompressed_bytes: int
+  """The amount of bytes after decompression."""
+
+  encoding: str | None
+  """The response's content coding, e.g. ``'gzip'``, or :py:obj:`None` if it wasn't compressed."""
+
+  url: str
+  """The requested URL."""
+
+  def __init__(
+    self,
+    url: str,
+    encoding: str | None,
+    compressed_bytes: int,
+    decompressed_bytes: int,
+  ):
+    self.url = url
+    self.encoding = encoding
+    self.compressed_bytes = compressed_bytes
+    self.decompressed_bytes = decompressed_bytes
+
+  def __repr__(self) -> str:
+    """The transfer's debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} url={self.url!r} encoding={self.encoding!r} compressed_bytes={self.compressed_bytes} decompressed_bytes={self.decompressed_bytes}>'
+
+
+class TransferStats:
+  """
+  Accounts for the bandwidth used by an :class:`.HTTPTransport`.
+
+  Example:
+
+  .. code-block:: python
+
+    transport = python_weather.HTTPTransport()
+
+    async with python_weather.Client(transport=transport) as client:
+      await client.get('New York')
+
+    print(f'{transport.stats.compression_ratio:.1f}x smaller over the wire')
+
+  :param history: The amount of recent :class:`.Transfer`\\s kept in :attr:`recent`. Defaults to ``128``.
+  :type history: :py:class:`int`
+
+  :exception ValueError: ``history`` is negative.
+  """
+
+  __slots__: tuple[str, ...] = (
+    '__recent',
+    'compressed_bytes',
+    'decompressed_bytes',
+    'encodings',
+    'requests',
+  )
+
+  __recent: deque[Transfer]
+
+  compressed_bytes: int
+  """The total amount of bytes received over the network."""
+
+  decompressed_bytes: int
+  """The total amount of bytes after decompression."""
+
+  encodings: Counter
+  """The amount of responses received with each content coding, with :py:obj:`None` for uncompressed ones."""
+
+  requests: int
+  """The amount of successful responses."""
+
+  def __init__(self, *, history: int = 128):
+    if history < 0:
+      raise ValueError('The history must not be negative.')
+
+    self.__recent = deque(maxlen=history)
+    self.compressed_bytes = 0
+    self.decompressed_bytes = 0
+    self.encodings = Counter()
+    self.requests = 0
+
+  def __repr__(self) -> str:
+    """The statistics' debug string representation."""
+    return f'<{__class__.__module__}.{__class__.__name__} requests={self.requests} compressed_bytes={self.compressed_bytes} decompressed_bytes={self.decompressed_bytes}>'
+
+  @property
+  def recent(self) -> tuple[Transfer, ...]:
+    """The most recent transfers, oldest first."""
+    return tuple(self.__recent)
+
+  @property
+  def compression_ratio(self) -> float:
+    """How many times smaller the responses were over the network, or ``1.0`` if nothing was received yet."""
+    return (
+      self.decompressed_bytes / self.compressed_bytes if self.compressed_bytes else 1.0
+    )
+
+  def record(self, transfer: Transfer) -> None:
+    """
+    Records a response.
+
+    :param transfer: The response's size.
+    :type transfer: :class:`.Transfer`
+    """
+    self.__recent.append(transfer)
+    self.compressed_bytes += transfer.compressed_bytes
+    self.decompressed_bytes += transfer.decompressed_bytes
+    self.encodings[transfer.encoding] += 1
+    self.requests += 1
+
+  def reset(self) -> None:
+    """Resets every counter."""
+    self.__recent.clear()
+    self.compressed_bytes = 0
+    self.decompressed_bytes = 0
+    self.encodings.clear()
+    self.requests = 0
+
+
+class HTTPTransport(Transport):
+  """
+  The default transport, which sends requests over the network. Connection failures and timeouts are raised as a :class:`.RequestError` without a status code.
+
+  Compressed responses are requested and transparently decompressed: gzip and deflate always, Brotli if ``brotli`` is installed, and Zstandard if ``backports.zstd`` is installed or on Python 3.14+. Install the ``compression`` extra for all of them.
+
+  :param stats: Where the size of each response is recorded. Defaults to :py:obj:`None` (creates a new one instead).
+  :type stats: :class:`.TransferStats` | :py:obj:`None`
+  """
+
+  __slots__: tuple[str, ...] = ('__stats',)
+
+  __stats: TransferStats
+
+  def __init__(self, *, stats: TransferStats | None = None):
+    self.__stats = TransferStats() if stats is None else stats
+
+  @property
+  def stats(self) -> TransferStats:
+    """The bandwidth used so far."""
+    return self.__stats
+
+  async def request(
+    self, session: 'ClientSession', url: str, headers: dict[str, str]
+  ) -> bytes:
+    try:
+      async with session.get(
+        url, headers={**headers, 'Accept-Encoding': _ACCEPT_ENCODING}
+      ) as resp:
+        try:
+          resp.raise_for_status()
+        except ClientResponseError:
+          raise RequestError(resp.status, resp.reason) from None
+
+        body = await resp.read()
+
+        # Older aiohttp versions don't count the bytes received before decompression.
+        compressed_bytes = getattr(resp.content, 'total_raw_bytes', None)
+
+        if compressed_bytes is None:  # pragma: nocover
+          compressed_bytes = int(resp.headers.get('Content-Length', len(body)))
+
+        self.__stats.record(
+          Transfer(
+            url, resp.headers.get('Content-Encoding'), compressed_bytes, len(body)
+          )
+        )
+
+        return body
+    except (ClientError, asyncio.TimeoutError) as err:
+      raise RequestError(None, str(err) or err.__class__.__name__) from err
+
+
+class RecordingTransport(Transport):
+  """
+  Records every successful response from another transport, and saves them into a gzip-compressed archive upon closing.
+
+  Example:
+
+  .. code-block:: python
+
+    transport = python_weather.RecordingTransport('responses.gz')
+
+    async with python_weather.Client(transport=transport) as client:
+      await client.get('New York')
+
+  :param path: The archive's file path.
+  :type path: :py:class:`str` | :py:class:`os.PathLike`
+  :param transport: The transport whose responses are recorded. Defaults to :py:obj:`None` (uses a new :class:`.HTTPTransport`).
+  :type transport: :class:`.Transport` | :py:obj:`None`
+  """
+
+  __slots__: tuple[str, ...] = ('__path', '__responses', '__transport')
+
+  __path: 'str | os.PathLike[str]'
+  __responses: dict[str, bytes]
+  __transport: Transport
+
+  def __init__(
+    self, path: 'str | os.PathLike[str]', transport: Transport | None = None
+  ):
+    self.__path = path
+    self.__responses = {}
+    self.__transport = HTTPTransport() if transport is None else transport
+
+  @property
+  def responses(self) -> dict[str, bytes]:
+    """The responses recorded so far, keyed by their request URL."""
+    return self.__responses
+
+  async def request(
+    self, session: 'ClientSession', url: str, headers: dict[str, str]
+  ) -> bytes:
+    body = await self.__transport.request(session, url, headers)
+    self.__responses[url] = body
+
+    return body
+
+  def save(self) -> None:
+    """
+    Saves the recorded responses into the archive.
+
+    :exception OSError: The archive could not be written.
+    """
+    save_archive(self.__path, self.__responses)
+
+  async def close(self) -> None:
+    """Saves the recorded responses and closes the wrapped transport."""
+    self.save()
+    await self.__transport.close()
+
+
+class ReplayTransport(Transport):
+  """
+  Serves previously recorded responses without touching the network, with optional synthetic latency and error injection for load testing.
+
+  Example:
+
+  .. code-block:: python
+
+    transport = python_weather.ReplayTransport(
+      'responses.gz', latency=0.05, error_rate=0.01
+    )
+
+    async with python_weather.Client(transport=transport) as client:
+      await client.get('New York')
+
+  :param responses: The archive's file path, or the raw response bodies keyed by their request URL.
+  :type responses: :py:class:`str` | :py:class:`os.PathLike` | :py:class:`~collections.abc.Mapping` [:py:class:`str`, :py:class:`bytes`]
+  :param latency: The base amount of seconds every response is delayed by. Defaults to ``0``.
+  :type latency: :py:class:`float`
+  :param jitter: The maximum amount of seconds randomly added on top of ``latency``. Defaults to ``0``.
+  :type jitter: :py:class:`float`
+  :param error_rate: The probability of a request failing with ``error_status``. Defaults to ``0``.
+  :type error_rate: :py:class:`float`
+  :param error_status: The status code of injected errors. Defaults to ``503``.
+  :type error_status: :py:class:`int`
+  :param seed: The random seed used for jitter and error injection. Defaults to :py:obj:`None`.
+  :type seed: :py:class:`int` | :py:obj:`None`
+
+  :exception ValueError: Any of the numeric arguments are out of range.
+  """
+
+  __slots__: tuple[str, ...] = (
+    '__error_rate',
+    '__error_status',
+    '__jitter',
+    '__latency',
+    '__random',
+    '__responses',
+  )
+
+  __error_rate: float
+  __error_status: int
+  __jitter: float
+  __latency: float
+  __random: Random
+  __responses: 'Mapping[str, bytes]'
+
+  def __init__(
+    self,
+    responses: 'str | os.PathLike[str] | Mapping[str, bytes]',
+    *,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    seed: int | None = None,
+  ):
+    if latency < 0 or jitter < 0:
+      raise ValueError('The latency and jitter must not be negative.')
+    elif not 0 <= error_rate <= 1:
+      raise ValueError('The error rate must be between 0 and 1.')
+
+    self.__responses = (
+      load_archive(responses)
+      if isinstance(responses, (str, os.PathLike))
+      else responses
+    )
+    self.__latency = latency
+    self.__jitter = jitter
+    self.__error_rate = error_rate
+    self.__error_status = error_status
+    self.__random = Random(seed)
+
+  async def request(
+    self, session: 'ClientSession', url: str, headers: dict[str, str]
+  ) -> bytes:
+    delay = self.__latency
+
+    if self.__jitter:
+      delay += self.__random.uniform(0.0, self.__jitter)
+
+    if delay:
+      await sleep(delay)
+
+    if self.__error_rate and self.__random.random() < self.__error_rate:
+      raise RequestError(self.__error_status, 'Injected Error')
+
+    try:
+      return self.__responses[url]
+    except KeyError:
+      raise RequestError(404, 'Not Recorded') from None
@@ -0,0 +1,141 @@
+from os import path
+import sys
+
+sys.path.insert(0, path.join(path.dirname(path.realpath(__file__)), '..'))
+
+
+from typing import TYPE_CHECKING
+import functools
+import runpy
+import json
+import csv
+import io
+import pytest
+
+if TYPE_CHECKING:
+  from pathlib import Path
+
+import python_weather
+from python_weather.cli import main
+
+from util import load_mock_response
+
+
+@pytest.fixture
+def replay(monkeypatch: pytest.MonkeyPatch) -> None:
+  body = json.dumps(load_mock_response('mock_response_1.json')).encode()
+  transport = python_weather.ReplayTransport(
+    {
+      'http://fake/new+york?format=j1': body,
+      'http://fake/london?format=j1': body,
+      'http://fake/paris?format=j2': body,
+    }
+  )
+
+  monkeypatch.setattr(
+    'python_weather.cli.Client',
+    functools.partial(python_weather.Client, transport=transport),
+  )
+
+
+@pytest.mark.usefixtures('replay')
+def test_main_writes_ndjson(
+  monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+  monkeypatch.setattr('sys.stdin', io.StringIO('New York\n\n  london \nnowhere\n'))
+
+  status = main(
+    [
+      '--base-url',
+      'http://fake',
+      '--retries',
+      '0',
+      '--concurrency',
+      '2',
+      '-u',
+      'imperial',
+    ]
+  )
+  records = {
+    record['query']: record
+    for record in map(json.loads, capsys.readouterr().out.splitlines())
+  }
+
+  assert status == 1
+  assert records.keys() == {'New York', 'london', 'nowhere'}
+  assert records['nowhere']['error'] == '404: Not Recorded'
+  assert len(records['london']['daily_forecasts']) == 1
+
+
+@pytest.mark.usefixtures('replay')
+@pytest.mark.parametrize('granularity, rows', (('hourly', 1), ('daily', 1)))
+def test_main_writes_csv(
+  tmp_path: 'Path', capsys: pytest.CaptureFixture, granularity: str, rows: int
+) -> None:
+  locations = tmp_path / 'locations.txt'
+  output = tmp_path / 'output.csv'
+
+  locations.write_text('New York\nnowhere\n')
+
+  status = main(
+    [
+      str(locations),
+      '-o',
+      str(output),
+      '-f',
+      'csv',
+      '--granularity',
+      granularity,
+      '--base-url',
+      'http://fake',
+      '--retries',
+      '0',
+      '--cache-dir',
+      str(tmp_path / 'cache'),
+      '--rate-limit',
+      '1000',
+    ]
+  )
+
+  with open(output, newline='', encoding='utf-8') as f:
+    header, *body = csv.reader(f)
+
+  assert status == 1
+  assert header[:2] == ['query', 'location']
+  assert len(body) == rows
+  assert capsys.readouterr().err == 'nowhere: 404: Not Recorded\n'
+
+
+@pytest.mark.usefixtures('replay')
+def test_main_fetches_current_conditions(
+  monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+  monkeypatch.setattr('sys.stdin', io.StringIO('Paris\n'))
+
+  assert main(['--current', '--base-url', 'http://fake']) == 0
+
+  record = json.loads(capsys.readouterr().out)
+
+  assert record['query'] == 'Paris'
+  assert 'daily_forecasts' not in record
+
+
+@pytest.mark.parametrize(
+  'argv', (['--concurrency', '0'], ['--current', '--format', 'csv'])
+)
+def test_main_throws_invalid_argument_error(argv: list[str]) -> None:
+  with pytest.raises(SystemExit):
+    main(argv)
+
+
+@pytest.mark.usefixtures('replay')
+def test_main_module_works(monkeypatch: pytest.MonkeyPatch) -> None:
+  monkeypatch.setattr('sys.stdin', io.StringIO('Paris\n'))
+  monkeypatch.setattr(
+    'sys.argv', ['python_weather', '--current', '--base-url', 'http://fake']
+  )
+
+  with pytest.raises(SystemExit) as err:
+    runpy.run_module('python_weather', run_name='__main__')
+
+  assert err.value.code == 0
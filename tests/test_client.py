@@ -5,14 +5,27 @@ sys.path.insert(0, path.join(path.dirname(path.realpath(__file__)), '..'))
 
 
 from typing import TYPE_CHECKING
+from aiohttp.test_utils import TestServer
 import pytest_asyncio
+import subprocess
+import asyncio
+import aiohttp
+import multiprocessing
+import marshal
+import pickle
+import json
+import gzip
+import time
 import pytest
 import mock
 
 if TYPE_CHECKING:
   from typing import Any, AsyncGenerator
+  from pathlib import Path
 
 import python_weather
+import python_weather.fakeserver
+from python_weather.fakeserver import create_app
 
 from util import _test_attributes, RequestMock
 
@@ -121,3 +134,1282 @@ async def test_Client_throws_request_error(
       await client.get('New York')
 
     assert request.call_count == (client._max_retries + 1)
+
+
+@pytest.mark.asyncio
+async def test_Client_normalizes_location(
+  monkeypatch: pytest.MonkeyPatch, client: python_weather.Client
+) -> None:
+  with RequestMock(200, 'OK', 'mock_response_2.json') as request:
+    monkeypatch.setattr('aiohttp.ClientSession.get', request)
+
+    await client.get('  New   York ')
+
+    assert request.call_args.args[0].endswith('/new+york?format=j1')
+    assert client.normalizer.key('new york') == client.normalizer.key('0.001,-0.004')
+
+
+@pytest.mark.asyncio
+async def test_Client_throws_invalid_location_error_if_blank(
+  client: python_weather.Client,
+) -> None:
+  with pytest.raises(ValueError, match='^The specified location must not be empty\\.$'):
+    await client.get(' \t ')
+
+
+@pytest.mark.parametrize(
+  'location,expected',
+  (
+    ('New York', 'new york'),
+    (' New \n York ', 'new york'),
+    ('40.7128,-74.0060', '40.71,-74.01'),
+    ('40.71 , -74.01', '40.71,-74.01'),
+    ('-0.001,0', '0.00,0.00'),
+  ),
+)
+def test_LocationNormalizer_works(location: str, expected: str) -> None:
+  normalizer = python_weather.LocationNormalizer()
+
+  _test_attributes(normalizer)
+
+  assert normalizer.normalize(location) == expected
+
+
+def test_LocationNormalizer_learns_aliases() -> None:
+  normalizer = python_weather.LocationNormalizer(grid=0.5, max_aliases=1)
+
+  assert normalizer.learn('Paris', (48.8566, 2.3522)) == '49.0,2.5'
+  assert normalizer.key('PARIS') == normalizer.key('48.9,2.4') == '49.0,2.5'
+
+  normalizer.learn('London', (51.5072, -0.1276))
+
+  assert len(normalizer) == 1
+  assert normalizer.key('paris') == 'paris'
+
+  normalizer.clear()
+
+  assert normalizer.key('london') == 'london'
+
+
+@pytest.mark.parametrize('kwargs', ({'grid': 0}, {'max_aliases': -1}))
+def test_LocationNormalizer_throws_invalid_argument_error(kwargs: dict) -> None:
+  with pytest.raises(python_weather.Error):
+    python_weather.LocationNormalizer(**kwargs)
+
+
+def test_SyncClient_works(monkeypatch: pytest.MonkeyPatch) -> None:
+  with RequestMock(200, 'OK', 'mock_response_1.json') as request:
+    monkeypatch.setattr('aiohttp.ClientSession.get', request)
+
+    with python_weather.SyncClient(unit=python_weather.IMPERIAL) as client:
+      _test_attributes(client)
+
+      client.unit = python_weather.METRIC
+      client.locale = python_weather.Locale.ENGLISH
+
+      assert isinstance(client.get('New York'), python_weather.Forecast)
+      assert isinstance(client.get('New York', timeout=5.0), python_weather.Forecast)
+      assert isinstance(client.get_current('New York'), python_weather.CurrentForecast)
+      assert request.call_count == 3
+
+    client.close()
+
+    with pytest.raises(
+      python_weather.Error, match='^Client session is already closed\\.$'
+    ):
+      client.get('New York')
+
+
+def test_SyncClient_throws_timeout_error(monkeypatch: pytest.MonkeyPatch) -> None:
+  async def slow_get(*_: 'Any', **__: 'Any') -> None:
+    await asyncio.sleep(5.0)
+
+  with python_weather.SyncClient() as client:
+    monkeypatch.setattr(python_weather.Client, 'get', slow_get)
+
+    with pytest.raises(TimeoutError):
+      client.get('New York', timeout=0.01)
+
+
+@pytest.mark.parametrize('kwargs', ({'session': None}, {'unit': None}))
+def test_SyncClient_throws_invalid_argument_error(kwargs: dict) -> None:
+  with pytest.raises(python_weather.Error):
+    python_weather.SyncClient(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_Client_parses_requested_fields(
+  monkeypatch: pytest.MonkeyPatch, client: python_weather.Client
+) -> None:
+  with RequestMock(200, 'OK', 'mock_response_1.json') as request:
+    monkeypatch.setattr('aiohttp.ClientSession.get', request)
+
+    weather = await client.get('New York', fields=('temperature',))
+
+    assert isinstance(weather.temperature, int)
+    assert weather.daily_forecasts == []
+
+
+@pytest.mark.asyncio
+async def test_Client_throws_invalid_field_error_before_requesting(
+  monkeypatch: pytest.MonkeyPatch, client: python_weather.Client
+) -> None:
+  with RequestMock(200, 'OK', 'mock_response_1.json') as request:
+    monkeypatch.setattr('aiohttp.ClientSession.get', request)
+
+    with pytest.raises(ValueError, match='^Unknown forecast field'):
+      await client.get('New York', fields=('nonexistent',))
+
+    request.assert_not_called()
+
+
+@pytest.mark.parametrize(
+  'mock_response_path', ('mock_response_1.json', 'mock_response_2.json')
+)
+@pytest.mark.asyncio
+async def test_Client_get_current_works(
+  monkeypatch: pytest.MonkeyPatch,
+  client: python_weather.Client,
+  mock_response_path: str,
+) -> None:
+  with RequestMock(200, 'OK', mock_response_path) as request:
+    monkeypatch.setattr('aiohttp.ClientSession.get', request)
+
+    weather = await client.get_current('New York')
+
+    _test_attributes(weather)
+
+    assert type(weather) is python_weather.CurrentForecast
+    assert request.call_args.args[0].endswith('?format=j2')
+
+
+@pytest.mark.asyncio
+async def test_Client_records_and_replays_responses(
+  monkeypatch: pytest.MonkeyPatch, tmp_path: 'Path'
+) -> None:
+  archive = tmp_path / 'responses.gz'
+
+  with RequestMock(200, 'OK', 'mock_response_1.json') as request:
+    monkeypatch.setattr('aiohttp.ClientSession.get', request)
+
+    transport = python_weather.RecordingTransport(archive)
+
+    async with python_weather.Client(transport=transport) as client:
+      recorded = await client.get('New York')
+
+    assert list(transport.responses) == [request.call_args.args[0]]
+
+  replay = python_weather.ReplayTransport(archive, latency=0.001, jitter=0.001, seed=0)
+
+  async with python_weather.Client(transport=replay) as client:
+    _test_attributes(replay)
+
+    replayed = await client.get('New York')
+
+  assert replayed.to_dict() == recorded.to_dict()
+
+
+@pytest.mark.asyncio
+async def test_ReplayTransport_injects_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+  monkeypatch.setattr('python_weather.client.sleep', mock.AsyncMock())
+
+  transport = python_weather.ReplayTransport({}, error_rate=1.0, error_status=500)
+
+  async with python_weather.Client(transport=transport, max_retries=1) as client:
+    with pytest.raises(python_weather.RequestError, match='^500: Injected Error$'):
+      await client.get('New York')
+
+  async with python_weather.Client(
+    transport=python_weather.ReplayTransport({}), max_retries=0
+  ) as client:
+    with pytest.raises(python_weather.RequestError, match='^404: Not Recorded$'):
+      await client.get('New York')
+
+
+@pytest.mark.parametrize(
+  'kwargs', ({'latency': -1.0}, {'jitter': -1.0}, {'error_rate': 1.5})
+)
+def test_ReplayTransport_throws_invalid_argument_error(kwargs: dict) -> None:
+  with pytest.raises(ValueError):
+    python_weather.ReplayTransport({}, **kwargs)
+
+
+@pytest.mark.parametrize('data', (b'\x00\x00', b'\x00\x00\x00\x01a\x00\x00\x00\x05b'))
+def test_load_archive_throws_corrupted_error(tmp_path: 'Path', data: bytes) -> None:
+  archive = tmp_path / 'responses.gz'
+
+  with gzip.open(archive, 'wb') as f:
+    f.write(data)
+
+  with pytest.raises(ValueError, match='is not a valid archive\\.$'):
+    python_weather.transport.load_archive(archive)
+
+
+@pytest.mark.asyncio
+async def test_Transport_is_abstract() -> None:
+  with pytest.raises(NotImplementedError):
+    await python_weather.Transport().request(mock.Mock(), '', {})
+
+
+@pytest.mark.parametrize(
+  'locale', (python_weather.Locale.ENGLISH, python_weather.Locale.FRENCH)
+)
+@pytest.mark.asyncio
+async def test_Client_works_with_fake_server(locale: python_weather.Locale) -> None:
+  async with TestServer(create_app(seed=0)) as server:
+    async with python_weather.Client(
+      base_url=str(server.make_url('/')), locale=locale
+    ) as client:
+      weather = await client.get('New York')
+
+      _test_attributes(weather)
+
+      assert len(weather) == 3
+      assert all(len(daily) == 8 for daily in weather)
+      assert weather.location == 'New York'
+
+      current = await client.get_current('40.7128,-74.0060')
+
+      assert current.coordinates == (40.71, -74.01)
+
+
+@pytest.mark.asyncio
+async def test_fake_server_injects_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+  monkeypatch.setattr('python_weather.client.sleep', mock.AsyncMock())
+
+  for kwargs, status, successes in (
+    ({'rate_429': 1.0}, 429, 0),
+    ({'rate_5xx': 1.0}, 503, 0),
+    ({'max_rps': 0.5, 'latency': 0.001, 'jitter': 0.001}, 429, 1),
+  ):
+    async with TestServer(create_app(**kwargs)) as server:
+      async with python_weather.Client(
+        base_url=str(server.make_url('/')), max_retries=1
+      ) as client:
+        for _ in range(successes):
+          await client.get('New York')
+
+        with pytest.raises(python_weather.RequestError) as err:
+          await client.get('New York')
+
+        assert err.value.status == status
+
+  async with TestServer(create_app()) as server:
+    async with aiohttp.ClientSession() as session:
+      async with session.get(server.make_url('/x?format=j3')) as resp:
+        assert resp.status == 400
+
+
+@pytest.mark.parametrize(
+  'kwargs', ({'latency': -1.0}, {'rate_429': 2.0}, {'rate_5xx': -1.0}, {'max_rps': 0})
+)
+def test_fake_server_throws_invalid_argument_error(kwargs: dict) -> None:
+  with pytest.raises(ValueError):
+    create_app(**kwargs)
+
+
+def test_fake_server_main_works(monkeypatch: pytest.MonkeyPatch) -> None:
+  run_app = mock.Mock()
+  monkeypatch.setattr('aiohttp.web.run_app', run_app)
+
+  python_weather.fakeserver.main(['--port', '9999', '--max-rps', '100', '--seed', '1'])
+
+  assert run_app.call_args.kwargs == {'host': '127.0.0.1', 'port': 9999}
+
+
+@pytest.mark.asyncio
+async def test_Client_fails_over_to_healthy_mirror(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  sleep = mock.AsyncMock()
+  monkeypatch.setattr('python_weather.client.sleep', sleep)
+
+  async with TestServer(create_app(rate_5xx=1.0)) as broken:
+    async with TestServer(create_app(seed=0)) as healthy:
+      pool = python_weather.MirrorPool(
+        (str(broken.make_url('/')), str(healthy.make_url('/')), 'http://127.0.0.1:1')
+      )
+
+      broken_mirror, healthy_mirror, unreachable_mirror = pool
+
+      # Make the failing mirrors look faster so that they're tried first.
+      pool.record_success(broken_mirror, 0.0)
+      pool.record_success(unreachable_mirror, 0.0)
+      pool.record_success(healthy_mirror, 1.0)
+
+      async with python_weather.Client(base_url=pool) as client:
+        assert client.mirrors is pool
+
+        for _ in range(3):
+          weather = await client.get('New York')
+
+          assert weather.location == 'New York'
+
+  sleep.assert_not_awaited()
+
+  assert healthy_mirror.requests == 4
+  assert healthy_mirror.latency < 1.0
+  assert healthy_mirror.failures == 0
+  assert broken_mirror.failures == 1 and not broken_mirror.healthy
+  assert unreachable_mirror.failures == 1 and not unreachable_mirror.healthy
+
+
+@pytest.mark.asyncio
+async def test_Client_throws_request_error_if_mirrors_are_unreachable(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  sleep = mock.AsyncMock()
+  monkeypatch.setattr('python_weather.client.sleep', sleep)
+
+  async with python_weather.Client(
+    base_url=['http://127.0.0.1:1/'], max_retries=1
+  ) as client:
+    with pytest.raises(python_weather.RequestError) as err:
+      await client.get('New York')
+
+    assert err.value.status is None
+    assert sleep.await_count == 1
+
+
+def test_MirrorPool_prefers_faster_mirrors() -> None:
+  pool = python_weather.MirrorPool(('http://a/', 'http://b'), smoothing=0.5)
+  slow, fast = pool
+
+  assert len(pool) == 2
+  assert slow.url == 'http://a'
+
+  pool.record_success(slow, 1.0)
+  pool.record_success(slow, 0.5)
+  pool.record_success(fast, 0.1)
+
+  assert slow.latency == 0.75
+  assert all(pool.select() is fast for _ in range(10))
+  assert pool.select((fast,)) is slow
+
+  pool.record_failure(fast)
+  pool.record_failure(slow)
+  pool.record_failure(slow)
+
+  assert not pool.has_healthy()
+  assert pool.select() is fast
+
+  pool.record_success(fast, 0.1)
+
+  assert fast.healthy and fast.failures == 0
+  assert repr(pool).startswith('<python_weather.mirrors.MirrorPool mirrors=(')
+
+
+@pytest.mark.parametrize(
+  'kwargs',
+  (
+    {'urls': ()},
+    {'urls': 'http://a', 'cooldown': -1.0},
+    {'urls': 'http://a', 'cooldown': 10.0, 'max_cooldown': 1.0},
+    {'urls': 'http://a', 'smoothing': 0.0},
+  ),
+)
+def test_MirrorPool_throws_invalid_argument_error(kwargs: dict) -> None:
+  with pytest.raises(ValueError):
+    python_weather.MirrorPool(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_Client_serves_cached_responses(
+  monkeypatch: pytest.MonkeyPatch, tmp_path: 'Path'
+) -> None:
+  monkeypatch.setattr('python_weather.client.sleep', mock.AsyncMock())
+
+  for cache in (
+    python_weather.MemoryCache(max_entries=1),
+    python_weather.DiskCache(tmp_path / 'cache'),
+  ):
+    async with TestServer(create_app(seed=0)) as server:
+      async with python_weather.Client(
+        base_url=str(server.make_url('/')), cache=cache
+      ) as client:
+        assert client.cache is cache
+
+        first = await client.get('40.7128,-74.0060')
+
+        await server.close()
+
+        # Equivalent queries are served from the cache without any request.
+        second = await client.get(' 40.71 , -74.01 ')
+
+        assert second.to_dict() == first.to_dict()
+
+        with pytest.raises(python_weather.RequestError):
+          await client.get('London')
+
+    cache.clear()
+
+    assert cache.get('j1:en:40.71,-74.01') is None
+
+
+def test_MemoryCache_evicts_least_recently_used_responses() -> None:
+  cache = python_weather.MemoryCache(max_entries=2)
+
+  cache.set('a', b'a')
+  cache.set('b', b'b')
+  cache.get('a')
+  cache.set('c', b'c')
+
+  assert len(cache) == 2
+  assert cache.get('a') == b'a'
+  assert cache.get('b') is None
+
+
+def test_Cache_expires_responses(tmp_path: 'Path') -> None:
+  for cache in (
+    python_weather.MemoryCache(ttl=0.0),
+    python_weather.DiskCache(tmp_path, ttl=0.0),
+  ):
+    cache.store('a', 0.0, b'stale')
+    cache.set('b', b'fresh')
+
+    assert cache.get('a') is None
+    assert cache.load('a') == (0.0, b'stale')
+    assert cache.get('b') in (b'fresh', None)
+    assert cache.ttl == 0.0
+    assert repr(cache).endswith('ttl=0.0>')
+
+  assert python_weather.DiskCache(tmp_path).directory == str(tmp_path)
+
+
+@pytest.mark.parametrize(
+  'cls, kwargs',
+  (
+    (python_weather.MemoryCache, {'ttl': -1.0}),
+    (python_weather.MemoryCache, {'max_entries': 0}),
+  ),
+)
+def test_Cache_throws_invalid_argument_error(cls: type, kwargs: dict) -> None:
+  with pytest.raises(ValueError):
+    cls(**kwargs)
+
+
+def test_Cache_is_abstract() -> None:
+  cache = python_weather.Cache()
+
+  for method, args in (('load', ('a',)), ('store', ('a', 0.0, b'')), ('clear', ())):
+    with pytest.raises(NotImplementedError):
+      getattr(cache, method)(*args)
+
+
+@pytest.mark.asyncio
+async def test_RateLimiter_spaces_out_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+  sleep = mock.AsyncMock()
+  monkeypatch.setattr('python_weather.limiter.sleep', sleep)
+
+  limiter = python_weather.RateLimiter(10.0, burst=2)
+
+  assert limiter.rate == 10.0
+  assert repr(limiter).endswith('rate=10.0 burst=2>')
+
+  for _ in range(4):
+    await limiter.acquire()
+
+  delays = [call.args[0] for call in sleep.await_args_list]
+
+  assert len(delays) == 2
+  assert delays[0] == pytest.approx(0.1, abs=0.01)
+  assert delays[1] == pytest.approx(0.2, abs=0.01)
+
+  async with python_weather.Client(
+    transport=python_weather.ReplayTransport({}), max_retries=0, rate_limit=limiter
+  ) as client:
+    with pytest.raises(python_weather.RequestError):
+      await client.get('New York')
+
+  assert sleep.await_count == 3
+
+
+@pytest.mark.parametrize('kwargs', ({'rate': 0.0}, {'rate': 1.0, 'burst': 0}))
+def test_RateLimiter_throws_invalid_argument_error(kwargs: dict) -> None:
+  with pytest.raises(ValueError):
+    python_weather.RateLimiter(**kwargs)
+
+
+def test_package_is_lazily_imported() -> None:
+  code = (
+    'import sys, python_weather; '
+    "assert 'aiohttp' not in sys.modules and 'python_weather.enums' not in sys.modules; "
+    'python_weather.Forecast; '
+    "assert 'aiohttp' not in sys.modules; "
+    'python_weather.Client; '
+    "assert 'aiohttp' in sys.modules"
+  )
+
+  subprocess.run(
+    [sys.executable, '-c', code],
+    check=True,
+    cwd=path.join(path.dirname(path.realpath(__file__)), '..'),
+  )
+
+  assert set(python_weather.__all__) <= set(dir(python_weather))
+  assert python_weather.__getattr__('fakeserver').create_app is create_app
+
+  with pytest.raises(AttributeError):
+    python_weather.nonexistent  # noqa: B018
+
+
+@pytest.mark.asyncio
+async def test_Client_serves_nearby_cached_forecasts(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  monkeypatch.setattr('python_weather.client.sleep', mock.AsyncMock())
+
+  cache = python_weather.MemoryCache()
+
+  async with TestServer(create_app(seed=0)) as server:
+    async with python_weather.Client(
+      base_url=str(server.make_url('/')), cache=cache, nearby_radius=1.0, max_retries=0
+    ) as client:
+      first = await client.get('40.7128,-74.0060')
+
+      await server.close()
+
+      # Around 400 meters away, in a different normalization grid cell.
+      nearby = await client.get('40.7160,-74.0080')
+
+      assert nearby.to_dict() == first.to_dict()
+
+      with pytest.raises(python_weather.RequestError):
+        await client.get('40.7300,-74.0060')
+
+      cache.clear()
+
+      with pytest.raises(python_weather.RequestError):
+        await client.get('40.7150,-74.0070')
+
+
+@pytest.mark.parametrize(
+  'kwargs', ({'nearby_radius': 1.0}, {'nearby_radius': -1.0, 'cache': None})
+)
+def test_Client_throws_invalid_nearby_radius_error(kwargs: dict) -> None:
+  if 'cache' in kwargs:
+    kwargs['cache'] = python_weather.MemoryCache()
+
+  with pytest.raises(ValueError):
+    python_weather.Client(session=mock.Mock(), **kwargs)
+
+
+def test_SpatialIndex_works() -> None:
+  index = python_weather.SpatialIndex()
+
+  index.add(40.71, -74.01, 'New York')
+  index.add(40.71, -74.01, 'Manhattan')
+  index.add(40.65, -73.95, 'Brooklyn')
+  index.add(51.51, -0.13, 'London')
+  index.add(-16.5, 179.99, 'Fiji')
+  index.add(89.99, 0.0, 'North Pole')
+
+  assert len(index) == 5
+  assert repr(index).endswith('cell_size=0.1 points=5>')
+
+  distance, *_, value = index.nearest(40.715, -74.005, 1.0)
+
+  assert value == 'Manhattan'
+  assert distance == pytest.approx(0.7, abs=0.01)
+  assert [match[3] for match in index.within(40.7, -74.0, 10.0)] == [
+    'Manhattan',
+    'Brooklyn',
+  ]
+  assert index.nearest(-16.5, -179.99, 5.0)[3] == 'Fiji'
+  assert index.nearest(89.99, 180.0, 5.0)[3] == 'North Pole'
+  assert index.nearest(0.0, 0.0, 100.0) is None
+
+  index.remove(40.71, -74.01)
+  index.remove(40.71, -74.01)
+  index.remove(0.0, 0.0)
+
+  assert index.nearest(40.715, -74.005, 1.0) is None
+  assert len(index) == 4
+
+  index.clear()
+
+  assert len(index) == 0
+  assert python_weather.spatial.distance(0.0, 0.0, 0.0, 180.0) == pytest.approx(
+    python_weather.spatial.EARTH_RADIUS * 3.141592653589793
+  )
+
+  with pytest.raises(ValueError):
+    python_weather.SpatialIndex(cell_size=0.0)
+
+
+class GatedTransport(python_weather.Transport):
+  __slots__: tuple[str, ...] = ('gate', 'urls')
+
+  def __init__(self):
+    self.gate = asyncio.Event()
+    self.urls = []
+
+  async def request(
+    self, session: aiohttp.ClientSession, url: str, headers: dict
+  ) -> bytes:
+    self.urls.append(url)
+    await self.gate.wait()
+
+    return json.dumps(python_weather.fakeserver.generate_payload('Tokyo')).encode()
+
+
+@pytest.mark.asyncio
+async def test_Scheduler_serves_by_priority() -> None:
+  scheduler = python_weather.Scheduler(1)
+  order = []
+
+  async def acquire(name: str, priority: int) -> None:
+    await scheduler.acquire(priority=priority)
+    order.append(name)
+
+  await scheduler.acquire()
+
+  tasks = [
+    asyncio.create_task(acquire(name, priority))
+    for name, priority in (('low', -1), ('first', 0), ('high', 5), ('second', 0))
+  ]
+  await asyncio.sleep(0)
+
+  assert scheduler.max_concurrency == 1
+  assert (scheduler.active, scheduler.waiting) == (1, 4)
+  assert repr(scheduler).endswith('max_concurrency=1 active=1>')
+
+  for _ in tasks:
+    scheduler.release()
+    await asyncio.sleep(0)
+
+  assert order == ['high', 'first', 'second', 'low']
+
+  scheduler.release()
+
+  assert (scheduler.active, scheduler.waiting) == (0, 0)
+
+  with pytest.raises(ValueError):
+    python_weather.Scheduler(0)
+
+
+@pytest.mark.asyncio
+async def test_Scheduler_drops_expired_waiters() -> None:
+  scheduler = python_weather.Scheduler(1)
+
+  await scheduler.acquire()
+
+  with pytest.raises(python_weather.DeadlineError):
+    await scheduler.acquire(deadline=time.monotonic() + 0.01)
+
+  with pytest.raises(python_weather.DeadlineError):
+    await scheduler.acquire(deadline=time.monotonic())
+
+  for handed_over in (False, True):
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+
+    if handed_over:
+      scheduler.release()
+
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+      await waiter
+
+  # The slot handed over to the cancelled waiter was released.
+
+  assert (scheduler.active, scheduler.waiting) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_Client_prioritizes_requests() -> None:
+  transport = GatedTransport()
+
+  async with python_weather.Client(
+    transport=transport, max_concurrency=1, base_url='http://fake'
+  ) as client:
+    assert client.scheduler.max_concurrency == 1
+
+    tasks = [
+      asyncio.create_task(client.get(location, priority=priority))
+      for location, priority in (('first', 0), ('refresh', -1), ('user', 1))
+    ]
+    await asyncio.sleep(0.01)
+
+    assert client.scheduler.waiting == 2
+
+    transport.gate.set()
+    await asyncio.gather(*tasks)
+
+  assert transport.urls == [
+    'http://fake/first?format=j1',
+    'http://fake/user?format=j1',
+    'http://fake/refresh?format=j1',
+  ]
+  assert client.scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_Client_fails_fast_past_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+  sleep = mock.AsyncMock()
+  monkeypatch.setattr('python_weather.client.sleep', sleep)
+
+  transport = GatedTransport()
+
+  async with python_weather.Client(transport=transport, max_concurrency=1) as client:
+    slow = asyncio.create_task(client.get('slow', deadline=0.05))
+    await asyncio.sleep(0)
+
+    with pytest.raises(python_weather.DeadlineError):
+      await client.get('queued', deadline=0.01)
+
+    with pytest.raises(python_weather.DeadlineError):
+      await slow
+
+    with pytest.raises(python_weather.DeadlineError):
+      await client.get_current('expired', deadline=0.0)
+
+  assert len(transport.urls) == 1
+  assert client.scheduler.active == 0
+
+  async with python_weather.Client(
+    transport=python_weather.ReplayTransport({}), max_retries=3
+  ) as client:
+    with pytest.raises(python_weather.DeadlineError) as err:
+      await client.get('New York', deadline=0.2)
+
+  assert isinstance(err.value.__cause__, python_weather.RequestError)
+  assert sleep.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_RateLimiter_fails_fast_past_deadline(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  sleep = mock.AsyncMock()
+  monkeypatch.setattr('python_weather.limiter.sleep', sleep)
+
+  limiter = python_weather.RateLimiter(1.0)
+
+  await limiter.acquire()
+
+  with pytest.raises(python_weather.DeadlineError):
+    await limiter.acquire(deadline=time.monotonic() + 0.5)
+
+  await limiter.acquire(deadline=time.monotonic() + 5.0)
+
+  # The failed call did not reserve a slot.
+  assert sleep.await_args.args[0] == pytest.approx(1.0, abs=0.05)
+
+
+class FailingTransport(python_weather.Transport):
+  __slots__: tuple[str, ...] = ('failing', 'urls')
+
+  def __init__(self):
+    self.failing = set()
+    self.urls = []
+
+  async def request(
+    self, session: aiohttp.ClientSession, url: str, headers: dict
+  ) -> bytes:
+    self.urls.append(url)
+
+    if any(url.startswith(prefix) for prefix in self.failing):
+      raise python_weather.RequestError(503, 'Service Unavailable')
+
+    return json.dumps(
+      python_weather.fakeserver.generate_payload('Tokyo', lang='fr')
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_CircuitBreaker_opens_and_probes() -> None:
+  breaker = python_weather.CircuitBreaker(threshold=2, cooldown=0.05)
+  not_found = python_weather.RequestError(404, 'Not Found')
+
+  assert (breaker.threshold, breaker.cooldown) == (2, 0.05)
+  assert repr(breaker).endswith('threshold=2 cooldown=0.05>')
+
+  breaker.record_failure('wttr.in')
+  breaker.record_failure('wttr.in', not_found)
+  breaker.record_failure('wttr.in')
+
+  assert breaker.state('wttr.in') == python_weather.breaker.CLOSED
+
+  breaker.record_failure('wttr.in', python_weather.RequestError(None, 'timeout'))
+
+  assert breaker.state('wttr.in') == python_weather.breaker.OPEN
+  assert not breaker.allow('wttr.in')
+  assert breaker.allow('fr.wttr.in')
+
+  await asyncio.sleep(0.06)
+
+  assert breaker.state('wttr.in') == python_weather.breaker.HALF_OPEN
+  assert breaker.allow('wttr.in')
+  assert not breaker.allow('wttr.in')
+
+  breaker.record_failure(
+    'wttr.in', python_weather.RequestError(429, 'Too Many Requests')
+  )
+
+  assert breaker.state('wttr.in') == python_weather.breaker.OPEN
+
+  await asyncio.sleep(0.06)
+
+  assert breaker.allow('wttr.in')
+
+  breaker.record_success('wttr.in')
+
+  assert breaker.state('wttr.in') == python_weather.breaker.CLOSED
+
+  breaker.record_failure('wttr.in')
+  breaker.record_failure('wttr.in')
+  breaker.reset()
+
+  assert breaker.allow('wttr.in')
+
+  for kwargs in ({'threshold': 0}, {'cooldown': 0.0}):
+    with pytest.raises(ValueError):
+      python_weather.CircuitBreaker(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_Client_serves_stale_data_while_circuit_is_open(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  sleep = mock.AsyncMock()
+  monkeypatch.setattr('python_weather.client.sleep', sleep)
+
+  transport = FailingTransport()
+  breaker = python_weather.CircuitBreaker(threshold=2)
+
+  async with python_weather.Client(
+    transport=transport,
+    max_retries=5,
+    cache=python_weather.MemoryCache(ttl=0.0),
+    circuit_breaker=breaker,
+  ) as client:
+    assert client.circuit_breaker is breaker
+
+    await client.get('Tokyo')
+
+    transport.failing.add('https://wttr.in')
+    weather = await client.get('Tokyo')
+
+    assert weather.location == 'Tokyo'
+    assert len(transport.urls) == 3
+    assert sleep.await_count == 1
+
+    await client.get('Tokyo')
+
+    with pytest.raises(python_weather.CircuitOpenError) as err:
+      await client.get('Paris')
+
+    assert err.value.host == 'wttr.in'
+    assert len(transport.urls) == 3
+
+    await client.get('Paris', locale=python_weather.Locale.FRENCH)
+
+  assert transport.urls[-1] == 'https://fr.wttr.in/paris?format=j1'
+
+
+@pytest.mark.asyncio
+async def test_Client_skips_mirrors_with_open_circuits() -> None:
+  transport = FailingTransport()
+  transport.failing.add('http://a')
+
+  async with python_weather.Client(
+    transport=transport,
+    base_url=python_weather.MirrorPool(('http://a', 'http://b'), cooldown=0.0),
+    circuit_breaker=python_weather.CircuitBreaker(threshold=1),
+  ) as client:
+    for _ in range(4):
+      await client.get('Tokyo')
+
+    assert sum(url.startswith('http://a') for url in transport.urls) == 1
+
+    transport.failing.add('http://b')
+
+    with pytest.raises(python_weather.CircuitOpenError) as err:
+      await client.get('Tokyo')
+
+  assert err.value.host in ('a', 'b')
+
+
+class SlowTransport(python_weather.Transport):
+  __slots__: tuple[str, ...] = ('cancelled', 'delays', 'urls')
+
+  def __init__(self, delays: dict[str, float | None]):
+    self.cancelled = []
+    self.delays = delays
+    self.urls = []
+
+  async def request(
+    self, session: aiohttp.ClientSession, url: str, headers: dict
+  ) -> bytes:
+    self.urls.append(url)
+    delay = self.delays.get(url.split('/')[2], 0.0)
+
+    try:
+      # Negative delays fail after sleeping.
+      if delay is None or delay < 0:
+        await asyncio.sleep(-(delay or 0.0))
+
+        raise python_weather.RequestError(503, 'Service Unavailable')
+
+      await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+      self.cancelled.append(url)
+      raise
+
+    return json.dumps(python_weather.fakeserver.generate_payload('Tokyo')).encode()
+
+
+def test_HedgePolicy_tracks_latency_percentile() -> None:
+  policy = python_weather.HedgePolicy(50.0, window=20, initial_delay=2.0)
+
+  assert policy.percentile == 50.0
+  assert policy.delay == 2.0
+
+  for latency in range(40):
+    policy.record(latency / 10)
+
+  assert policy.delay == pytest.approx(2.95)
+  assert repr(policy).endswith('percentile=50.0 delay=2.95>')
+  assert python_weather.HedgePolicy(min_delay=3.0).delay == 3.0
+
+  for kwargs in ({'percentile': 101.0}, {'window': 0}, {'min_delay': -1.0}):
+    with pytest.raises(ValueError):
+      python_weather.HedgePolicy(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_Client_hedges_slow_requests() -> None:
+  transport = SlowTransport({'a': 5.0})
+  policy = python_weather.HedgePolicy(initial_delay=0.01)
+
+  pool = python_weather.MirrorPool(('http://a', 'http://b'))
+  first, second = pool
+
+  # The slow mirror is always tried first.
+  pool.record_success(first, 0.0)
+  pool.record_success(second, 1.0)
+
+  async with python_weather.Client(
+    transport=transport, base_url=pool, hedging=policy
+  ) as client:
+    assert client.hedging is policy
+
+    for _ in range(4):
+      assert (await client.get('Tokyo')).location == 'Tokyo'
+
+    await asyncio.sleep(0)
+
+  assert transport.urls == ['http://a/tokyo?format=j1', 'http://b/tokyo?format=j1'] * 4
+  assert transport.cancelled == ['http://a/tokyo?format=j1'] * 4
+  assert first.latency == 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+  'delays,hedged',
+  (({'wttr.in': 0.05}, True), ({'wttr.in': 0.0}, False), ({'wttr.in': None}, True)),
+)
+async def test_Client_hedging_without_mirrors(
+  delays: dict, hedged: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  monkeypatch.setattr('python_weather.client.sleep', mock.AsyncMock())
+
+  transport = SlowTransport(delays)
+
+  async with python_weather.Client(
+    transport=transport,
+    max_retries=0,
+    hedging=python_weather.HedgePolicy(initial_delay=0.01),
+  ) as client:
+    for hedge in (True, False):
+      if delays['wttr.in'] is None:
+        with pytest.raises(python_weather.RequestError):
+          await client.get('Tokyo', hedge=hedge)
+      else:
+        await client.get('Tokyo', hedge=hedge)
+
+  assert len(transport.urls) == 2 + (hedged and delays['wttr.in'] is not None)
+
+
+@pytest.mark.asyncio
+async def test_Client_hedging_respects_limits() -> None:
+  transport = SlowTransport({'a': -0.05, 'b': None})
+  pool = python_weather.MirrorPool(('http://a', 'http://b'))
+  slow, fast = pool
+
+  pool.record_success(slow, 0.0)
+  pool.record_success(fast, 1.0)
+
+  async with python_weather.Client(
+    transport=transport,
+    base_url=pool,
+    max_retries=0,
+    rate_limit=python_weather.RateLimiter(1000.0, burst=2),
+    hedging=python_weather.HedgePolicy(initial_delay=0.01),
+  ) as client:
+    with pytest.raises(python_weather.RequestError):
+      await client.get('Tokyo')
+
+  assert transport.urls == ['http://a/tokyo?format=j1', 'http://b/tokyo?format=j1']
+
+  transport = SlowTransport({'wttr.in': None})
+
+  async with python_weather.Client(
+    transport=transport,
+    max_retries=0,
+    circuit_breaker=python_weather.CircuitBreaker(threshold=1, cooldown=0.03),
+    hedging=python_weather.HedgePolicy(initial_delay=0.01),
+  ) as client:
+    with pytest.raises(python_weather.CircuitOpenError):
+      await client.get('Tokyo')
+
+    await asyncio.sleep(0.04)
+    transport.delays['wttr.in'] = 0.05
+
+    # Only a single trial request is allowed while half-open.
+    await client.get('Tokyo')
+
+  assert len(transport.urls) == 2
+
+
+@pytest.mark.asyncio
+async def test_HTTPTransport_accounts_for_compression() -> None:
+  stats = python_weather.TransferStats(history=1)
+
+  assert stats.compression_ratio == 1.0
+
+  for compress in (True, False):
+    async with TestServer(create_app(seed=0, compress=compress)) as server:
+      async with python_weather.Client(
+        base_url=str(server.make_url('/')),
+        transport=python_weather.HTTPTransport(stats=stats),
+      ) as client:
+        assert client.transport.stats is stats
+
+        await client.get('New York')
+
+    (transfer,) = stats.recent
+
+    assert transfer.url.endswith('/new+york?format=j1')
+    assert repr(transfer).endswith(f'decompressed_bytes={transfer.decompressed_bytes}>')
+
+    if compress:
+      assert transfer.encoding is not None
+      assert transfer.compressed_bytes < transfer.decompressed_bytes / 4
+    else:
+      assert transfer.encoding is None
+      assert transfer.compressed_bytes == transfer.decompressed_bytes
+
+  assert stats.requests == 2
+  assert sum(stats.encodings.values()) == 2
+  assert stats.compression_ratio > 1.5
+  assert repr(stats).endswith(f'decompressed_bytes={stats.decompressed_bytes}>')
+  assert 'gzip' in python_weather.transport._ACCEPT_ENCODING
+
+  stats.reset()
+
+  assert (stats.requests, stats.compressed_bytes, stats.recent) == (0, 0, ())
+
+  with pytest.raises(ValueError):
+    python_weather.TransferStats(history=-1)
+
+
+@pytest.mark.parametrize(
+  'locale', (python_weather.Locale.ENGLISH, python_weather.Locale.FRENCH)
+)
+def test_compact_format_round_trips(locale: python_weather.Locale) -> None:
+  lang = None if locale == python_weather.Locale.ENGLISH else locale.value
+  payload = python_weather.fakeserver.generate_payload('10001', lang='fr')
+  raw = json.dumps(payload).encode()
+  packed = python_weather.compact.pack(payload, lang=lang)
+  unpacked = python_weather.compact.unpack(packed)
+
+  assert packed.startswith(python_weather.compact.MAGIC)
+  assert len(packed) < len(raw) * 0.75
+  assert json.loads(raw) == payload
+  assert ('lang_fr' in unpacked['current_condition'][0]) == (lang == 'fr')
+  assert isinstance(unpacked['current_condition'][0]['temp_C'], int)
+  assert isinstance(unpacked['nearest_area'][0]['latitude'], float)
+  assert unpacked['nearest_area'][0]['areaName'][0]['value'] == '10001'
+
+  for cls in (python_weather.Forecast, python_weather.CurrentForecast):
+    expected = cls(json.loads(raw), python_weather.METRIC, locale)
+    actual = cls(python_weather.compact.unpack(packed), python_weather.METRIC, locale)
+
+    assert python_weather.serialization.to_dict(
+      actual
+    ) == python_weather.serialization.to_dict(expected)
+
+
+@pytest.mark.parametrize(
+  'data',
+  (
+    b'{}',
+    python_weather.compact.MAGIC + b'\x00' + marshal.dumps({}),
+    python_weather.compact._HEADER + b'\xff',
+    python_weather.compact._HEADER + marshal.dumps([]),
+  ),
+)
+def test_compact_format_throws_invalid_data_error(data: bytes) -> None:
+  with pytest.raises(ValueError):
+    python_weather.compact.unpack(data)
+
+
+@pytest.mark.asyncio
+async def test_Client_stores_compact_cache_entries(
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  monkeypatch.setattr('python_weather.client.sleep', mock.AsyncMock())
+
+  transport = FailingTransport()
+  cache = python_weather.MemoryCache()
+
+  async with python_weather.Client(
+    transport=transport,
+    cache=cache,
+    compact_cache=True,
+    max_retries=0,
+    circuit_breaker=python_weather.CircuitBreaker(threshold=1),
+  ) as client:
+    expected = await client.get('Tokyo', locale=python_weather.Locale.FRENCH)
+    key = 'j1:fr:' + client.normalizer.key(client.normalizer.normalize('Tokyo'))
+
+    assert cache.get(key).startswith(python_weather.compact.MAGIC)
+
+    actual = await client.get('Tokyo', locale=python_weather.Locale.FRENCH)
+
+    assert len(transport.urls) == 1
+    assert python_weather.serialization.to_dict(
+      actual
+    ) == python_weather.serialization.to_dict(expected)
+
+    # Corrupted entries are fetched again, or skipped when serving stale data.
+    cache.set(key, python_weather.compact.MAGIC + b'corrupted')
+    await client.get('Tokyo', locale=python_weather.Locale.FRENCH)
+
+    assert len(transport.urls) == 2
+
+    cache.set(key, python_weather.compact.MAGIC + b'corrupted')
+    transport.failing.add('https://fr.wttr.in')
+
+    with pytest.raises(python_weather.CircuitOpenError):
+      await client.get('Tokyo', locale=python_weather.Locale.FRENCH)
+
+
+@pytest.mark.asyncio
+async def test_ShardedClient_works() -> None:
+  async with TestServer(create_app(seed=0, latency=0.01)) as server:
+    async with python_weather.ShardedClient(
+      workers=2, base_url=str(server.make_url('')), max_retries=0
+    ) as client:
+      locations = [f'City {i}' for i in range(16)]
+      forecasts = await asyncio.gather(
+        *(client.get(location) for location in locations)
+      )
+      current = await client.get_current('Tokyo', fields=('temperature',))
+
+      assert client.workers == 2
+      assert repr(client).endswith('workers=2>')
+      assert [forecast.location for forecast in forecasts] == locations
+      assert isinstance(current.temperature, int)
+      assert {client.shard(location) for location in locations} == {0, 1}
+      assert client.shard('City 0') == client.shard('  city 0 ')
+
+      with pytest.raises(ValueError):
+        await client.get('Tokyo', fields=('unknown',))
+
+      with pytest.raises(ValueError):
+        await client.get('')
+
+      # Replies to cancelled requests are dropped.
+      cancelled = asyncio.ensure_future(client.get('Kyoto'))
+      await asyncio.sleep(0)
+      cancelled.cancel()
+      await asyncio.sleep(0.5)
+
+      # A worker exiting fails its pending requests instead of leaving them hanging.
+      pending = asyncio.ensure_future(client.get('Osaka'))
+      await asyncio.sleep(0)
+
+      for process in multiprocessing.active_children():
+        if process.name == f'python_weather.ShardedClient-{client.shard("Osaka")}':
+          process.kill()
+
+      with pytest.raises(python_weather.Error):
+        await pending
+
+      with pytest.raises(python_weather.Error):
+        await client.get('Osaka')
+
+    with pytest.raises(python_weather.Error):
+      await client.get('Tokyo')
+
+    await client.close()
+
+
+def test_ShardedClient_throws_invalid_argument_error() -> None:
+  with pytest.raises(python_weather.Error):
+    python_weather.ShardedClient(session=None)
+
+  with pytest.raises(ValueError):
+    python_weather.ShardedClient(replicas=0)
+
+  with pytest.raises(ValueError):
+    python_weather.ShardedClient(workers=1, nearby_radius=1.0)
+
+
+@pytest.mark.asyncio
+async def test_ShardedClient_worker_sends_errors_back() -> None:
+  class LocalError(Exception):
+    pass
+
+  class BrokenClient:
+    async def get(self, location: str) -> None:
+      raise LocalError(location)
+
+  request_reader, request_writer = multiprocessing.Pipe(duplex=False)
+  reply_reader, reply_writer = multiprocessing.Pipe(duplex=False)
+  loop = asyncio.get_running_loop()
+
+  async with TestServer(create_app(rate_5xx=1.0)) as server:
+    worker = asyncio.ensure_future(
+      python_weather.sharded._serve(
+        request_reader,
+        reply_writer,
+        {'base_url': str(server.make_url('')), 'max_retries': 0},
+      )
+    )
+
+    assert await loop.run_in_executor(None, reply_reader.recv) == (None, True, None)
+
+    request_writer.send((1, 'get', 'Tokyo', {}))
+    request_id, ok, err = await loop.run_in_executor(None, reply_reader.recv)
+
+    assert (request_id, ok) == (1, False)
+    assert isinstance(err, python_weather.RequestError) and err.status == 503
+
+    request_writer.close()
+    await worker
+
+  # Errors which can't be pickled are replaced.
+  replies, reply_writer = multiprocessing.Pipe(duplex=False)
+  await python_weather.sharded._answer(BrokenClient(), reply_writer, 2, 'get', 'x', {})
+  request_id, ok, err = replies.recv()
+
+  assert (request_id, ok, type(err)) == (2, False, python_weather.Error)
+
+  replies, reply_writer = multiprocessing.Pipe(duplex=False)
+  await python_weather.sharded._serve(replies, reply_writer, {'nearby_radius': 1.0})
+
+  assert isinstance(replies.recv()[2], ValueError)
+
+
+def test_errors_can_be_pickled() -> None:
+  request_error = pickle.loads(pickle.dumps(python_weather.RequestError(503, 'x')))
+  circuit_open_error = pickle.loads(pickle.dumps(python_weather.CircuitOpenError('a')))
+
+  assert (request_error.status, request_error.reason) == (503, 'x')
+  assert circuit_open_error.host == 'a'
+  assert str(circuit_open_error) == str(python_weather.CircuitOpenError('a'))
@@ -4,6 +4,7 @@ import sys
 sys.path.insert(0, path.join(path.dirname(path.realpath(__file__)), '..'))
 
 
+import pickle
 import pytest
 
 import python_weather
@@ -106,3 +107,27 @@ def test_WindDirection_works(wind_direction_value: str, degrees: int) -> None:
 
   assert isinstance(degrees in wind_direction, bool)
   assert isinstance(wind_direction.emoji, str)
+
+
+def test_indexed_enums_are_not_shared() -> None:
+  north = python_weather.WindDirection._new('N', 5)
+  other_north = python_weather.WindDirection._new('N', 355)
+  heat_index = python_weather.HeatIndex._new(30, 86)
+  ultraviolet = python_weather.UltraViolet._new(3)
+
+  assert (north.degrees, other_north.degrees) == (5, 355)
+  assert north == other_north == python_weather.WindDirection.NORTH
+  assert hash(north) == hash(python_weather.WindDirection.NORTH)
+  assert north != python_weather.WindDirection.SOUTH
+  assert north is python_weather.WindDirection._new('N', 5)
+  assert heat_index.index == 86
+  assert ultraviolet.index == 3
+
+  for enum in (
+    north,
+    heat_index,
+    ultraviolet,
+    python_weather.WindDirection.NORTH,
+    python_weather.HeatIndex.CAUTION,
+  ):
+    assert pickle.loads(pickle.dumps(enum)) is enum
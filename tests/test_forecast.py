@@ -0,0 +1,533 @@
+from os import path
+import sys
+
+sys.path.insert(0, path.join(path.dirname(path.realpath(__file__)), '..'))
+
+
+from typing import TYPE_CHECKING
+from datetime import datetime, timedelta
+from random import Random
+import pytest
+import copy
+import json
+
+if TYPE_CHECKING:
+  from pathlib import Path
+
+import python_weather
+import python_weather.export
+import python_weather.resample
+from python_weather.fakeserver import generate_payload
+
+from util import _test_attributes, load_mock_response
+
+
+@pytest.mark.parametrize(
+  'fields',
+  (
+    ('temperature', 'kind', 'daily_forecasts[*].highest_temperature'),
+    ['daily_forecasts.hourly_forecasts.time', 'daily_forecasts'],
+    ('daily_forecasts', 'daily_forecasts.date'),
+    'location',
+  ),
+)
+def test_Forecast_parses_requested_fields(fields: 'tuple[str, ...] | str') -> None:
+  weather = python_weather.Forecast(
+    load_mock_response('mock_response_2.json'),
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+    fields,
+  )
+
+  print(repr(weather))
+
+  for daily in weather:
+    print(repr(daily))
+
+    for hourly in daily:
+      print(repr(hourly))
+
+
+def test_Forecast_skips_unrequested_fields() -> None:
+  weather = python_weather.Forecast(
+    load_mock_response('mock_response_1.json'),
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+    ('temperature', 'daily_forecasts.highest_temperature'),
+  )
+
+  assert isinstance(weather.temperature, int)
+  assert isinstance(weather.daily_forecasts[0].highest_temperature, int)
+  assert weather.daily_forecasts[0].hourly_forecasts == []
+
+  with pytest.raises(AttributeError):
+    weather.kind
+
+
+def test_Forecast_parses_everything_by_default() -> None:
+  _test_attributes(
+    python_weather.Forecast(
+      load_mock_response('mock_response_1.json'),
+      python_weather.IMPERIAL,
+      python_weather.Locale.ENGLISH,
+    )
+  )
+
+
+@pytest.mark.parametrize(
+  'fields,error',
+  (
+    (('nonexistent',), ValueError),
+    (('temperature.kind',), ValueError),
+    (('daily_forecasts.nonexistent',), ValueError),
+    ((1,), TypeError),
+  ),
+)
+def test_Forecast_throws_invalid_field_error(fields: tuple, error: type) -> None:
+  with pytest.raises(error):
+    python_weather.Forecast(
+      load_mock_response('mock_response_1.json'),
+      python_weather.METRIC,
+      python_weather.Locale.ENGLISH,
+      fields,
+    )
+
+
+@pytest.mark.parametrize('granularity', python_weather.export.GRANULARITIES)
+def test_Forecast_to_arrow_works(granularity: str) -> None:
+  pytest.importorskip('pyarrow')
+
+  weather = python_weather.Forecast(
+    load_mock_response('mock_response_2.json'),
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+  )
+  batch = weather.to_arrow(granularity)
+
+  assert batch.schema == python_weather.export.schema(granularity)
+  assert batch.num_rows == 1
+  assert batch.column('location').to_pylist() == [weather.location]
+
+
+@pytest.mark.parametrize('granularity', python_weather.export.GRANULARITIES)
+def test_write_parquet_works(tmp_path: 'Path', granularity: str) -> None:
+  pq = pytest.importorskip('pyarrow.parquet')
+
+  forecasts = (
+    python_weather.Forecast(
+      load_mock_response(f'mock_response_{(i % 2) + 1}.json'),
+      python_weather.METRIC,
+      python_weather.Locale.ENGLISH,
+    )
+    for i in range(5)
+  )
+  where = tmp_path / 'forecasts.parquet'
+
+  assert (
+    python_weather.export.write_parquet(
+      forecasts, where, granularity=granularity, batch_size=2
+    )
+    == 5
+  )
+  assert pq.read_table(where).num_rows == 5
+
+
+def test_export_throws_invalid_argument_error(tmp_path: 'Path') -> None:
+  pytest.importorskip('pyarrow')
+
+  with pytest.raises(ValueError):
+    python_weather.export.to_record_batch((), 'weekly')
+
+  with pytest.raises(ValueError):
+    python_weather.export.write_parquet((), tmp_path / 'empty.parquet', batch_size=0)
+
+
+@pytest.mark.parametrize(
+  'mock_response_path', ('mock_response_1.json', 'mock_response_2.json')
+)
+def test_Forecast_to_dict_works(mock_response_path: str) -> None:
+  weather = python_weather.Forecast(
+    load_mock_response(mock_response_path),
+    python_weather.IMPERIAL,
+    python_weather.Locale.ENGLISH,
+  )
+  data = weather.to_dict()
+
+  assert data['temperature'] == weather.temperature
+  assert data['kind'] == weather.kind.name
+  assert data['ultraviolet'] == {
+    'name': weather.ultraviolet.name,
+    'index': weather.ultraviolet.index,
+  }
+  assert data['datetime'] == weather.datetime.isoformat()
+  assert data['coordinates'] == list(weather.coordinates)
+  assert data['daily_forecasts'][0] == weather.daily_forecasts[0].to_dict()
+
+  hourly = data['daily_forecasts'][0]['hourly_forecasts'][0]
+
+  assert (
+    hourly['time'] == weather.daily_forecasts[0].hourly_forecasts[0].time.isoformat()
+  )
+  assert hourly['heat_index']['name'] == 'CAUTION'
+  assert json.loads(weather.to_json_bytes()) == data
+  assert (
+    json.loads(weather.daily_forecasts[0].to_json_bytes())
+    == (data['daily_forecasts'][0])
+  )
+
+
+def test_Forecast_to_dict_omits_unrequested_fields() -> None:
+  weather = python_weather.Forecast(
+    load_mock_response('mock_response_1.json'),
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+    ('temperature', 'daily_forecasts.date'),
+  )
+
+  assert weather.to_dict() == {
+    'temperature': weather.temperature,
+    'daily_forecasts': [{'date': '2025-10-25', 'hourly_forecasts': []}],
+  }
+
+
+@pytest.mark.parametrize(
+  'mock_response_path', ('mock_response_1.json', 'mock_response_2.json')
+)
+def test_Forecast_from_dict_works(mock_response_path: str) -> None:
+  weather = python_weather.Forecast(
+    load_mock_response(mock_response_path),
+    python_weather.IMPERIAL,
+    python_weather.Locale.ENGLISH,
+  )
+  rebuilt = python_weather.Forecast.from_dict(weather.to_dict())
+
+  _test_attributes(rebuilt)
+
+  assert rebuilt.to_dict() == weather.to_dict()
+  assert type(rebuilt.coordinates) is tuple
+  assert python_weather.forecast.DailyForecast.from_dict({}).hourly_forecasts == []
+  assert python_weather.CurrentForecast.from_dict({'temperature': 1}).temperature == 1
+
+
+def test_Forecast_diff_works() -> None:
+  previous_json = load_mock_response('mock_response_2.json')
+  current_json = copy.deepcopy(previous_json)
+
+  current_json['current_condition'][0]['temp_C'] = '30'
+  current_json['weather'][0]['hourly'][0]['chanceofrain'] = '99'
+  current_json['weather'][0]['hourly'].append(
+    {**current_json['weather'][0]['hourly'][0], 'time': '300'}
+  )
+  current_json['weather'].append({**previous_json['weather'][0], 'date': '2025-10-26'})
+  previous_json['weather'].append({**previous_json['weather'][0], 'date': '2025-10-24'})
+
+  previous, current = (
+    python_weather.Forecast(json, python_weather.METRIC, python_weather.Locale.ENGLISH)
+    for json in (previous_json, current_json)
+  )
+  patch = current.diff(previous)
+
+  assert patch['current'] == {'temperature': 30}
+  assert patch['daily']['2025-10-24'] is None
+  assert patch['daily']['2025-10-25'] == {
+    'hourly': {
+      '00:00:00': {'chances_of_rain': 99},
+      '03:00:00': current.daily_forecasts[0].hourly_forecasts[1].to_dict(),
+    }
+  }
+  assert len(patch['daily']['2025-10-26']['hourly']) == 1
+  assert json.loads(json.dumps(patch)) == patch
+
+  patched = previous.apply_patch(patch)
+
+  assert patched.to_dict() == current.to_dict()
+  assert [daily.date.isoformat() for daily in patched] == ['2025-10-25', '2025-10-26']
+  assert current.diff(current) == {}
+
+
+def generated_forecast(seed: int = 0) -> python_weather.Forecast:
+  return python_weather.Forecast(
+    generate_payload('Tokyo', rng=Random(seed), now=datetime(2026, 1, 1, 12)),
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+  )
+
+
+@pytest.mark.parametrize('method', python_weather.resample.METHODS)
+def test_Forecast_resample_works(method: str) -> None:
+  weather = generated_forecast()
+  hourly = [hourly for daily in weather for hourly in daily]
+  series = weather.resample(timedelta(minutes=15), method=method)
+
+  assert len(series['datetime']) == 3 * 24 * 4 - 11
+  assert series['datetime'][-1] == datetime(2026, 1, 3, 21)
+  assert set(series) == {
+    'datetime',
+    *python_weather.resample.NUMERIC_FIELDS,
+    *python_weather.resample.CATEGORICAL_FIELDS,
+  }
+
+  for i, original in enumerate(hourly):
+    assert series['temperature'][i * 12] == pytest.approx(original.temperature)
+    assert series['kind'][i * 12] is original.kind
+
+    if i < len(hourly) - 1:
+      assert series['kind'][i * 12 + 11] is original.kind
+
+  # Neither method overshoots the original slots.
+  for i in range(len(hourly) - 1):
+    low, high = sorted((hourly[i].humidity, hourly[i + 1].humidity))
+
+    assert all(
+      low - 1e-9 <= value <= high + 1e-9
+      for value in series['humidity'][i * 12 : i * 12 + 13]
+    )
+
+
+def test_resample_many_works() -> None:
+  forecasts = [generated_forecast(seed) for seed in range(3)]
+  batch = python_weather.resample.resample_many(
+    forecasts, method='cubic', fields=('temperature', 'kind')
+  )
+
+  assert batch == [
+    python_weather.resample.resample(
+      weather, method='cubic', fields=['temperature', 'kind']
+    )
+    for weather in forecasts
+  ]
+  assert all(len(series['temperature']) == 70 for series in batch)
+
+
+def test_resample_handles_few_slots() -> None:
+  weather = python_weather.Forecast(
+    load_mock_response('mock_response_1.json'),
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+  )
+
+  for method in python_weather.resample.METHODS:
+    series = weather.resample(method=method, fields=('temperature',))
+
+    assert series['temperature'] == [
+      float(weather.daily_forecasts[0].hourly_forecasts[0].temperature)
+    ]
+
+  weather.daily_forecasts.clear()
+
+  assert weather.resample(fields=('kind',)) == {'datetime': [], 'kind': []}
+
+
+@pytest.mark.parametrize(
+  'kwargs',
+  (
+    {'method': 'quadratic'},
+    {'step': timedelta(0)},
+    {'fields': ('location',)},
+  ),
+)
+def test_resample_throws_invalid_argument_error(kwargs: dict) -> None:
+  with pytest.raises(ValueError):
+    generated_forecast().resample(**kwargs)
+
+
+def test_Forecast_at_works() -> None:
+  weather = generated_forecast()
+  first, second = weather.daily_forecasts[1].hourly_forecasts[2:4]
+
+  assert weather.at(datetime(2026, 1, 2, 6)) is first
+  assert weather.at(datetime(2026, 1, 2, 7, 29)) is first
+  assert weather.at(datetime(2026, 1, 2, 7, 31)) is second
+  assert (
+    weather.at(datetime(2025, 12, 31)) is weather.daily_forecasts[0].hourly_forecasts[0]
+  )
+  assert (
+    weather.at(datetime(2026, 1, 4)) is weather.daily_forecasts[-1].hourly_forecasts[-1]
+  )
+
+  interpolated = weather.at(datetime(2026, 1, 2, 8), interpolate=True)
+  expected = weather.resample(fields=('humidity', 'precipitation', 'kind'))
+  position = expected['datetime'].index(datetime(2026, 1, 2, 8))
+
+  assert interpolated.time.hour == 8
+  assert interpolated.humidity == round(expected['humidity'][position])
+  assert interpolated.precipitation == pytest.approx(
+    expected['precipitation'][position]
+  )
+  assert interpolated.kind is first.kind
+  assert first.time.hour == 6
+
+  assert weather.at(datetime(2026, 1, 2, 6), interpolate=True) is first
+
+
+def test_Forecast_at_uses_rebuilt_index() -> None:
+  weather = python_weather.Forecast.from_dict(generated_forecast().to_dict())
+  last = weather.daily_forecasts.pop()
+
+  assert (
+    weather.at(datetime(2026, 1, 4)) is weather.daily_forecasts[-1].hourly_forecasts[-1]
+  )
+
+  weather.daily_forecasts.append(last)
+  weather.reindex()
+
+  assert weather.at(datetime(2026, 1, 4)) is last.hourly_forecasts[-1]
+
+  weather.daily_forecasts.clear()
+  weather.reindex()
+
+  with pytest.raises(ValueError):
+    weather.at(datetime(2026, 1, 2))
+
+
+def generated_forecast_set() -> python_weather.ForecastSet:
+  forecasts = []
+
+  for seed, (country, region) in enumerate(
+    (('Japan', 'Tokyo'), ('Japan', 'Osaka'), ('France', 'Paris'))
+  ):
+    payload = generate_payload(region, rng=Random(seed), now=datetime(2026, 1, 1, 12))
+    payload['nearest_area'][0]['country'][0]['value'] = country
+    payload['nearest_area'][0]['region'][0]['value'] = region
+
+    forecasts.append(
+      python_weather.Forecast(
+        payload, python_weather.METRIC, python_weather.Locale.ENGLISH
+      )
+    )
+
+  return python_weather.ForecastSet(forecasts)
+
+
+def test_ForecastSet_aggregations_work() -> None:
+  forecasts = generated_forecast_set()
+  japan = [forecast for forecast in forecasts if forecast.country == 'Japan']
+  hourly = [hourly for forecast in japan for daily in forecast for hourly in daily]
+
+  assert len(forecasts) == 3
+  assert repr(forecasts).endswith('forecasts=3>')
+  assert forecasts.forecasts == tuple(forecasts)
+  assert set(forecasts.max_temperature()) == {'Japan', 'France'}
+  assert forecasts.max_temperature()['Japan'] == max(
+    daily.highest_temperature for forecast in japan for daily in forecast
+  )
+  assert forecasts.total_precipitation()['Japan'] == pytest.approx(
+    sum(hourly.precipitation for hourly in hourly)
+  )
+  assert forecasts.aggregate('temperature', 'mean', level='current')[
+    'Japan'
+  ] == pytest.approx((japan[0].temperature + japan[1].temperature) / 2)
+  assert forecasts.aggregate('humidity', 'count', by=None) == {None: 3 * 3 * 8}
+  assert set(forecasts.aggregate('humidity', 'max', by=('country', 'region'))) == {
+    ('Japan', 'Tokyo'),
+    ('Japan', 'Osaka'),
+    ('France', 'Paris'),
+  }
+  assert forecasts.aggregate(
+    'temperature', min, by=lambda forecast: forecast.region[0], level='daily'
+  ).keys() == {'T', 'O', 'P'}
+
+  chances = sorted(hourly.chances_of_rain for hourly in hourly)
+  low, median, high = forecasts.percentile('chances_of_rain', (0, 50, 100))['Japan']
+
+  assert (low, high) == (chances[0], chances[-1])
+  assert median == pytest.approx((chances[23] + chances[24]) / 2)
+  assert forecasts.percentile('chances_of_rain', 100, by=None) == {
+    None: max(forecasts.column('chances_of_rain'))
+  }
+
+  kinds = forecasts.count('kind')['Japan']
+  bands = forecasts.count('ultraviolet', level='current')
+
+  assert sum(kinds.values()) == len(hourly)
+  assert kinds[hourly[0].kind.name] >= 1
+  assert sum(bands['Japan'].values()) == 2
+  assert forecasts.count('description', level='current')['France'] == {
+    forecasts.forecasts[2].description: 1
+  }
+  assert forecasts.column('temperature') is forecasts.column('temperature')
+
+
+@pytest.mark.parametrize(
+  'method,args',
+  (
+    ('aggregate', ('temperature', 'mode')),
+    ('aggregate', ('temperature', 'max')),
+    ('percentile', ('chances_of_rain', 101)),
+    ('percentile', ('chances_of_rain', (50, -1))),
+  ),
+)
+def test_ForecastSet_throws_invalid_argument_error(method: str, args: tuple) -> None:
+  forecasts = generated_forecast_set()
+  kwargs = {'level': 'weekly'} if args[1] == 'max' else {}
+
+  with pytest.raises(ValueError):
+    getattr(forecasts, method)(*args, **kwargs)
+
+
+@pytest.mark.parametrize('max_workers', (None, 1, 4))
+def test_Forecast_parse_many_works(max_workers: 'int | None') -> None:
+  payloads = [
+    generate_payload(f'City {seed}', rng=Random(seed), now=datetime(2026, 1, 1, 12))
+    for seed in range(12)
+  ]
+  expected = [
+    python_weather.Forecast(
+      copy.deepcopy(payload), python_weather.METRIC, python_weather.Locale.ENGLISH
+    ).to_dict()
+    for payload in payloads
+  ]
+  bodies = [
+    python_weather.compact.pack(payload) if i % 2 else json.dumps(payload).encode()
+    for i, payload in enumerate(payloads)
+  ]
+  bodies[-1] = payloads[-1]
+
+  forecasts = python_weather.Forecast.parse_many(
+    bodies,
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+    max_workers=max_workers,
+  )
+
+  assert [forecast.to_dict() for forecast in forecasts] == expected
+
+  projected = python_weather.Forecast.parse_many(
+    [json.dumps(payloads[0]).encode()],
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+    fields=('temperature',),
+    max_workers=max_workers,
+  )
+
+  assert projected[0].temperature == expected[0]['temperature']
+  assert not hasattr(projected[0], 'country')
+
+
+def test_Forecast_parse_many_throws_invalid_argument_error() -> None:
+  with pytest.raises(ValueError):
+    python_weather.Forecast.parse_many(
+      [], python_weather.METRIC, python_weather.Locale.ENGLISH, max_workers=0
+    )
+
+
+def test_Forecast_parsing_keeps_enums_per_forecast() -> None:
+  forecasts = python_weather.Forecast.parse_many(
+    [
+      generate_payload('Tokyo', rng=Random(seed), now=datetime(2026, 1, 1, 12))
+      for seed in range(32)
+    ],
+    python_weather.METRIC,
+    python_weather.Locale.ENGLISH,
+    max_workers=8,
+  )
+  hourly = [hourly for forecast in forecasts for daily in forecast for hourly in daily]
+
+  assert len({h.wind_direction.degrees for h in hourly}) > 1
+  assert all(int(h.wind_direction) in h.wind_direction for h in hourly)
+  assert all(
+    h.wind_direction == python_weather.WindDirection(h.wind_direction.value)
+    for h in hourly
+  )
+  assert not hasattr(python_weather.WindDirection.NORTH, 'degrees')
+  assert not hasattr(python_weather.HeatIndex.CAUTION, 'index')
@@ -100,6 +100,11 @@ def _test_attributes_inner(obj: object, indent_level: int) -> None:
       print(f'{" " * indent_level}{obj.__class__.__name__}.__iter__ -> {obj_iter()!r}')
 
 
+def load_mock_response(name: str) -> dict:
+  with open(path.join(CURRENT_DIR, name), 'r') as f:
+    return json.load(f)
+
+
 def _test_attributes(obj: object) -> None:
   print(f'{obj!r} -> ')
   _test_attributes_inner(obj, INDENTATION)
@@ -124,9 +129,12 @@ class RequestMock:
 
     if mock_response is not None:
       self.__mock_json_response = open(path.join(CURRENT_DIR, mock_response), 'r')
-      self.__mock_response.json = mock.AsyncMock(
-        return_value=json.loads(self.__mock_json_response.read())
-      )
+      raw_response = self.__mock_json_response.read()
+
+      self.__mock_response.json = mock.AsyncMock(return_value=json.loads(raw_response))
+      self.__mock_response.read = mock.AsyncMock(return_value=raw_response.encode())
+      self.__mock_response.headers = {}
+      self.__mock_response.content.total_raw_bytes = len(raw_response.encode())
 
     raise_for_status_kwargs = {}
 